@@ -15,7 +15,7 @@ import pandas as pd
 import psutil
 import seaborn as sns
 from openvino import AsyncInferQueue, CompiledModel, InferRequest, ProfilingInfo, properties
-from openvino_tokenizers import convert_tokenizer
+from openvino_tokenizers import convert_tokenizer, encode_bucketed
 from tqdm.auto import tqdm
 from transformers import AutoTokenizer, PreTrainedTokenizerBase
 from transformers import __version__ as transformers_version
@@ -76,6 +76,25 @@ def benchmark_tokenizer_async(
     return results, len(prompts) / elapsed, iterations / elapsed
 
 
+def benchmark_bucketing(ov_tokenizer: CompiledModel, dataset: list[tuple[str, str]], batch: int = 1) -> dict[str, Any]:
+    prompts = list(chain.from_iterable(dataset))
+    start = perf_counter()
+    encoding = encode_bucketed(ov_tokenizer, prompts, batch_size=batch)
+    elapsed = perf_counter() - start
+    stats = encoding.stats
+
+    print("Padding, tokens:")
+    print(
+        f"Input order batches: {stats.unbucketed_padded_tokens} padded tokens, "
+        f"{stats.unbucketed_padding_ratio:.2%} padding; "
+        f"length buckets: {stats.padded_tokens} padded tokens, {stats.padding_ratio:.2%} padding; "
+        f"real tokens: {stats.num_tokens}"
+    )
+    prompt_fps = len(prompts) / elapsed
+    print(f"Bucketing saved {stats.saved_ratio:.2%} of the padded tokens, bucketed OV: {prompt_fps:.3f} prompts/s")
+    return {**stats.to_dict(), "ov_prompts_per_sec": prompt_fps}
+
+
 def construct_pc_series(perf_counts: list[ProfilingInfo], stats: dict[str, Any]) -> dict[str, Any]:
     for pi in perf_counts:
         if pi.status == pi.NOT_RUN:
@@ -288,6 +307,7 @@ def main(
     tput: bool = False,
     converted_tokenizer: Optional[str] = None,
     output_dir: str = ".",
+    bucketing: bool = False,
 ) -> None:
     output_dir_path = Path(output_dir)
     output_dir_path.mkdir(parents=True, exist_ok=True)
@@ -340,6 +360,8 @@ def main(
         "performance_hint": "THROUGHPUT" if tput else "LATENCY",
         **stats,
     }
+    if bucketing:
+        metadata["bucketing"] = benchmark_bucketing(ov_tokenizer, dataset, batch)
     with open(output_dir_path / f"benchmark_metadata_{model_name}.json", "w", encoding="utf-8") as f:
         json.dump(metadata, f, indent=2)
 
@@ -406,6 +428,12 @@ if __name__ == "__main__":
         action="store_true",
         help="Use THROUGHPUT performance hint.",
     )
+    parser.add_argument(
+        "--bucketing",
+        required=False,
+        action="store_true",
+        help="Compare padded token counts of the batches in the input order and the batches bucketed by length.",
+    )
     parser.add_argument(
         "-b",
         "--batch",
@@ -445,4 +473,5 @@ if __name__ == "__main__":
         tput=args.tput,
         converted_tokenizer=args.converted_tokenizer,
         output_dir=args.output_dir,
+        bucketing=args.bucketing,
     )
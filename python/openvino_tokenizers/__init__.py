@@ -2,6 +2,7 @@
 # Copyright (C) 2018-2026 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
 import functools
+import importlib
 import logging
 import os
 import site
@@ -9,7 +10,7 @@ import sys
 from collections.abc import Callable
 from itertools import chain
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, Union
 
 import openvino
 from openvino.utils.node_factory import NodeFactory
@@ -33,26 +34,29 @@ elif sys.platform == "linux":
 else:
     sys.exit(f"Error: extension does not support the platform {sys.platform}")
 
-# when the path to the extension set manually
-_extension_path = os.environ.get("OV_TOKENIZER_PREBUILD_EXTENSION_PATH")
-_openvino_dir = os.environ.get("OpenVINO_DIR")
-if _extension_path and Path(_extension_path).is_file():
+
+@functools.lru_cache(1)
+def _get_extension_path() -> Union[Path, str]:
     # when the path to the extension set manually
-    _ext_path = Path(_extension_path)
-else:
-    _openvino_path = []
-    if _openvino_dir:
+    extension_path = os.environ.get("OV_TOKENIZER_PREBUILD_EXTENSION_PATH")
+    if extension_path and Path(extension_path).is_file():
+        logger.debug(f"OpenVINO Tokenizers extension path: {extension_path}")
+        return Path(extension_path)
+
+    openvino_dir = os.environ.get("OpenVINO_DIR")
+    openvino_path = []
+    if openvino_dir:
         try:
             # extension binary from OpenVINO installation dir has higher priority
-            _system_type = next((Path(_openvino_dir).parent / "lib").iterdir(), Path()).name
-            _openvino_path = [Path(_openvino_dir).parent / "lib" / _system_type / _bin_dir]
+            system_type = next((Path(openvino_dir).parent / "lib").iterdir(), Path()).name
+            openvino_path = [Path(openvino_dir).parent / "lib" / system_type / _bin_dir]
         except FileNotFoundError:
-            logger.debug(f"Skip OpenVINO_DIR because is not OpenVINO installation path: {_openvino_dir}")
+            logger.debug(f"Skip OpenVINO_DIR because is not OpenVINO installation path: {openvino_dir}")
 
     site_packages = chain(
-        _openvino_path, (Path(__file__).parent.parent,), site.getusersitepackages(), site.getsitepackages()
+        openvino_path, (Path(__file__).parent.parent,), site.getusersitepackages(), site.getsitepackages()
     )
-    _ext_path = next(
+    ext_path = next(
         (
             ext
             for site_package in map(Path, site_packages)
@@ -60,12 +64,10 @@ else:
         ),
         _ext_name,  # Case when the library can be found in the PATH/LD_LIBRAY_PATH
     )
+    logger.debug(f"OpenVINO Tokenizers extension path: {ext_path}")
+    return ext_path
 
-logger.debug(f"OpenVINO Tokenizers extension path: {_ext_path}")
 
-del _ext_name
-
-is_openvino_tokenizers_compatible = True
 _compatibility_message = (
     "OpenVINO and OpenVINO Tokenizers versions are not binary compatible.\n"
     f"OpenVINO version:            {openvino.get_version()}\n"
@@ -79,42 +81,45 @@ _compatibility_message = (
 )
 
 
+# patching openvino
+old_core_init = openvino.Core.__init__
+old_factory_init = openvino.utils.node_factory.NodeFactory.__init__
+old_fe_init = openvino.frontend.frontend.FrontEnd.__init__
+
+
 @functools.lru_cache(1)
-def _check_openvino_binary_compatibility() -> None:
-    global is_openvino_tokenizers_compatible, _compatibility_message
-    _core = openvino.Core()
+def _check_openvino_binary_compatibility() -> bool:
+    # the extension is loaded on the first use, not on the import
+    global is_openvino_tokenizers_compatible
+    _core = openvino.Core.__new__(openvino.Core)
+    old_core_init(_core)  # the patched constructor calls this function
     try:
-        _core.add_extension(str(_ext_path))
+        _core.add_extension(str(_get_extension_path()))
         is_openvino_tokenizers_compatible = True
     except RuntimeError:
         is_openvino_tokenizers_compatible = False
         logger.warning(_compatibility_message)
-
-
-_check_openvino_binary_compatibility()
-
-# patching openvino
-old_core_init = openvino.Core.__init__
-old_factory_init = openvino.utils.node_factory.NodeFactory.__init__
-old_fe_init = openvino.frontend.frontend.FrontEnd.__init__
+    return is_openvino_tokenizers_compatible
 
 
 @functools.wraps(old_core_init)
 def new_core_init(self, *args, **kwargs):
     old_core_init(self, *args, **kwargs)
-    self.add_extension(str(_ext_path))  # Core.add_extension doesn't support Path object
+    if _check_openvino_binary_compatibility():
+        self.add_extension(str(_get_extension_path()))  # Core.add_extension doesn't support Path object
 
 
 @functools.wraps(old_factory_init)
 def new_factory_init(self, *args, **kwargs):
     old_factory_init(self, *args, **kwargs)
-    self.add_extension(_ext_path)
+    self.add_extension(_get_extension_path())
 
 
 @functools.wraps(old_fe_init)
 def new_fe_init(self, *args, **kwargs):
     old_fe_init(self, *args, **kwargs)
-    self.add_extension(str(_ext_path))
+    if _check_openvino_binary_compatibility():
+        self.add_extension(str(_get_extension_path()))
 
 
 def get_create_wrapper(old_create: Callable) -> Callable:
@@ -130,9 +135,8 @@ def get_create_wrapper(old_create: Callable) -> Callable:
     return new_create
 
 
-if is_openvino_tokenizers_compatible:
-    openvino.Core.__init__ = new_core_init
-    openvino.frontend.frontend.FrontEnd.__init__ = new_fe_init
+openvino.Core.__init__ = new_core_init
+openvino.frontend.frontend.FrontEnd.__init__ = new_fe_init
 
 
 def _get_factory_callable() -> Callable[[], NodeFactory]:
@@ -141,7 +145,7 @@ def _get_factory_callable() -> Callable[[], NodeFactory]:
     def inner(opset_version: Optional[str] = None) -> NodeFactory:
         nonlocal factory
         if opset_version not in factory:
-            if is_openvino_tokenizers_compatible:
+            if _check_openvino_binary_compatibility():
                 openvino.utils.node_factory.NodeFactory.__init__ = new_factory_init
             factory[opset_version] = NodeFactory() if opset_version is None else NodeFactory(opset_version)
             if opset_version is None:
@@ -170,7 +174,32 @@ def _get_opset_factory_callable() -> Callable[[], NodeFactory]:
 _get_factory = _get_factory_callable()
 _get_opset_factory = _get_opset_factory_callable()
 
+
+# the modules of the public names that are imported on the first use
+_lazy_attributes = {
+    "build_rwkv_tokenizer": ".build_tokenizer",
+    "encode_bucketed": ".bucketing",
+    "EncodingCache": ".encoding_cache",
+    "TokenizerRuntime": ".runtime",
+    "read_tokenizers_with_shared_weights": ".shared_weights",
+    "save_tokenizers_with_shared_weights": ".shared_weights",
+    "encode_stream": ".streaming",
+}
+
+
+def __getattr__(name: str) -> Any:
+    # the extension and the heavy modules are loaded on the first use to keep the import cheap
+    if name == "is_openvino_tokenizers_compatible":
+        return _check_openvino_binary_compatibility()
+    if name == "_ext_path":
+        return _get_extension_path()
+    if name in _lazy_attributes:
+        value = getattr(importlib.import_module(_lazy_attributes[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # some files uses _get_factory function
-from .build_tokenizer import build_rwkv_tokenizer  # noqa
-from .convert_tokenizer import convert_tokenizer  # noqa
+from .convert_tokenizer import convert_gguf_tokenizer, convert_tokenizer, convert_tokenizer_json  # noqa
 from .utils import add_greedy_decoding, connect_models  # noqa
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Optional, Union
+
+import numpy as np
+from openvino import CompiledModel
+
+from .constants import ATTENTION_MASK_INPUT_NAME, ROW_OFFSETS_OUTPUT_NAME, TOKEN_COUNT_OUTPUT_NAME
+from .runtime import TokenizerRuntime, prepare_string_inputs, split_rows
+
+
+def utf8_length(text: str) -> int:
+    return len(text.encode("utf-8"))
+
+
+def get_buckets(lengths: Sequence[float], batch_size: int) -> list[np.ndarray]:
+    """Splits the indices of the texts sorted by the length into buckets of `batch_size` texts.
+
+    The sort is stable, so the texts of the same length keep their relative order.
+
+    :param lengths: The estimated lengths of the texts.
+    :type lengths: Sequence[float]
+    :param batch_size: The maximum number of texts in a bucket.
+    :type batch_size: int
+    :return: The original indices of the texts for each bucket.
+    :rtype: list[np.ndarray]
+    """
+    if batch_size <= 0:
+        raise ValueError(f"Batch size should be positive, got {batch_size}.")
+    order = np.argsort(np.asarray(lengths), kind="stable")
+    return [order[start : start + batch_size] for start in range(0, len(order), batch_size)]
+
+
+def count_padded_tokens(token_counts: Sequence[int], batches: Sequence[Sequence[int]]) -> int:
+    """Counts the tokens of the batches padded to the longest text of each batch."""
+    token_counts = np.asarray(token_counts)
+    return int(sum(token_counts[batch].max(initial=0) * len(batch) for batch in batches))
+
+
+@dataclass
+class PaddingStats:
+    """
+    The token counts of the bucketed batches compared to the batches of the texts in the original order.
+
+    :param num_tokens: The number of tokens without padding.
+    :type num_tokens: int
+    :param padded_tokens: The number of tokens in the padded buckets.
+    :type padded_tokens: int
+    :param unbucketed_padded_tokens: The number of tokens in the padded batches of the texts in the input order.
+    :type unbucketed_padded_tokens: int
+    """
+
+    num_tokens: int
+    padded_tokens: int
+    unbucketed_padded_tokens: int
+
+    @staticmethod
+    def _ratio(part: int, total: int) -> float:
+        return part / total if total else 0.0
+
+    @property
+    def padding_ratio(self) -> float:
+        """The share of the pad tokens in the bucketed batches."""
+        return self._ratio(self.padded_tokens - self.num_tokens, self.padded_tokens)
+
+    @property
+    def unbucketed_padding_ratio(self) -> float:
+        """The share of the pad tokens in the batches of the texts in the input order."""
+        return self._ratio(self.unbucketed_padded_tokens - self.num_tokens, self.unbucketed_padded_tokens)
+
+    @property
+    def saved_ratio(self) -> float:
+        """The share of the padded tokens of the unbucketed batches that the bucketing removes."""
+        return self._ratio(self.unbucketed_padded_tokens - self.padded_tokens, self.unbucketed_padded_tokens)
+
+    def to_dict(self) -> dict[str, Union[int, float]]:
+        return {
+            "num_tokens": self.num_tokens,
+            "padded_tokens": self.padded_tokens,
+            "unbucketed_padded_tokens": self.unbucketed_padded_tokens,
+            "padding_ratio": self.padding_ratio,
+            "unbucketed_padding_ratio": self.unbucketed_padding_ratio,
+            "saved_ratio": self.saved_ratio,
+        }
+
+
+@dataclass
+class BucketedBatch:
+    """
+    The tokenizer outputs for a bucket of texts.
+
+    :param indices: The indices of the bucket rows in the input texts.
+    :type indices: np.ndarray
+    :param outputs: The padded tokenizer outputs by the output names.
+    :type outputs: dict[str, np.ndarray]
+    """
+
+    indices: np.ndarray
+    outputs: dict[str, np.ndarray]
+
+    @property
+    def token_counts(self) -> np.ndarray:
+        if (token_count := self.outputs.get(TOKEN_COUNT_OUTPUT_NAME)) is not None:
+            return token_count
+        if (row_offsets := self.outputs.get(ROW_OFFSETS_OUTPUT_NAME)) is not None:
+            return np.diff(row_offsets)
+        attention_mask = self.outputs.get(ATTENTION_MASK_INPUT_NAME)
+        if attention_mask is None:
+            sequence_length = next((output.shape[-1] for output in self.outputs.values() if output.ndim == 2), None)
+            if sequence_length is None:
+                raise ValueError(
+                    "Cannot count the tokens without the attention mask, row offsets, token count or token ids "
+                    f"outputs, got the outputs: {list(self.outputs)}."
+                )
+            return np.full(len(self.indices), sequence_length)
+        return attention_mask.sum(axis=-1)
+
+
+@dataclass
+class BucketedEncoding:
+    """
+    The result of `encode_bucketed`: the padded buckets and the padding statistics.
+
+    The buckets can be passed to the downstream model as is, `rows` restores the input order of the texts.
+
+    :param batches: The buckets of texts with similar lengths.
+    :type batches: list[BucketedBatch]
+    :param stats: The padding statistics.
+    :type stats: PaddingStats
+    """
+
+    batches: list[BucketedBatch]
+    stats: PaddingStats = field(init=False)
+    batch_size: int = 1
+
+    def __post_init__(self) -> None:
+        token_counts = self.token_counts
+        input_order_batches = [
+            np.arange(start, min(start + self.batch_size, len(token_counts)))
+            for start in range(0, len(token_counts), self.batch_size)
+        ]
+        self.stats = PaddingStats(
+            num_tokens=int(token_counts.sum()),
+            padded_tokens=count_padded_tokens(token_counts, [batch.indices for batch in self.batches]),
+            unbucketed_padded_tokens=count_padded_tokens(token_counts, input_order_batches),
+        )
+
+    def __len__(self) -> int:
+        return sum(len(batch.indices) for batch in self.batches)
+
+    @property
+    def token_counts(self) -> np.ndarray:
+        """The number of tokens of each text in the input order."""
+        token_counts = np.zeros(len(self), dtype=np.int64)
+        for batch in self.batches:
+            token_counts[batch.indices] = batch.token_counts
+        return token_counts
+
+    def rows(self) -> list[dict[str, np.ndarray]]:
+        """Returns the outputs for each text without padding in the input order."""
+        rows = [None] * len(self)
+        for batch in self.batches:
+            for text_idx, row in zip(batch.indices, split_rows(batch.outputs)):
+                rows[text_idx] = row
+        return rows
+
+
+def encode_bucketed(
+    tokenizer: Union[CompiledModel, TokenizerRuntime],
+    texts: Sequence[str],
+    batch_size: int = 32,
+    length_fn: Optional[Callable[[str], float]] = None,
+) -> BucketedEncoding:
+    """Tokenizes the texts in buckets of similar length to reduce the padding.
+
+    The tokenizer pads every row of a batch to the longest row, so a batch of short and long texts consists mostly
+    of the pad tokens. The texts are sorted by the estimated length and split into buckets of `batch_size` texts,
+    then each bucket is tokenized as a separate batch:
+
+        encoding = encode_bucketed(compiled_tokenizer, texts, batch_size=16)
+        for batch in encoding.batches:
+            model(batch.outputs)  # the rows of batch.indices
+        encoding.stats.saved_ratio  # the share of the padded tokens removed by the bucketing
+
+    The buckets run in parallel with `TokenizerRuntime`.
+
+    :param tokenizer: The compiled tokenizer model or the runtime with the tokenizer model.
+    :type tokenizer: Union[openvino.CompiledModel, TokenizerRuntime]
+    :param texts: The texts to tokenize.
+    :type texts: Sequence[str]
+    :param batch_size: The maximum number of texts in a bucket, also used for the unbucketed statistics.
+    :type batch_size: int
+    :param length_fn: The cheap estimate of the text length in tokens, the UTF-8 byte length is used by default.
+        Only the order of the estimates matters.
+    :type length_fn: Optional[Callable[[str], float]]
+    :return: The buckets with the tokenizer outputs and the padding statistics.
+    :rtype: BucketedEncoding
+    """
+    length_fn = length_fn or utf8_length
+    buckets = get_buckets([length_fn(text) for text in texts], batch_size)
+    bucket_texts = [[texts[idx] for idx in bucket] for bucket in buckets]
+
+    if isinstance(tokenizer, TokenizerRuntime):
+        futures = [tokenizer.submit_encode(batch_texts) for batch_texts in bucket_texts]
+        outputs = [future.result() for future in futures]
+    else:
+        # the compiled model reuses the output memory for the next call
+        outputs = [
+            {
+                output.get_any_name(): value.copy()
+                for output, value in tokenizer(prepare_string_inputs(tokenizer, batch_texts)).items()
+            }
+            for batch_texts in bucket_texts
+        ]
+
+    batches = [BucketedBatch(indices, bucket_outputs) for indices, bucket_outputs in zip(buckets, outputs)]
+    return BucketedEncoding(batches, batch_size=batch_size)
@@ -42,6 +42,7 @@ def build_rwkv_tokenizer(
                 *max_length.outputs(),
                 *make_constant_node(0, Type.i32).outputs(),  # default value
             ],
+            {"compute_mask": False},
         )
         .outputs()[:1]
     )
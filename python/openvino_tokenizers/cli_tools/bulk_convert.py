@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+"""
+Parallel conversion of many tokenizers.
+
+Usage:
+    openvino_tokenizers bulk_convert [<hf_repo_id_or_path> ...] [--manifest models.txt] [options]
+
+Each manifest line holds a model id or a local path followed by the `openvino_tokenizers convert` options
+for this tokenizer, empty lines and lines starting with `#` are skipped:
+
+    # model id or path      convert options
+    Qwen/Qwen3-0.6B         --with-detokenizer
+    /models/llama/tokenizer --use-sentencepiece-backend -o llama
+
+Every entry is converted with the `openvino_tokenizers convert` logic in a separate worker process.
+A worker process is replaced after each conversion, so the memory of the converted tokenizer is returned
+to the system, and the peak memory is bounded by the number of jobs.
+
+An entry is skipped if its output directory has the converted models and the conversion info written by
+the previous run matches the current options, package versions and local tokenizer files.
+For the Huggingface Hub model ids the repository changes are not tracked, use `--force` to reconvert them.
+"""
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import shlex
+import sys
+import time
+import traceback
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+import openvino
+
+from openvino_tokenizers.__version__ import __version__ as openvino_tokenizers_version
+from openvino_tokenizers.cli_tools.convert_tokenizer import check_positive_int, get_parser
+from openvino_tokenizers.cli_tools.convert_tokenizer import run as run_convert
+from openvino_tokenizers.constants import DETOKENIZER_NAME, SHARED_WEIGHTS_MODEL_NAME, TOKENIZER_NAME
+from openvino_tokenizers.utils import get_package_version
+
+
+CONVERSION_INFO_FILE = "conversion_info.json"
+CONVERSION_LOG_FILE = "conversion.log"
+DEFAULT_SUMMARY_FILE = "bulk_conversion_summary.json"
+
+
+@dataclass
+class BulkConversionEntry:
+    name: str
+    argv: list[str]
+    output: Path
+    model_names: tuple[str, ...]
+    conversion_info: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class BulkConversionResult:
+    name: str
+    output: str
+    status: str  # "converted", "skipped" or "failed"
+    time_s: float = 0.0
+    error: Optional[str] = None
+
+
+def read_manifest(path: Path) -> list[list[str]]:
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                entries.append(shlex.split(line))
+    return entries
+
+
+def get_default_output_name(name: str) -> str:
+    return "--".join(part for part in Path(name).parts if part not in ("/", "\\", ".", ".."))
+
+
+def get_source_fingerprint(name: str, subfolder: str) -> Optional[list[list[Any]]]:
+    """Lists the sizes and modification times of the local tokenizer files, None for the Hub model ids."""
+    source = Path(name, subfolder)
+    if not source.is_dir():
+        return None
+    return [
+        [file.relative_to(source).as_posix(), file.stat().st_size, file.stat().st_mtime_ns]
+        for file in sorted(source.glob("*"))
+        if file.is_file()
+    ]
+
+
+def get_conversion_info(args: argparse.Namespace) -> dict[str, Any]:
+    options = {key: str(value) for key, value in sorted(vars(args).items()) if key not in ("output", "profile")}
+    return {
+        "name": args.name,
+        "options": options,
+        "source_files": get_source_fingerprint(args.name, args.subfolder),
+        "openvino": openvino.get_version(),
+        "openvino_tokenizers": openvino_tokenizers_version,
+        **{package: get_package_version(package) for package in ("transformers", "tiktoken", "sentencepiece")},
+    }
+
+
+def is_up_to_date(entry: BulkConversionEntry) -> bool:
+    for model_name in entry.model_names:
+        xml_path = entry.output / f"openvino_{model_name}.xml"
+        if not (xml_path.is_file() and xml_path.with_suffix(".bin").is_file()):
+            return False
+
+    try:
+        with open(entry.output / CONVERSION_INFO_FILE, encoding="utf-8") as f:
+            return json.load(f) == entry.conversion_info
+    except (OSError, ValueError):
+        return False
+
+
+def build_entries(
+    entries_argv: list[list[str]],
+    output_root: Path,
+    common_argv: list[str],
+) -> list[BulkConversionEntry]:
+    convert_parser = get_parser()
+    convert_parser.set_defaults(output=None)
+
+    entries = []
+    outputs = {}
+    for entry_argv in entries_argv:
+        argv = common_argv + entry_argv
+        args = convert_parser.parse_args(argv)
+        output = output_root / (args.output or get_default_output_name(args.name))
+        if output in outputs:
+            raise ValueError(f"Entries {outputs[output]} and {args.name} are converted to the same directory {output}")
+        outputs[output] = args.name
+
+        args.output = output
+        if args.shared_weights:
+            model_names = (SHARED_WEIGHTS_MODEL_NAME,)
+        else:
+            model_names = (TOKENIZER_NAME, DETOKENIZER_NAME) if args.with_detokenizer else (TOKENIZER_NAME,)
+        entries.append(
+            BulkConversionEntry(
+                name=args.name,
+                argv=[*argv, "--output", str(output)],
+                output=output,
+                model_names=model_names,
+                conversion_info=get_conversion_info(args),
+            )
+        )
+    return entries
+
+
+def convert_entry(entry: BulkConversionEntry) -> BulkConversionResult:
+    entry.output.mkdir(parents=True, exist_ok=True)
+    (entry.output / CONVERSION_INFO_FILE).unlink(missing_ok=True)
+
+    start_time = time.perf_counter()
+    with open(entry.output / CONVERSION_LOG_FILE, "w", encoding="utf-8") as log:
+        with contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+            try:
+                run_convert(get_parser().parse_args(entry.argv))
+            except Exception as exc:
+                traceback.print_exc()
+                return BulkConversionResult(
+                    name=entry.name,
+                    output=str(entry.output),
+                    status="failed",
+                    time_s=time.perf_counter() - start_time,
+                    error=f"{type(exc).__name__}: {exc}",
+                )
+
+    # the conversion info is written last and marks the output as complete
+    with open(entry.output / CONVERSION_INFO_FILE, "w", encoding="utf-8") as f:
+        json.dump(entry.conversion_info, f, indent=2)
+
+    return BulkConversionResult(
+        name=entry.name,
+        output=str(entry.output),
+        status="converted",
+        time_s=time.perf_counter() - start_time,
+    )
+
+
+def _configure_parser(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "names",
+        nargs="*",
+        default=[],
+        help="Model ids of tokenizers hosted on huggingface.co or paths to saved Huggingface tokenizer directories.",
+    )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        default=None,
+        help=(
+            "Text file with one tokenizer per line: a model id or a path followed by the "
+            "`openvino_tokenizers convert` options for this tokenizer. Lines starting with # are skipped."
+        ),
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=Path(),
+        help=(
+            "Output root directory. Each tokenizer is saved to a subdirectory named after the model id or path, "
+            "or to the directory passed with the -o option in the manifest, relative to the output root."
+        ),
+    )
+    parser.add_argument(
+        "--convert-args",
+        "--convert_args",
+        type=shlex.split,
+        default=[],
+        help=(
+            "`openvino_tokenizers convert` options applied to all tokenizers, "
+            'for example: --convert-args="--with-detokenizer --cache-dir cache". '
+            "Options from the manifest are applied after them."
+        ),
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=check_positive_int,
+        default=min(4, os.cpu_count() or 1),
+        help=(
+            "The number of parallel conversion processes, the peak memory grows with the number of jobs. "
+            "Default is min(4, number of CPUs)."
+        ),
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Convert all tokenizers, including the ones with up to date outputs.",
+    )
+    parser.add_argument(
+        "--summary",
+        type=Path,
+        default=Path(DEFAULT_SUMMARY_FILE),
+        help=f"Path to the JSON summary with the status and time of each conversion, relative to the output root. "
+        f"Default is {DEFAULT_SUMMARY_FILE}.",
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="openvino_tokenizers bulk_convert",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    _configure_parser(parser)
+    return parser
+
+
+def run(args: argparse.Namespace) -> None:
+    entries_argv = [[name] for name in args.names]
+    if args.manifest is not None:
+        entries_argv.extend(read_manifest(args.manifest))
+    if not entries_argv:
+        raise ValueError("No tokenizers to convert, pass model ids or paths, or the --manifest file.")
+
+    entries = build_entries(entries_argv, args.output, args.convert_args)
+
+    start_time = time.perf_counter()
+    results = []
+    to_convert = []
+    for entry in entries:
+        if not args.force and is_up_to_date(entry):
+            results.append(BulkConversionResult(name=entry.name, output=str(entry.output), status="skipped"))
+        else:
+            to_convert.append(entry)
+
+    print(f"Converting {len(to_convert)} tokenizers with {args.jobs} jobs, {len(results)} are up to date.")
+    if to_convert:
+        # spawn a fresh process for every conversion: forking a process with OpenVINO threads is not safe
+        # and the memory of the finished conversion is returned to the system
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(processes=min(args.jobs, len(to_convert)), maxtasksperchild=1) as pool:
+            for idx, result in enumerate(pool.imap_unordered(convert_entry, to_convert), start=1):
+                results.append(result)
+                message = f"[{idx}/{len(to_convert)}] {result.status} {result.name} in {result.time_s:.1f}s"
+                if result.error is not None:
+                    message += f": {result.error}, see {Path(result.output, CONVERSION_LOG_FILE)}"
+                print(message, flush=True)
+
+    order = {str(entry.output): idx for idx, entry in enumerate(entries)}
+    results.sort(key=lambda result: order[result.output])
+    counts = {
+        status: sum(result.status == status for result in results) for status in ("converted", "skipped", "failed")
+    }
+    summary = {
+        "total_time_s": time.perf_counter() - start_time,
+        "jobs": args.jobs,
+        **counts,
+        "results": [asdict(result) for result in results],
+    }
+
+    summary_path = args.summary if args.summary.is_absolute() else args.output / args.summary
+    summary_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(summary_path, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+
+    print(
+        f"Converted: {counts['converted']}, skipped: {counts['skipped']}, failed: {counts['failed']} "
+        f"in {summary['total_time_s']:.1f}s. Summary: {summary_path}"
+    )
+    if counts["failed"]:
+        sys.exit(1)
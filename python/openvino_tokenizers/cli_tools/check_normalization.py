@@ -25,6 +25,8 @@ import sys
 import textwrap
 import traceback
 
+from ..utils import get_tokenizer_json
+
 # Re-use the standard test suite from check_tokenizer
 from .check_tokenizer import (
     ALL_TEST_STRINGS,
@@ -135,20 +137,10 @@ def _get_normalizer_step_dicts(hf_tokenizer) -> list[dict] | None:
     Returns ``None`` if the tokenizer is not fast or has no ``tokenizer.json``.
     Returns ``[]`` if the JSON normalizer is ``null``.
     """
-    import tempfile
-    from pathlib import Path
-
-    if not hf_tokenizer.is_fast:
+    tokenizer_json = get_tokenizer_json(hf_tokenizer)
+    if tokenizer_json is None:
         return None
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        hf_tokenizer.save_pretrained(tmpdir)
-        tok_path = Path(tmpdir) / "tokenizer.json"
-        if not tok_path.exists():
-            return None
-        with open(tok_path, encoding="utf-8") as f:
-            tokenizer_json = json.load(f)
-
     normalizer = tokenizer_json.get("normalizer")
     if normalizer is None:
         return []
@@ -7,8 +7,9 @@ from pathlib import Path
 
 from openvino import Type, save_model
 
-from openvino_tokenizers import convert_tokenizer
-from openvino_tokenizers.constants import UTF8ReplaceMode
+from openvino_tokenizers import convert_tokenizer, save_tokenizers_with_shared_weights
+from openvino_tokenizers.constants import SHARED_WEIGHTS_MODEL_NAME, UTF8ReplaceMode
+from openvino_tokenizers.profiling import ConversionProfiler, profile_stage
 
 
 class StringToTypeAction(Action):
@@ -60,6 +61,31 @@ def _configure_parser(parser: ArgumentParser) -> None:
         required=False,
         help="Output directory",
     )
+    parser.add_argument(
+        "--cache-dir",
+        "--cache_dir",
+        type=Path,
+        default=None,
+        required=False,
+        help=(
+            "Directory to cache converted models in. The models are read from the cache instead of the conversion "
+            "if the same tokenizer was converted with the same options before."
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        nargs="?",
+        const=Path("conversion_profile.json"),
+        default=None,
+        required=False,
+        help=(
+            "Write a JSON report with the wall time and peak memory of the conversion stages: tokenizer loading, "
+            "parser stages, pipeline finalization, `get_ov_subgraph` of each step and serialization. "
+            "The report is saved to conversion_profile.json or to the passed path, relative to the output directory. "
+            "Memory tracing slows down the conversion."
+        ),
+    )
     parser.add_argument(
         "--with-detokenizer",
         "--with_detokenizer",
@@ -67,6 +93,17 @@ def _configure_parser(parser: ArgumentParser) -> None:
         action="store_true",
         help="Add a detokenizer model to the output",
     )
+    parser.add_argument(
+        "--shared-weights",
+        "--shared_weights",
+        required=False,
+        action="store_true",
+        help=(
+            "Save the tokenizer and detokenizer to a single openvino_tokenizer_detokenizer.xml model "
+            "with the vocabulary stored once. Read the models with "
+            "`openvino_tokenizers.read_tokenizers_with_shared_weights`. Requires --with-detokenizer."
+        ),
+    )
     parser.add_argument(
         "--subfolder",
         required=False,
@@ -102,6 +139,17 @@ def _configure_parser(parser: ArgumentParser) -> None:
         action=TrueOrPositiveIntAction,
         help=("The number of inputs for the model. Default is 1."),
     )
+    parser.add_argument(
+        "--unpacked_string_input",
+        "--unpacked-string-input",
+        required=False,
+        action="store_true",
+        help=(
+            "The tokenizer takes the begins, ends and chars of the input strings instead of the string tensor, "
+            "for example the offsets and data buffers of an Arrow string array. "
+            "Use `openvino_tokenizers.utils.unpack_strings` to get the inputs. Not supported with two inputs."
+        ),
+    )
     parser.add_argument(
         "--max_padding",
         "--max-padding",
@@ -116,6 +164,37 @@ def _configure_parser(parser: ArgumentParser) -> None:
             "Not supported for Sentencepiece-based tokenizers."
         ),
     )
+    parser.add_argument(
+        "--ragged_output",
+        "--ragged-output",
+        required=False,
+        action="store_true",
+        help=(
+            "Tokenizer will return the token ids of all texts in a flat input_ids output and the row_offsets output "
+            "instead of the padded input_ids and attention_mask. "
+            "Not supported for Sentencepiece-based tokenizers."
+        ),
+    )
+    parser.add_argument(
+        "--token_count_output",
+        "--token-count-output",
+        required=False,
+        action="store_true",
+        help=(
+            "Tokenizer will return only the number of tokens of each text in the token_count output, "
+            "the tokens are not truncated and padded. Not supported for Sentencepiece-based tokenizers."
+        ),
+    )
+    parser.add_argument(
+        "--deduplicate_inputs",
+        "--deduplicate-inputs",
+        required=False,
+        action="store_true",
+        help=(
+            "Tokenizer will process each unique text of the batch once and copy the tokens to its duplicates. "
+            "Speeds up the batches with repeated texts. Not supported for Sentencepiece-based tokenizers."
+        ),
+    )
     parser.add_argument(
         "--max_length",
         "--max-length",
@@ -238,6 +317,17 @@ def _configure_parser(parser: ArgumentParser) -> None:
             "Can be used to stream a model output without TextStreamer buffer."
         ),
     )
+    parser.add_argument(
+        "--stateful-detokenizer",
+        "--stateful_detokenizer",
+        required=False,
+        action="store_true",
+        help=(
+            "[Experimental] Detokenizer will take only new token ids on each call and return only the new text, "
+            "an incomplete UTF-8 symbol is held back until the next call. Not supported for Sentencepiece-based "
+            "tokenizers and with --clean-up-tokenization-spaces."
+        ),
+    )
     parser.add_argument(
         "--utf8_replace_mode",
         choices=list(UTF8ReplaceMode),
@@ -253,6 +343,7 @@ def _configure_parser(parser: ArgumentParser) -> None:
         ),
     )
 
+
 def get_parser() -> ArgumentParser:
     parser = ArgumentParser(
         prog="openvino_tokenizers convert",
@@ -263,6 +354,21 @@ def get_parser() -> ArgumentParser:
 
 
 def run(args) -> None:
+    if args.profile is None:
+        convert(args)
+        return
+
+    profile_path = args.profile if args.profile.is_absolute() else args.output / args.profile
+    with ConversionProfiler() as profiler:
+        convert(args)
+    profiler.save_report(profile_path)
+    print(f"Saved conversion profile: {profile_path}")
+
+
+def convert(args) -> None:
+    if args.shared_weights and not args.with_detokenizer:
+        raise ValueError("The --shared-weights option requires --with-detokenizer.")
+
     try:
         from transformers import AutoTokenizer
     except (ImportError, ModuleNotFoundError):
@@ -280,7 +386,8 @@ def run(args) -> None:
         tokenizer_init_kwargs["padding_side"] = "left"
 
     print("Loading Huggingface Tokenizer...")
-    hf_tokenizer = AutoTokenizer.from_pretrained(args.name, **tokenizer_init_kwargs)
+    with profile_stage("hf_loading", kind="loading"):
+        hf_tokenizer = AutoTokenizer.from_pretrained(args.name, **tokenizer_init_kwargs)
 
     if isinstance(args.max_padding, int) and args.max_padding is not True:
         print(f"Set max_length to: {args.max_padding}")
@@ -290,29 +397,44 @@ def run(args) -> None:
         hf_tokenizer.model_max_length = args.max_length
 
     print("Converting Huggingface Tokenizer to OpenVINO...")
-    converted = convert_tokenizer(
-        hf_tokenizer,
-        with_detokenizer=args.with_detokenizer,
-        skip_special_tokens=args.not_skip_special_tokens,
-        add_special_tokens=args.not_add_special_tokens,
-        clean_up_tokenization_spaces=args.clean_up_tokenization_spaces,
-        tokenizer_output_type=args.tokenizer_output_type,
-        detokenizer_input_type=args.detokenizer_input_type,
-        streaming_detokenizer=args.streaming_detokenizer,
-        use_max_padding=args.max_padding is not None,
-        handle_special_tokens_with_re=args.handle_special_tokens_with_re,
-        use_sentencepiece_backend=args.use_sentencepiece_backend,
-        utf8_replace_mode=args.utf8_replace_mode,
-        max_length=args.max_length,
-        truncation=args.max_length is not None,
-        number_of_inputs=args.number_of_inputs,
-    )
+    with profile_stage("convert_tokenizer", kind="conversion"):
+        converted = convert_tokenizer(
+            hf_tokenizer,
+            with_detokenizer=args.with_detokenizer,
+            skip_special_tokens=args.not_skip_special_tokens,
+            add_special_tokens=args.not_add_special_tokens,
+            clean_up_tokenization_spaces=args.clean_up_tokenization_spaces,
+            tokenizer_output_type=args.tokenizer_output_type,
+            detokenizer_input_type=args.detokenizer_input_type,
+            streaming_detokenizer=args.streaming_detokenizer,
+            stateful_detokenizer=args.stateful_detokenizer,
+            use_max_padding=args.max_padding is not None,
+            ragged_output=args.ragged_output,
+            token_count_output=args.token_count_output,
+            deduplicate_inputs=args.deduplicate_inputs,
+            handle_special_tokens_with_re=args.handle_special_tokens_with_re,
+            use_sentencepiece_backend=args.use_sentencepiece_backend,
+            utf8_replace_mode=args.utf8_replace_mode,
+            max_length=args.max_length,
+            truncation=args.max_length is not None,
+            number_of_inputs=args.number_of_inputs,
+            unpacked_string_input=args.unpacked_string_input,
+            cache_dir=args.cache_dir,
+        )
+    if args.shared_weights:
+        save_path = args.output / f"openvino_{SHARED_WEIGHTS_MODEL_NAME}.xml"
+        with profile_stage("serialization", kind="serialization", model=SHARED_WEIGHTS_MODEL_NAME):
+            save_tokenizers_with_shared_weights(*converted, save_path)
+        print(f"Saved OpenVINO Tokenizer and Detokenizer: {save_path}, {save_path.with_suffix('.bin')}")
+        return
+
     if not isinstance(converted, tuple):
         converted = (converted,)
 
     for converted_model, name in zip(converted, ("tokenizer", "detokenizer")):
         save_path = args.output / f"openvino_{name}.xml"
-        save_model(converted_model, save_path)
+        with profile_stage("serialization", kind="serialization", model=name):
+            save_model(converted_model, save_path)
         print(f"Saved OpenVINO {name.capitalize()}: {save_path}, {save_path.with_suffix('.bin')}")
 
 
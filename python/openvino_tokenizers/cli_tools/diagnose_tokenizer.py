@@ -19,14 +19,12 @@ Exit code: 0 = all stages matched, 1 = any mismatch or unsupported type.
 """
 
 import argparse
-import json
 import sys
-import tempfile
 import traceback
-from pathlib import Path
 
 import numpy as np
 
+from ..utils import get_tokenizer_json
 from .check_tokenizer import (
     ALL_TEST_STRINGS,
     BOLD,
@@ -87,16 +85,8 @@ def _format_ov_step(ov_step) -> str:
 
 
 def _load_tokenizer_json(hf_tokenizer) -> dict | None:
-    """Save the HF tokenizer to a temp dir and load its tokenizer.json."""
-    if not hf_tokenizer.is_fast:
-        return None
-    with tempfile.TemporaryDirectory() as tmpdir:
-        hf_tokenizer.save_pretrained(tmpdir)
-        tok_path = Path(tmpdir) / "tokenizer.json"
-        if not tok_path.exists():
-            return None
-        with open(tok_path, encoding="utf-8") as f:
-            return json.load(f)
+    """Load the tokenizer.json of the HF tokenizer."""
+    return get_tokenizer_json(hf_tokenizer)
 
 
 def _get_section_steps(section_json) -> list[dict]:
@@ -6,15 +6,21 @@ Unified CLI entry point for OpenVINO Tokenizers.
 
 Usage:
     openvino_tokenizers convert            <hf_repo_id> [options]  – convert a HF tokenizer to OpenVINO
+    openvino_tokenizers bulk_convert       <hf_repo_id> ... [options]  – convert many tokenizers in parallel
     openvino_tokenizers check              <hf_repo_id> [options]  – sanity-check a HF tokenizer
     openvino_tokenizers check_normalization <hf_repo_id> [options]  – test normalization steps only
     openvino_tokenizers diagnose           <hf_repo_id> [options]  – pipeline-level diagnostics
+    openvino_tokenizers serve              <model_dir> [options]   – local micro-batching tokenization service
+    openvino_tokenizers pretokenize        <tokenizer> <input> ... -o <dir>  – tokenize a corpus into token shards
 """
 
 import argparse
 
 
 def main() -> None:
+    from .bulk_convert import __doc__ as _bulk_convert_doc
+    from .bulk_convert import _configure_parser as _cfg_bulk_convert
+    from .bulk_convert import run as _run_bulk_convert
     from .check_normalization import _configure_parser as _cfg_check_norm
     from .check_normalization import run as _run_check_norm
     from .check_tokenizer import _configure_parser as _cfg_check
@@ -23,6 +29,12 @@ def main() -> None:
     from .convert_tokenizer import run as _run_convert
     from .diagnose_tokenizer import _configure_parser as _cfg_diagnose
     from .diagnose_tokenizer import run as _run_diagnose
+    from .pretokenize_corpus import __doc__ as _pretokenize_doc
+    from .pretokenize_corpus import _configure_parser as _cfg_pretokenize
+    from .pretokenize_corpus import run as _run_pretokenize
+    from .serve_tokenizer import __doc__ as _serve_doc
+    from .serve_tokenizer import _configure_parser as _cfg_serve
+    from .serve_tokenizer import run as _run_serve
 
     parser = argparse.ArgumentParser(
         prog="openvino_tokenizers",
@@ -39,6 +51,15 @@ def main() -> None:
     _cfg_convert(sub_convert)
     sub_convert.set_defaults(func=_run_convert)
 
+    sub_bulk_convert = subparsers.add_parser(
+        "bulk_convert",
+        help="Convert many HuggingFace tokenizers to OpenVINO format in parallel.",
+        description=_bulk_convert_doc,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    _cfg_bulk_convert(sub_bulk_convert)
+    sub_bulk_convert.set_defaults(func=_run_bulk_convert)
+
     sub_check = subparsers.add_parser(
         "check",
         help="Sanity-check a HuggingFace tokenizer through OpenVINO.",
@@ -90,5 +111,23 @@ def main() -> None:
     _cfg_diagnose(sub_diagnose)
     sub_diagnose.set_defaults(func=_run_diagnose)
 
+    sub_serve = subparsers.add_parser(
+        "serve",
+        help="Serve a converted tokenizer on localhost or a Unix socket with micro-batching.",
+        description=_serve_doc,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    _cfg_serve(sub_serve)
+    sub_serve.set_defaults(func=_run_serve)
+
+    sub_pretokenize = subparsers.add_parser(
+        "pretokenize",
+        help="Tokenize JSONL and Parquet corpora into memory-mapped token shards.",
+        description=_pretokenize_doc,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    _cfg_pretokenize(sub_pretokenize)
+    sub_pretokenize.set_defaults(func=_run_pretokenize)
+
     args = parser.parse_args()
     args.func(args)
@@ -0,0 +1,470 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+"""
+Corpus pre-tokenization into memory-mapped token shards.
+
+Usage:
+    openvino_tokenizers pretokenize <tokenizer> <input> [<input> ...] -o <output_dir> [options]
+
+The texts are streamed from JSONL files, plain or gzipped, and from Parquet files (requires pyarrow),
+tokenized in batches on several infer requests in parallel and written in the input order to the shards
+in the output directory:
+
+    tokens_00000.bin   flat uint32 token ids of the texts of the shard
+    offsets_00000.bin  int64 offsets of the texts in the token ids, the number of texts plus one
+    checkpoint.json    the read position in the inputs and the sizes of the shards
+
+The shard files are raw little-endian arrays, open them with `numpy.memmap` or `open_token_shard`:
+
+    token_ids, offsets = open_token_shard(output_dir, 0)
+    token_ids[offsets[i] : offsets[i + 1]]  # the token ids of the i-th text of the shard
+
+A new shard is started when the tokens of the next batch do not fit into --shard-size tokens.
+The shards are flushed to disk and the checkpoint is saved every --checkpoint-interval seconds. A stopped run
+started again with the same inputs and output directory continues from the last checkpoint, the tokens written
+after it are dropped. The tokenizer should be converted with a single input and without `token_count_output`,
+the `ragged_output` tokenizers skip the padding and are the fastest.
+"""
+
+import argparse
+import gzip
+import json
+import os
+import time
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import numpy as np
+
+from openvino_tokenizers import TokenizerRuntime
+from openvino_tokenizers.cli_tools.convert_tokenizer import check_positive_int
+from openvino_tokenizers.constants import (
+    ATTENTION_MASK_INPUT_NAME,
+    ROW_OFFSETS_OUTPUT_NAME,
+    TOKEN_IDS_INPUT_NAME,
+    TOKENIZER_NAME,
+)
+
+
+CHECKPOINT_FILE = "checkpoint.json"
+DEFAULT_SHARD_SIZE = 2**30
+TOKEN_IDS_DTYPE = np.dtype("<u4")
+OFFSETS_DTYPE = np.dtype("<i8")
+
+
+@dataclass
+class TextBatch:
+    texts: Union[list[str], "pyarrow.Array"]  # noqa
+    num_bytes: int
+    file_idx: int
+    position: int  # the number of records of the file read up to the end of the batch
+
+
+@dataclass
+class PretokenizationCheckpoint:
+    inputs: list[str]
+    text_key: str
+    file_idx: int = 0
+    position: int = 0
+    num_bytes: int = 0
+    shards: list[dict[str, int]] = field(default_factory=list)
+    done: bool = False
+
+    @property
+    def num_texts(self) -> int:
+        return sum(shard["num_texts"] for shard in self.shards)
+
+    @property
+    def num_tokens(self) -> int:
+        return sum(shard["num_tokens"] for shard in self.shards)
+
+
+def get_shard_paths(output_dir: Path, shard_idx: int) -> tuple[Path, Path]:
+    return output_dir / f"tokens_{shard_idx:05d}.bin", output_dir / f"offsets_{shard_idx:05d}.bin"
+
+
+def open_token_shard(output_dir: Union[str, Path], shard_idx: int) -> tuple[np.ndarray, np.ndarray]:
+    """Memory-maps the token ids and the offsets of the shard written by `pretokenize_corpus`.
+
+    :param output_dir: The output directory of the pre-tokenization.
+    :type output_dir: Union[str, Path]
+    :param shard_idx: The index of the shard.
+    :type shard_idx: int
+    :return: The flat token ids and the offsets of the texts in them.
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+    arrays = []
+    for path, dtype in zip(get_shard_paths(Path(output_dir), shard_idx), (TOKEN_IDS_DTYPE, OFFSETS_DTYPE)):
+        # an empty file cannot be memory-mapped
+        arrays.append(np.memmap(path, dtype=dtype, mode="r") if path.stat().st_size else np.empty(0, dtype))
+    return arrays[0], arrays[1]
+
+
+def _iter_jsonl_batches(
+    path: Path, text_key: str, batch_size: int, start: int
+) -> Iterator[tuple[list[str], int, int]]:
+    texts, num_bytes, line_number = [], 0, 0
+    with (gzip.open if path.suffix == ".gz" else open)(path, "rb") as f:
+        for line_number, line in enumerate(f, start=1):
+            if line_number <= start or not line.strip():
+                continue
+            try:
+                text = json.loads(line)[text_key]
+            except (ValueError, KeyError, TypeError) as exc:
+                raise ValueError(f"{path}:{line_number}: expected a JSON object with the {text_key!r} field") from exc
+            if text is None:
+                text = ""
+            elif not isinstance(text, str):
+                raise ValueError(f"{path}:{line_number}: the {text_key!r} field is not a string")
+
+            texts.append(text)
+            num_bytes += len(text.encode())
+            if len(texts) == batch_size:
+                yield texts, num_bytes, line_number
+                texts, num_bytes = [], 0
+    if texts:
+        yield texts, num_bytes, line_number
+
+
+def _iter_parquet_batches(
+    path: Path, text_key: str, batch_size: int, start: int
+) -> Iterator[tuple["pyarrow.Array", int, int]]:  # noqa
+    try:
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ImportError("Reading Parquet files requires pyarrow, install it with `pip install pyarrow`.") from exc
+
+    parquet_file = pq.ParquetFile(path)
+    # skip the row groups read before the checkpoint without reading them
+    row_groups, position = [], 0
+    for idx in range(parquet_file.num_row_groups):
+        num_rows = parquet_file.metadata.row_group(idx).num_rows
+        if not row_groups and position + num_rows <= start:
+            position += num_rows
+        else:
+            row_groups.append(idx)
+
+    for record_batch in parquet_file.iter_batches(batch_size, row_groups=row_groups, columns=[text_key]):
+        texts = record_batch.column(0)
+        if position < start:
+            skipped = min(start - position, len(texts))
+            texts = texts.slice(skipped)
+            position += skipped
+        if not len(texts):
+            continue
+
+        texts = pc.fill_null(texts, "")
+        position += len(texts)
+        yield texts, pc.sum(pc.binary_length(texts)).as_py() or 0, position
+
+
+def iter_text_batches(
+    inputs: list[Path], text_key: str, batch_size: int, file_idx: int = 0, position: int = 0
+) -> Iterator[TextBatch]:
+    """Reads the texts of the input files in batches, starting from the position in the file with the index.
+
+    The batches do not cross the file boundaries. The JSONL records are counted by lines, the Parquet records
+    by rows, the null texts are read as empty strings.
+    """
+    for idx in range(file_idx, len(inputs)):
+        path = inputs[idx]
+        read_batches = _iter_parquet_batches if path.suffix == ".parquet" else _iter_jsonl_batches
+        for texts, num_bytes, end in read_batches(path, text_key, batch_size, position if idx == file_idx else 0):
+            yield TextBatch(texts, num_bytes, idx, end)
+
+
+def get_flat_token_ids(outputs: dict[str, np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the token ids of all texts of the batch in one flat array and the number of tokens of each text.
+
+    The padding is removed with the attention mask, so both padding sides are supported.
+    """
+    token_ids = outputs[TOKEN_IDS_INPUT_NAME]
+    row_offsets = outputs.get(ROW_OFFSETS_OUTPUT_NAME)
+    if row_offsets is not None:
+        return token_ids[row_offsets[0] : row_offsets[-1]], np.diff(row_offsets)
+
+    attention_mask = outputs.get(ATTENTION_MASK_INPUT_NAME)
+    if attention_mask is None:
+        return token_ids.reshape(-1), np.full(len(token_ids), token_ids.shape[-1])
+    attention_mask = attention_mask.astype(bool)
+    return token_ids[attention_mask], attention_mask.sum(axis=-1)
+
+
+class TokenShardWriter:
+    """
+    Appends the token ids to the shard files, a new shard is started when the next tokens do not fit into the shard.
+
+    The writer continues the shards of the checkpoint: the files are truncated to the checkpoint sizes
+    and the shards started after the checkpoint are removed.
+
+    :param output_dir: The directory of the shard files.
+    :type output_dir: Path
+    :param shards: The number of texts and tokens of each shard, updated by the writer.
+    :type shards: list[dict[str, int]]
+    :param shard_size: The maximum number of tokens in a shard, unless one batch has more tokens.
+    :type shard_size: int
+    """
+
+    def __init__(self, output_dir: Path, shards: list[dict[str, int]], shard_size: int = DEFAULT_SHARD_SIZE) -> None:
+        self.output_dir = output_dir
+        self.shards = shards
+        self.shard_size = shard_size
+        if not self.shards:
+            self.shards.append({"num_texts": 0, "num_tokens": 0})
+        for path in output_dir.glob("*_*.bin"):
+            prefix, _, shard_idx = path.stem.rpartition("_")
+            if prefix in ("tokens", "offsets") and shard_idx.isdigit() and int(shard_idx) >= len(self.shards):
+                path.unlink()
+        self._open_shard()
+
+    def _open_shard(self) -> None:
+        shard = self.shards[-1]
+        tokens_path, offsets_path = get_shard_paths(self.output_dir, len(self.shards) - 1)
+        self._tokens_file = open(tokens_path, "ab")
+        self._tokens_file.truncate(shard["num_tokens"] * TOKEN_IDS_DTYPE.itemsize)
+        self._offsets_file = open(offsets_path, "ab")
+        # a new offsets file is extended with zeros, that is the zero offset of the first text
+        self._offsets_file.truncate((shard["num_texts"] + 1) * OFFSETS_DTYPE.itemsize)
+
+    def write(self, token_ids: np.ndarray, lengths: np.ndarray) -> None:
+        shard = self.shards[-1]
+        if shard["num_tokens"] and shard["num_tokens"] + len(token_ids) > self.shard_size:
+            self.close()
+            self.shards.append({"num_texts": 0, "num_tokens": 0})
+            self._open_shard()
+            shard = self.shards[-1]
+
+        offsets = shard["num_tokens"] + np.cumsum(lengths, dtype=OFFSETS_DTYPE)
+        self._tokens_file.write(np.ascontiguousarray(token_ids, dtype=TOKEN_IDS_DTYPE).data)
+        self._offsets_file.write(offsets.data)
+        shard["num_texts"] += len(lengths)
+        shard["num_tokens"] += len(token_ids)
+
+    def flush(self) -> None:
+        for file in (self._tokens_file, self._offsets_file):
+            file.flush()
+            os.fsync(file.fileno())
+
+    def close(self) -> None:
+        self.flush()
+        self._tokens_file.close()
+        self._offsets_file.close()
+
+
+def load_checkpoint(output_dir: Path, inputs: list[Path], text_key: str) -> PretokenizationCheckpoint:
+    input_names = [str(path.resolve()) for path in inputs]
+    checkpoint_path = output_dir / CHECKPOINT_FILE
+    if not checkpoint_path.is_file():
+        return PretokenizationCheckpoint(inputs=input_names, text_key=text_key)
+
+    with open(checkpoint_path, encoding="utf-8") as f:
+        checkpoint = PretokenizationCheckpoint(**json.load(f))
+    if checkpoint.inputs != input_names or checkpoint.text_key != text_key:
+        raise ValueError(
+            f"The checkpoint in {output_dir} is written for other inputs or text key, "
+            "use another output directory or remove the checkpoint to start over."
+        )
+    return checkpoint
+
+
+def save_checkpoint(output_dir: Path, checkpoint: PretokenizationCheckpoint) -> None:
+    # the checkpoint is replaced at once, so a stopped run never leaves a partial checkpoint
+    checkpoint_path = output_dir / CHECKPOINT_FILE
+    tmp_path = checkpoint_path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(asdict(checkpoint), f, indent=2)
+    os.replace(tmp_path, checkpoint_path)
+
+
+def format_throughput(num_texts: int, num_tokens: int, num_bytes: int, time_s: float) -> str:
+    time_s = max(time_s, 1e-9)
+    return (
+        f"{num_texts} texts, {num_tokens} tokens in {time_s:.1f}s: "
+        f"{num_tokens / time_s:,.0f} tokens/s, {num_bytes / time_s / 1024**2:.2f} MB/s"
+    )
+
+
+def pretokenize_corpus(
+    runtime: TokenizerRuntime,
+    inputs: list[Path],
+    output_dir: Path,
+    text_key: str = "text",
+    batch_size: int = 256,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    checkpoint_interval_s: float = 60.0,
+    log_interval_s: Optional[float] = None,
+) -> PretokenizationCheckpoint:
+    """Tokenizes the texts of the input files and writes the token ids to the shards in the output directory.
+
+    Up to the number of infer requests of the runtime batches run in parallel while the results of the previous
+    batches are written in the input order. The run continues from the checkpoint in the output directory.
+
+    :param runtime: The runtime with the tokenizer model.
+    :type runtime: TokenizerRuntime
+    :param inputs: The JSONL and Parquet files.
+    :type inputs: list[Path]
+    :param output_dir: The directory for the shards and the checkpoint.
+    :type output_dir: Path
+    :param text_key: The key of the text in the JSONL records or the Parquet column name.
+    :type text_key: str
+    :param batch_size: The number of texts in a batch.
+    :type batch_size: int
+    :param shard_size: The maximum number of tokens in a shard, unless one batch has more tokens.
+    :type shard_size: int
+    :param checkpoint_interval_s: The time between the checkpoints.
+    :type checkpoint_interval_s: float
+    :param log_interval_s: The time between the progress messages, no messages if None.
+    :type log_interval_s: Optional[float]
+    :return: The final checkpoint with the number of texts and tokens of each shard.
+    :rtype: PretokenizationCheckpoint
+    """
+    if runtime.tokenizer_pool is None:
+        raise ValueError("The runtime is created without the tokenizer model.")
+    output_names = {output.get_any_name() for output in runtime.tokenizer_pool.compiled_model.outputs}
+    if TOKEN_IDS_INPUT_NAME not in output_names:
+        raise ValueError(f"The tokenizer has no {TOKEN_IDS_INPUT_NAME} output, got {sorted(output_names)}.")
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    checkpoint = load_checkpoint(output_dir, inputs, text_key)
+    if checkpoint.done:
+        return checkpoint
+
+    writer = TokenShardWriter(output_dir, checkpoint.shards, shard_size)
+    # the counters of this run for the throughput
+    num_texts = num_tokens = num_bytes = 0
+    start_time = last_checkpoint_time = last_log_time = time.perf_counter()
+
+    def write_result(batch: TextBatch, future: Any) -> None:
+        nonlocal num_texts, num_tokens, num_bytes
+        token_ids, lengths = get_flat_token_ids(future.result())
+        writer.write(token_ids, lengths)
+        checkpoint.file_idx, checkpoint.position = batch.file_idx, batch.position
+        checkpoint.num_bytes += batch.num_bytes
+        num_texts += len(lengths)
+        num_tokens += len(token_ids)
+        num_bytes += batch.num_bytes
+
+    pending = deque()
+    try:
+        batches = iter_text_batches(inputs, text_key, batch_size, checkpoint.file_idx, checkpoint.position)
+        for batch in batches:
+            # the submit waits for an idle infer request, the finished batches are written meanwhile
+            pending.append((batch, runtime.submit_encode(batch.texts)))
+            while pending and (pending[0][1].done() or len(pending) > runtime.tokenizer_pool.num_requests):
+                write_result(*pending.popleft())
+
+            now = time.perf_counter()
+            if now - last_checkpoint_time >= checkpoint_interval_s:
+                writer.flush()
+                save_checkpoint(output_dir, checkpoint)
+                last_checkpoint_time = now
+            if log_interval_s is not None and now - last_log_time >= log_interval_s:
+                print(format_throughput(num_texts, num_tokens, num_bytes, now - start_time), flush=True)
+                last_log_time = now
+
+        while pending:
+            write_result(*pending.popleft())
+        checkpoint.done = True
+    finally:
+        writer.close()
+        if checkpoint.done:
+            save_checkpoint(output_dir, checkpoint)
+
+    if log_interval_s is not None:
+        print(format_throughput(num_texts, num_tokens, num_bytes, time.perf_counter() - start_time), flush=True)
+    return checkpoint
+
+
+def _configure_parser(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "tokenizer",
+        type=Path,
+        help="Path to the converted openvino_tokenizer.xml or to the directory with it.",
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        type=Path,
+        help="JSONL files, .jsonl.gz files and Parquet files, read in the given order.",
+    )
+    parser.add_argument("-o", "--output", type=Path, required=True, help="The directory for the token shards.")
+    parser.add_argument(
+        "--text-key",
+        "--text_key",
+        default="text",
+        help="The key of the text in the JSONL records or the Parquet column name. Default is text.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        "--batch_size",
+        type=check_positive_int,
+        default=256,
+        help="The number of texts in a batch. Default is 256.",
+    )
+    parser.add_argument(
+        "--shard-size",
+        "--shard_size",
+        type=check_positive_int,
+        default=DEFAULT_SHARD_SIZE,
+        help=f"The maximum number of tokens in a shard. Default is {DEFAULT_SHARD_SIZE} tokens, 4 GB.",
+    )
+    parser.add_argument(
+        "--checkpoint-interval",
+        "--checkpoint_interval",
+        type=float,
+        default=60.0,
+        help="The time in seconds between the checkpoints. Default is 60 seconds.",
+    )
+    parser.add_argument(
+        "--log-interval",
+        "--log_interval",
+        type=float,
+        default=10.0,
+        help="The time in seconds between the throughput reports. Default is 10 seconds.",
+    )
+    parser.add_argument(
+        "--num-requests",
+        "--num_requests",
+        type=int,
+        default=0,
+        help="The number of parallel infer requests, the optimal number for the device is used by default.",
+    )
+    parser.add_argument("--device", default="CPU", help="The device to run the tokenizer on. Default is CPU.")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="openvino_tokenizers pretokenize",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    _configure_parser(parser)
+    return parser
+
+
+def run(args: argparse.Namespace) -> None:
+    tokenizer_path = args.tokenizer
+    if tokenizer_path.is_dir():
+        tokenizer_path = tokenizer_path / f"openvino_{TOKENIZER_NAME}.xml"
+    runtime = TokenizerRuntime(tokenizer_path, device=args.device, num_requests=args.num_requests)
+
+    print(f"Tokenizing {len(args.inputs)} files with {runtime.tokenizer_pool.num_requests} infer requests", flush=True)
+    checkpoint = pretokenize_corpus(
+        runtime,
+        args.inputs,
+        args.output,
+        text_key=args.text_key,
+        batch_size=args.batch_size,
+        shard_size=args.shard_size,
+        checkpoint_interval_s=args.checkpoint_interval,
+        log_interval_s=args.log_interval,
+    )
+    print(
+        f"Done: {checkpoint.num_texts} texts, {checkpoint.num_tokens} tokens, {checkpoint.num_bytes} bytes "
+        f"in {len(checkpoint.shards)} shards in {args.output}"
+    )
@@ -0,0 +1,469 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+"""
+Local tokenization service with micro-batching.
+
+Usage:
+    openvino_tokenizers serve <model_dir> [--port 8000 | --unix-socket /tmp/tokenizer.sock] [options]
+
+The service loads the converted tokenizer and detokenizer from the directory and serves JSON over HTTP
+on localhost or on a Unix socket:
+
+    POST /encode  {"texts": ["text", ...]}     -> {"input_ids": [[...], ...], "attention_mask": [[...], ...]}
+    POST /decode  {"token_ids": [[...], ...]}  -> {"texts": ["text", ...]}
+    GET  /stats                                -> request, batch, duplicate text, latency and throughput counters
+    GET  /health                               -> {"status": "ok"}
+
+The texts of concurrent encode requests are coalesced into one batch: a batch is started when it has
+--max-batch-size texts or when the first text waited --max-wait-ms. Several batches run in parallel on the
+infer requests of the `TokenizerRuntime` pool. The tokenizer outputs are returned per text without padding.
+The `deduplication_ratio` in the stats is the share of the batched texts that repeat a text of the same batch,
+a tokenizer converted with `--deduplicate-inputs` tokenizes only the unique texts of a batch.
+With --cache-size-mb the outputs of the texts repeated across batches, like system prompts, are cached,
+the `encoding_cache` stats show the cache hit rate.
+"""
+
+import argparse
+import http.client
+import json
+import queue
+import signal
+import socket
+import socketserver
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import numpy as np
+
+from openvino_tokenizers import EncodingCache, TokenizerRuntime, read_tokenizers_with_shared_weights
+from openvino_tokenizers.cli_tools.convert_tokenizer import check_positive_int
+from openvino_tokenizers.constants import DETOKENIZER_NAME, SHARED_WEIGHTS_MODEL_NAME, TOKENIZER_NAME
+from openvino_tokenizers.runtime import split_rows
+
+
+LATENCY_WINDOW = 10_000
+_CLOSE = object()
+
+
+class ServiceStats:
+    """Thread-safe counters of the service, the latency percentiles are computed over the last requests."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._start_time = time.perf_counter()
+        self._counters = {
+            "encode_requests": 0,
+            "decode_requests": 0,
+            "texts": 0,
+            "unique_texts": 0,
+            "batches": 0,
+            "errors": 0,
+        }
+        self._latencies_ms = {"encode": deque(maxlen=LATENCY_WINDOW), "decode": deque(maxlen=LATENCY_WINDOW)}
+
+    def add(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += value
+
+    def add_latency(self, kind: str, latency_ms: float) -> None:
+        with self._lock:
+            self._latencies_ms[kind].append(latency_ms)
+
+    def get(self) -> dict[str, Any]:
+        with self._lock:
+            uptime = time.perf_counter() - self._start_time
+            stats = {"uptime_s": uptime, **self._counters}
+            stats["average_batch_size"] = self._counters["texts"] / max(self._counters["batches"], 1)
+            stats["texts_per_second"] = self._counters["texts"] / uptime
+            duplicate_texts = self._counters["texts"] - self._counters["unique_texts"]
+            stats["deduplication_ratio"] = duplicate_texts / max(self._counters["texts"], 1)
+            for kind, latencies in self._latencies_ms.items():
+                if latencies:
+                    mean, p50, p99 = np.mean(latencies), *np.percentile(latencies, [50, 99])
+                    stats[f"{kind}_latency_ms"] = {"mean": mean, "p50": p50, "p99": p99}
+        return stats
+
+
+class MicroBatcher:
+    """
+    Coalesces the texts of concurrent encode calls into batches.
+
+    The batching thread takes the first waiting call and adds the next calls until the batch has `max_batch_size`
+    texts or `max_wait_ms` passed since the first call. The batch is started on the runtime without waiting for
+    the result, so the next batch is collected while the previous batches run.
+
+    :param runtime: The runtime with the tokenizer model.
+    :type runtime: TokenizerRuntime
+    :param max_batch_size: The maximum number of texts in a batch, a call with more texts is a batch of its own.
+    :type max_batch_size: int
+    :param max_wait_ms: The maximum time the first call of the batch waits for other calls.
+    :type max_wait_ms: float
+    :param stats: The service counters.
+    :type stats: Optional[ServiceStats]
+    """
+
+    def __init__(
+        self,
+        runtime: TokenizerRuntime,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 2.0,
+        stats: Optional[ServiceStats] = None,
+    ) -> None:
+        self.runtime = runtime
+        self.max_batch_size = max_batch_size
+        self.max_wait_s = max_wait_ms / 1000
+        self.stats = stats or ServiceStats()
+        self._calls: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="micro_batcher", daemon=True)
+        self._thread.start()
+
+    def encode(self, texts: list[str]) -> Future:
+        """Adds the texts to the next batch, the future result is a list of the unpadded outputs for each text."""
+        future = Future()
+        if not texts:
+            future.set_result([])
+        else:
+            self._calls.put((texts, future))
+        return future
+
+    def close(self) -> None:
+        self._calls.put(_CLOSE)
+        self._thread.join()
+
+    def _run(self) -> None:
+        call = self._calls.get()
+        while call is not _CLOSE:
+            batch = [call]
+            batch_size = len(call[0])
+            deadline = time.perf_counter() + self.max_wait_s
+            call = None
+            while batch_size < self.max_batch_size:
+                try:
+                    next_call = self._calls.get(timeout=max(deadline - time.perf_counter(), 0))
+                except queue.Empty:
+                    break
+                if next_call is _CLOSE or batch_size + len(next_call[0]) > self.max_batch_size:
+                    call = next_call  # starts the next batch or stops the thread
+                    break
+                batch.append(next_call)
+                batch_size += len(next_call[0])
+
+            self._start_batch(batch)
+            if call is None:
+                call = self._calls.get()
+
+    def _start_batch(self, batch: list[tuple[list[str], Future]]) -> None:
+        texts = [text for call_texts, _ in batch for text in call_texts]
+        self.stats.add("batches")
+        self.stats.add("texts", len(texts))
+        self.stats.add("unique_texts", len(set(texts)))
+        try:
+            batch_future = self.runtime.submit_encode(texts)
+        except Exception as exc:
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+
+        def on_done(batch_future: Future) -> None:
+            try:
+                rows = self._split_rows(batch_future.result())
+            except Exception as exc:
+                for _, future in batch:
+                    future.set_exception(exc)
+                return
+
+            start = 0
+            for call_texts, future in batch:
+                future.set_result(rows[start : start + len(call_texts)])
+                start += len(call_texts)
+
+        batch_future.add_done_callback(on_done)
+
+    @staticmethod
+    def _split_rows(outputs: dict[str, np.ndarray]) -> list[dict[str, list[int]]]:
+        return [{name: output.tolist() for name, output in row.items()} for row in split_rows(outputs)]
+
+
+class TokenizerRequestHandler(BaseHTTPRequestHandler):
+    server_version = "OpenVINOTokenizers"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass  # the access log is too verbose for a sidecar, see /stats
+
+    def _send_json(self, status: int, body: dict[str, Any]) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_json(self) -> dict[str, Any]:
+        length = int(self.headers.get("Content-Length", 0))
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def do_GET(self) -> None:
+        if self.path == "/stats":
+            stats = self.server.stats.get()
+            if self.server.runtime.cache is not None:
+                stats["encoding_cache"] = self.server.runtime.cache.get_stats()
+            self._send_json(200, stats)
+        elif self.path == "/health":
+            self._send_json(200, {"status": "ok"})
+        else:
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self) -> None:
+        start_time = time.perf_counter()
+        try:
+            body = self._read_json()
+            if self.path == "/encode":
+                kind = "encode"
+                texts = [body["text"]] if "text" in body else body["texts"]
+                if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+                    raise ValueError("Pass a string in `text` or a list of strings in `texts`.")
+                rows = self.server.batcher.encode(texts).result()
+                result = {name: [row[name] for row in rows] for name in (rows[0] if rows else {})}
+            elif self.path == "/decode":
+                kind = "decode"
+                token_ids = body["token_ids"]
+                # the sequences have different lengths, the detokenizer input is rectangular
+                futures = [self.server.runtime.submit_decode(np.array([ids], dtype=np.int64)) for ids in token_ids]
+                result = {"texts": [future.result()[0] for future in futures]}
+            else:
+                self._send_json(404, {"error": f"Unknown path {self.path}"})
+                return
+        except (KeyError, TypeError, ValueError) as exc:
+            self.server.stats.add("errors")
+            self._send_json(400, {"error": f"{type(exc).__name__}: {exc}"})
+            return
+        except Exception as exc:
+            self.server.stats.add("errors")
+            self._send_json(500, {"error": f"{type(exc).__name__}: {exc}"})
+            return
+
+        self.server.stats.add(f"{kind}_requests")
+        self.server.stats.add_latency(kind, (time.perf_counter() - start_time) * 1000)
+        self._send_json(200, result)
+
+
+class TokenizerHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], runtime: TokenizerRuntime, batcher: MicroBatcher) -> None:
+        super().__init__(address, TokenizerRequestHandler)
+        self.runtime = runtime
+        self.batcher = batcher
+        self.stats = batcher.stats
+
+
+class TokenizerUnixHTTPServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: Union[str, Path], runtime: TokenizerRuntime, batcher: MicroBatcher) -> None:
+        super().__init__(str(path), TokenizerRequestHandler)
+        self.runtime = runtime
+        self.batcher = batcher
+        self.stats = batcher.stats
+
+    def get_request(self) -> tuple[socket.socket, tuple[str, int]]:
+        # BaseHTTPRequestHandler expects a (host, port) client address
+        request, _ = super().get_request()
+        return request, ("unix", 0)
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: Union[str, Path], timeout: Optional[float] = None) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self.unix_socket_path = str(path)
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.unix_socket_path)
+
+
+class TokenizerClient:
+    """
+    Client of the tokenization service, keeps one connection open.
+
+    :param port: The port of the service on localhost.
+    :type port: Optional[int]
+    :param unix_socket: The Unix socket path of the service.
+    :type unix_socket: Optional[Union[str, Path]]
+    :param host: The host of the service.
+    :type host: str
+    :param timeout: The connection timeout in seconds.
+    :type timeout: Optional[float]
+    """
+
+    def __init__(
+        self,
+        port: Optional[int] = None,
+        unix_socket: Optional[Union[str, Path]] = None,
+        host: str = "127.0.0.1",
+        timeout: Optional[float] = 60.0,
+    ) -> None:
+        if unix_socket is not None:
+            self.connection = UnixHTTPConnection(unix_socket, timeout=timeout)
+        elif port is not None:
+            self.connection = http.client.HTTPConnection(host, port, timeout=timeout)
+        else:
+            raise ValueError("Pass the port or the Unix socket path of the service.")
+
+    def _request(self, method: str, path: str, body: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        data = None if body is None else json.dumps(body)
+        self.connection.request(method, path, body=data, headers={"Content-Type": "application/json"})
+        response = self.connection.getresponse()
+        result = json.loads(response.read())
+        if response.status != 200:
+            raise RuntimeError(f"Tokenization service error {response.status}: {result.get('error')}")
+        return result
+
+    def encode(self, texts: Union[str, list[str]]) -> dict[str, list[list[int]]]:
+        return self._request("POST", "/encode", {"texts": [texts] if isinstance(texts, str) else texts})
+
+    def decode(self, token_ids: list[list[int]]) -> list[str]:
+        return self._request("POST", "/decode", {"token_ids": token_ids})["texts"]
+
+    def stats(self) -> dict[str, Any]:
+        return self._request("GET", "/stats")
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+def load_runtime(
+    model_dir: Path, device: str = "CPU", num_requests: int = 0, cache: Optional[EncodingCache] = None
+) -> TokenizerRuntime:
+    shared_weights_path = model_dir / f"openvino_{SHARED_WEIGHTS_MODEL_NAME}.xml"
+    if shared_weights_path.is_file():
+        return TokenizerRuntime(
+            *read_tokenizers_with_shared_weights(shared_weights_path), device, num_requests=num_requests, cache=cache
+        )
+
+    tokenizer_path = model_dir / f"openvino_{TOKENIZER_NAME}.xml"
+    detokenizer_path = model_dir / f"openvino_{DETOKENIZER_NAME}.xml"
+    if not tokenizer_path.is_file():
+        raise FileNotFoundError(
+            f"No converted tokenizer in {model_dir}, convert it with `openvino_tokenizers convert`."
+        )
+    return TokenizerRuntime(
+        tokenizer_path,
+        detokenizer_path if detokenizer_path.is_file() else None,
+        device,
+        num_requests=num_requests,
+        cache=cache,
+    )
+
+
+def create_server(
+    runtime: TokenizerRuntime,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    unix_socket: Optional[Union[str, Path]] = None,
+    max_batch_size: int = 32,
+    max_wait_ms: float = 2.0,
+) -> Union[TokenizerHTTPServer, TokenizerUnixHTTPServer]:
+    """Creates the server, call `serve_forever` to start it and `shutdown` and `server_close` to stop it."""
+    batcher = MicroBatcher(runtime, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+    if unix_socket is not None:
+        Path(unix_socket).unlink(missing_ok=True)
+        return TokenizerUnixHTTPServer(unix_socket, runtime, batcher)
+    return TokenizerHTTPServer((host, port), runtime, batcher)
+
+
+def _configure_parser(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "model_dir",
+        type=Path,
+        help=(
+            "Directory with openvino_tokenizer.xml and optional openvino_detokenizer.xml, "
+            "or with openvino_tokenizer_detokenizer.xml saved with --shared-weights."
+        ),
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Host to listen on. Default is 127.0.0.1.")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on, 0 to pick a free port.")
+    parser.add_argument(
+        "--unix-socket",
+        "--unix_socket",
+        type=Path,
+        default=None,
+        help="Listen on the Unix socket instead of the TCP port.",
+    )
+    parser.add_argument(
+        "--max-batch-size",
+        "--max_batch_size",
+        type=check_positive_int,
+        default=32,
+        help="The maximum number of texts coalesced into one batch. Default is 32.",
+    )
+    parser.add_argument(
+        "--max-wait-ms",
+        "--max_wait_ms",
+        type=float,
+        default=2.0,
+        help="The maximum time a text waits for other texts to fill the batch. Default is 2 ms.",
+    )
+    parser.add_argument(
+        "--num-requests",
+        "--num_requests",
+        type=int,
+        default=0,
+        help="The number of parallel infer requests, the optimal number for the device is used by default.",
+    )
+    parser.add_argument("--device", default="CPU", help="The device to run the tokenizer on. Default is CPU.")
+    parser.add_argument(
+        "--cache-size-mb",
+        "--cache_size_mb",
+        type=int,
+        default=0,
+        help="The memory limit of the cache of the tokenizer outputs for the repeated texts, disabled by default.",
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="openvino_tokenizers serve",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    _configure_parser(parser)
+    return parser
+
+
+def _raise_keyboard_interrupt(signum: int, frame: Any) -> None:
+    raise KeyboardInterrupt
+
+
+def run(args: argparse.Namespace) -> None:
+    cache = EncodingCache(args.cache_size_mb * 1024**2) if args.cache_size_mb > 0 else None
+    runtime = load_runtime(args.model_dir, args.device, args.num_requests, cache)
+    server = create_server(
+        runtime,
+        host=args.host,
+        port=args.port,
+        unix_socket=args.unix_socket,
+        max_batch_size=args.max_batch_size,
+        max_wait_ms=args.max_wait_ms,
+    )
+    address = args.unix_socket if args.unix_socket is not None else "http://{}:{}".format(*server.server_address)
+    print(f"Serving {args.model_dir} on {address}, {runtime.tokenizer_pool.num_requests} infer requests", flush=True)
+    # a sidecar is stopped with SIGTERM, shut down the same way as on Ctrl+C
+    signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.batcher.close()
+        if args.unix_socket is not None:
+            args.unix_socket.unlink(missing_ok=True)
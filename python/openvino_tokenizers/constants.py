@@ -7,6 +7,11 @@ from enum import Enum
 ATTENTION_MASK_INPUT_NAME = "attention_mask"
 TOKEN_IDS_INPUT_NAME = "input_ids"
 TOKEN_TYPE_IDS_INPUT_NAME = "token_type_ids"
+ROW_OFFSETS_OUTPUT_NAME = "row_offsets"
+TOKEN_COUNT_OUTPUT_NAME = "token_count"
+STRING_BEGINS_INPUT_NAME = "string_begins"
+STRING_ENDS_INPUT_NAME = "string_ends"
+STRING_CHARS_INPUT_NAME = "string_chars"
 
 LOGITS_OUTPUT_NAME = "logits"
 TOKEN_IDS_OUTPUT_NAME = "token_ids"
@@ -31,6 +36,8 @@ GREEDY_DECODER_NAME = "greedy_decoder"
 
 TOKENIZER_NAME = "tokenizer"
 DETOKENIZER_NAME = "detokenizer"
+SHARED_WEIGHTS_MODEL_NAME = f"{TOKENIZER_NAME}_{DETOKENIZER_NAME}"
+SHARED_WEIGHTS_RT_INFO_NAME = "shared_weights"
 
 MIN_CACHE_CAPACITY = 20_000
 VOCAB_SIZE_CACHE_PROPORTION = 0.2
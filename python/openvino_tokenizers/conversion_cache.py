@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from dataclasses import fields
+from pathlib import Path
+from typing import Optional, Union
+
+import openvino
+from openvino import Core, Model, save_model
+
+from .__version__ import __version__ as openvino_tokenizers_version
+from .constants import DETOKENIZER_NAME, TOKENIZER_NAME, rt_info_to_hf_attribute_map
+from .utils import TokenzierConversionParams, get_hf_tokenizer_attribute, get_package_version
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_SIZE_LIMIT = 2 * 1024**3
+CONVERSION_ATTRIBUTES = (
+    "padding_side",
+    "truncation_side",
+    "model_max_length",
+    "add_bos_token",
+    "add_eos_token",
+    "clean_up_tokenization_spaces",
+    "special_tokens_map",
+    "added_tokens_decoder",
+)
+
+
+def get_cache_key(
+    hf_tokenizer: "PreTrainedTokenizerBase",  # noqa
+    params: TokenzierConversionParams,
+) -> Optional[str]:
+    """Computes the cache key of the conversion from the tokenizer files, conversion params and package versions.
+
+    :param hf_tokenizer: The Huggingface tokenizer object.
+    :type hf_tokenizer: transformers.tokenization_utils_base.PreTrainedTokenizerBase
+    :param params: The conversion parameters.
+    :type params: TokenzierConversionParams
+    :return: The hex digest of the key or None if the tokenizer cannot be saved.
+    :rtype: Optional[str]
+    """
+    hasher = hashlib.sha256()
+
+    # the saved files reflect the state of the tokenizer object, including the changes made after loading
+    with tempfile.TemporaryDirectory() as tmpdir:
+        try:
+            hf_tokenizer.save_pretrained(tmpdir)
+        except Exception:
+            logger.debug("Cannot save the tokenizer, skip the conversion cache.", exc_info=True)
+            return None
+
+        for file in sorted(path for path in Path(tmpdir).rglob("*") if path.is_file()):
+            hasher.update(file.relative_to(tmpdir).as_posix().encode())
+            hasher.update(file.read_bytes())
+
+    hasher.update(str(type(hf_tokenizer)).encode())
+    # attributes used by the conversion that are not necessarily saved to the tokenizer files
+    for name in CONVERSION_ATTRIBUTES:
+        hasher.update(f"{name}={getattr(hf_tokenizer, name, None)}".encode())
+    for rt_field_name, hf_attributes in rt_info_to_hf_attribute_map.items():
+        hasher.update(f"{rt_field_name}={get_hf_tokenizer_attribute(hf_tokenizer, hf_attributes)}".encode())
+    for key in fields(params):
+        hasher.update(f"{key.name}={getattr(params, key.name)}".encode())
+
+    hasher.update(f"openvino={openvino.get_version()}".encode())
+    hasher.update(f"openvino_tokenizers={openvino_tokenizers_version}".encode())
+    for name in ["transformers", "tiktoken", "sentencepiece", "tokenizers"]:
+        hasher.update(f"{name}={get_package_version(name)}".encode())
+
+    return hasher.hexdigest()
+
+
+def load_from_cache(cache_dir: Union[str, Path], key: str) -> Optional[Union[Model, tuple[Model, Model]]]:
+    """Reads the converted models from the cache.
+
+    :param cache_dir: The cache directory.
+    :type cache_dir: Union[str, Path]
+    :param key: The cache key from `get_cache_key`.
+    :type key: str
+    :return: The tokenizer model, or a tuple of tokenizer and detokenizer models, None on a cache miss.
+    :rtype: Optional[Union[Model, tuple[Model, Model]]]
+    """
+    entry = Path(cache_dir) / key
+    tokenizer_path = entry / f"openvino_{TOKENIZER_NAME}.xml"
+    detokenizer_path = entry / f"openvino_{DETOKENIZER_NAME}.xml"
+    if not tokenizer_path.is_file():
+        return None
+
+    core = Core()
+    try:
+        ov_tokenizer = core.read_model(tokenizer_path)
+        ov_detokenizer = core.read_model(detokenizer_path) if detokenizer_path.is_file() else None
+    except RuntimeError:
+        logger.warning(f"Cannot read the cached tokenizer from {entry}, converting the tokenizer again.")
+        return None
+
+    # the modification time orders the entries for eviction
+    try:
+        os.utime(entry)
+    except OSError:
+        pass  # read-only cache
+
+    if ov_detokenizer is None:
+        return ov_tokenizer
+    return ov_tokenizer, ov_detokenizer
+
+
+def save_to_cache(
+    cache_dir: Union[str, Path],
+    key: str,
+    ov_tokenizers: Union[Model, tuple[Model, Model]],
+    cache_size_limit: int = DEFAULT_CACHE_SIZE_LIMIT,
+) -> None:
+    """Writes the converted models to the cache and evicts the least recently used entries over the size limit.
+
+    :param cache_dir: The cache directory.
+    :type cache_dir: Union[str, Path]
+    :param key: The cache key from `get_cache_key`.
+    :type key: str
+    :param ov_tokenizers: The tokenizer model, or a tuple of tokenizer and detokenizer models.
+    :type ov_tokenizers: Union[Model, tuple[Model, Model]]
+    :param cache_size_limit: The maximum total size of the cache in bytes, the last added entry is always kept.
+    :type cache_size_limit: int
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    if not isinstance(ov_tokenizers, tuple):
+        ov_tokenizers = (ov_tokenizers,)
+
+    # write to a temporary directory first, so concurrent readers never see a partially written entry
+    tmp_entry = Path(tempfile.mkdtemp(prefix=".tmp-", dir=cache_dir))
+    try:
+        for ov_model, name in zip(ov_tokenizers, (TOKENIZER_NAME, DETOKENIZER_NAME)):
+            save_model(ov_model, tmp_entry / f"openvino_{name}.xml", compress_to_fp16=False)
+        os.replace(tmp_entry, cache_dir / key)
+    except OSError:
+        # the entry has been added by another process
+        logger.debug(f"Cannot add the cache entry {key}.", exc_info=True)
+    finally:
+        shutil.rmtree(tmp_entry, ignore_errors=True)
+
+    evict_cache(cache_dir, cache_size_limit)
+
+
+def evict_cache(cache_dir: Union[str, Path], cache_size_limit: int = DEFAULT_CACHE_SIZE_LIMIT) -> None:
+    """Removes the least recently used cache entries until the total size of the cache fits the limit.
+
+    :param cache_dir: The cache directory.
+    :type cache_dir: Union[str, Path]
+    :param cache_size_limit: The maximum total size of the cache in bytes, the most recently used entry is always kept.
+    :type cache_size_limit: int
+    """
+    entries = []
+    for entry in Path(cache_dir).iterdir():
+        if not entry.is_dir() or entry.name.startswith("."):
+            continue
+        try:
+            size = sum(file.stat().st_size for file in entry.iterdir())
+            entries.append((entry.stat().st_mtime, size, entry))
+        except FileNotFoundError:
+            continue  # removed by another process
+
+    total_size = 0
+    for idx, (_, size, entry) in enumerate(sorted(entries, reverse=True)):
+        total_size += size
+        if idx > 0 and total_size > cache_size_limit:
+            logger.debug(f"Evict the cache entry {entry.name}.")
+            shutil.rmtree(entry, ignore_errors=True)
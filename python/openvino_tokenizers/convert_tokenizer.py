@@ -6,13 +6,22 @@ import logging
 import sys
 from dataclasses import fields
 from functools import wraps
+from inspect import Parameter, signature
+from pathlib import Path
 from typing import Any, Optional, Union
 
 from openvino import Model, Type
 from openvino.exceptions import OVTypeError
 
 from openvino_tokenizers.constants import UTF8ReplaceMode
-from openvino_tokenizers.tokenizer_transformations import add_second_input
+from openvino_tokenizers.conversion_cache import (
+    DEFAULT_CACHE_SIZE_LIMIT,
+    get_cache_key,
+    load_from_cache,
+    save_to_cache,
+)
+from openvino_tokenizers.profiling import ConversionProfiler, profile_stage
+from openvino_tokenizers.tokenizer_transformations import add_second_input, replace_string_input_with_unpacked
 from openvino_tokenizers.utils import (
     TokenzierConversionParams,
     change_inputs_type,
@@ -27,8 +36,18 @@ logger = logging.getLogger(__name__)
 
 
 def capture_arg(func):
+    # keyword-only arguments that are not a part of the conversion params, e.g. cache options
+    conversion_params_names = {key.name for key in fields(TokenzierConversionParams)}
+    extra_arg_names = [
+        name
+        for name, parameter in signature(func).parameters.items()
+        if parameter.kind is Parameter.KEYWORD_ONLY and name not in conversion_params_names
+    ]
+
     @wraps(func)
     def wrapper(*args, **kwargs):
+        extra_kwargs = {name: kwargs.pop(name) for name in extra_arg_names if name in kwargs}
+
         params = None
         if len(args) > 1 and args[1] is not None:
             params = args[1]
@@ -51,7 +70,7 @@ def capture_arg(func):
             params = TokenzierConversionParams(**params)
         if params is None:
             params = TokenzierConversionParams(**kwargs)
-        return func(args[0], params)
+        return func(args[0], params, **extra_kwargs)
 
     # Embed convert_tokenizer docstring with TokenzierConversionParams docstring.
     wrapper.__doc__ = func.__doc__.replace("Returns:", "Returns:\n" + TokenzierConversionParams.__doc__ + "\n")
@@ -70,13 +89,21 @@ def convert_tokenizer(
     tokenizer_output_type: Type = Type.i64,
     detokenizer_input_type: Type = Type.i64,
     streaming_detokenizer: bool = False,
+    stateful_detokenizer: bool = False,
     use_max_padding: bool = False,
+    ragged_output: bool = False,
+    token_count_output: bool = False,
+    deduplicate_inputs: bool = False,
     truncation: bool = False,
     handle_special_tokens_with_re: Optional[bool] = None,
     use_sentencepiece_backend: bool = False,
     utf8_replace_mode: Optional[UTF8ReplaceMode] = UTF8ReplaceMode.REPLACE,
     max_length: Optional[int] = None,
     number_of_inputs: int = 1,
+    unpacked_string_input: bool = False,
+    cache_dir: Optional[Union[str, Path]] = None,
+    cache_size_limit: int = DEFAULT_CACHE_SIZE_LIMIT,
+    profile_report: Optional[Union[str, Path]] = None,
 ) -> Union[Model, tuple[Model, Model]]:
     """
     Converts a given tokenizer object into an OpenVINO-compatible model.
@@ -94,11 +121,33 @@ def convert_tokenizer(
     params : TokenzierConversionParams, optional
         If provided, the `TokenzierConversionParams` object containing conversion parameters.
         If not provided, the parameters will be constructed from the other keyword arguments.
+
+    cache_dir : Union[str, Path], optional
+        The directory to cache converted models in. The cache entry is identified by the tokenizer files,
+        conversion parameters and package versions, on a cache hit the models are read from the directory
+        instead of the conversion. Default is None, the cache is not used.
+
+    cache_size_limit : int
+        The maximum total size of the cache directory in bytes, the least recently used models are removed
+        when it is exceeded. Default is 2 GiB.
+
+    profile_report : Union[str, Path], optional
+        The path to write the JSON profiling report to. The report contains the wall time and peak memory
+        of the parser stages, pipeline finalization, `get_ov_subgraph` of each step and cache serialization.
+        Memory tracing slows down the conversion. Default is None, the conversion is not profiled.
     Returns:
     --------
     Union[Model, Tuple[Model, Model]]
         The converted tokenizer model, or a tuple tokenizer and detokenizer depending on with_detokenizer value.
     """
+    if profile_report is not None:
+        with ConversionProfiler() as profiler, profiler.stage("convert_tokenizer", kind="conversion"):
+            ov_tokenizers = convert_tokenizer(
+                tokenizer_object, params, cache_dir=cache_dir, cache_size_limit=cache_size_limit
+            )
+        profiler.save_report(profile_report)
+        return ov_tokenizers
+
     ov_tokenizers = None
 
     if "transformers" not in sys.modules:
@@ -108,21 +157,31 @@ def convert_tokenizer(
             "2. pip install transformers[sentencepiece] tiktoken\n"
         )
 
-    from transformers import PreTrainedTokenizerBase, PreTrainedTokenizerFast
+    with profile_stage("imports", kind="loading"):
+        from transformers import PreTrainedTokenizerBase, PreTrainedTokenizerFast
 
-    from .hf_parser import (
-        convert_fast_tokenizer,
-        convert_sentencepiece_model_tokenizer,
-        convert_tiktoken_model_tokenizer,
-        is_sentencepiece_model,
-        is_tiktoken_model,
-    )
+        from .hf_parser import (
+            convert_fast_tokenizer,
+            convert_sentencepiece_model_tokenizer,
+            convert_tiktoken_model_tokenizer,
+            is_sentencepiece_model,
+            is_tiktoken_model,
+        )
 
     # For some reason dataclass transforms None -> (None,)
     if params.max_length and params.max_length != (None,):
         tokenizer_object.model_max_length = params.max_length
 
-    can_use_sentencepiece = is_sentencepiece_model(tokenizer_object)
+    cache_key = None
+    if cache_dir is not None and isinstance(tokenizer_object, PreTrainedTokenizerBase):
+        with profile_stage("cache_key", kind="cache"):
+            cache_key = get_cache_key(tokenizer_object, params)
+        if cache_key is not None and (cached := load_from_cache(cache_dir, cache_key)) is not None:
+            logger.info(f"Read converted tokenizer from the cache: {cache_dir}")
+            return cached
+
+    with profile_stage("sentencepiece_model", kind="loading"):
+        can_use_sentencepiece = is_sentencepiece_model(tokenizer_object)
     if isinstance(tokenizer_object, PreTrainedTokenizerBase):
         if can_use_sentencepiece and (not tokenizer_object.is_fast or params.use_sentencepiece_backend):
             logger.info("Convert tokenizer using SentencePiece .model file.")
@@ -136,18 +195,170 @@ def convert_tokenizer(
         else:
             raise OVTypeError(f"Huggingface tokenizer type is not supported: {type(tokenizer_object)}")
 
-        for model in ov_tokenizers if isinstance(ov_tokenizers, tuple) else [ov_tokenizers]:
-            update_rt_info_with_params(model, tokenizer_object, params)
-            update_rt_info_with_environment(model)
-            update_rt_info_with_processor_template(model, tokenizer_object)
+        with profile_stage("rt_info", kind="rt_info"):
+            for model in ov_tokenizers if isinstance(ov_tokenizers, tuple) else [ov_tokenizers]:
+                update_rt_info_with_params(model, tokenizer_object, params)
+                update_rt_info_with_environment(model)
+                update_rt_info_with_processor_template(model, tokenizer_object)
 
     if ov_tokenizers is None:
         raise OVTypeError(f"Tokenizer type is not supported: {type(tokenizer_object)}")
 
+    ov_tokenizers = apply_io_params(ov_tokenizers, params)
+
+    if cache_key is not None:
+        with profile_stage("serialization", kind="cache"):
+            save_to_cache(cache_dir, cache_key, ov_tokenizers, cache_size_limit)
+
+    return ov_tokenizers
+
+
+@capture_arg
+def convert_tokenizer_json(
+    tokenizer_json: Union[str, Path, dict[str, Any]],
+    params: Union[TokenzierConversionParams, dict] = None,
+    *,
+    with_detokenizer: bool = False,
+    add_special_tokens: bool = True,
+    skip_special_tokens: bool = True,
+    clean_up_tokenization_spaces: Optional[bool] = None,
+    tokenizer_output_type: Type = Type.i64,
+    detokenizer_input_type: Type = Type.i64,
+    streaming_detokenizer: bool = False,
+    stateful_detokenizer: bool = False,
+    use_max_padding: bool = False,
+    ragged_output: bool = False,
+    token_count_output: bool = False,
+    deduplicate_inputs: bool = False,
+    truncation: bool = False,
+    handle_special_tokens_with_re: Optional[bool] = None,
+    use_sentencepiece_backend: bool = False,
+    utf8_replace_mode: Optional[UTF8ReplaceMode] = UTF8ReplaceMode.REPLACE,
+    max_length: Optional[int] = None,
+    number_of_inputs: int = 1,
+    unpacked_string_input: bool = False,
+    tokenizer_config: Optional[dict[str, Any]] = None,
+) -> Union[Model, tuple[Model, Model]]:
+    """
+    Converts a Huggingface tokenizer.json into an OpenVINO-compatible model without the transformers library.
+
+    The tokenizer pipeline is built from tokenizer.json the same way as for the Huggingface fast tokenizer,
+    the tokenizer attributes, such as special tokens, padding side and max length, are read from
+    tokenizer_config.json and special_tokens_map.json next to tokenizer.json. BPE tokenizers clean up
+    the tokenization spaces the same way as the installed transformers version, or as transformers>=5.7
+    when it is not installed.
+
+    Parameters:
+    -----------
+    tokenizer_json : Union[str, Path, dict[str, Any]]
+        The path to the tokenizer.json file, the path to the directory with the tokenizer files
+        or the parsed content of tokenizer.json.
+
+    params : TokenzierConversionParams, optional
+        If provided, the `TokenzierConversionParams` object containing conversion parameters.
+        If not provided, the parameters will be constructed from the other keyword arguments.
+        `use_sentencepiece_backend` is not supported.
+
+    tokenizer_config : dict[str, Any], optional
+        The content of tokenizer_config.json, used instead of the files next to tokenizer.json.
+    Returns:
+    --------
+    Union[Model, Tuple[Model, Model]]
+        The converted tokenizer model, or a tuple tokenizer and detokenizer depending on with_detokenizer value.
+    """
+    from .hf_parser import TokenizerJson, convert_fast_tokenizer
+
+    if params.use_sentencepiece_backend:
+        raise OVTypeError("SentencePiece backend requires the Huggingface tokenizer object, use `convert_tokenizer`.")
+
+    if isinstance(tokenizer_json, dict):
+        tokenizer_object = TokenizerJson(tokenizer_json, tokenizer_config)
+    else:
+        tokenizer_object = TokenizerJson.from_pretrained(tokenizer_json)
+        if tokenizer_config is not None:
+            tokenizer_object = TokenizerJson(tokenizer_object.tokenizer_json, tokenizer_config)
+
+    # For some reason dataclass transforms None -> (None,)
+    if params.max_length and params.max_length != (None,):
+        tokenizer_object.model_max_length = params.max_length
+
+    logger.info("Convert tokenizer.json pipeline.")
+    ov_tokenizers = convert_fast_tokenizer(tokenizer_object, params)
+    for model in ov_tokenizers if isinstance(ov_tokenizers, tuple) else [ov_tokenizers]:
+        update_rt_info_with_params(model, tokenizer_object, params)
+        update_rt_info_with_environment(model)
+        update_rt_info_with_processor_template(model, tokenizer_object)
+
+    return apply_io_params(ov_tokenizers, params)
+
+
+@capture_arg
+def convert_gguf_tokenizer(
+    gguf_path: Union[str, Path],
+    params: Union[TokenzierConversionParams, dict] = None,
+    *,
+    with_detokenizer: bool = False,
+    add_special_tokens: bool = True,
+    skip_special_tokens: bool = True,
+    clean_up_tokenization_spaces: Optional[bool] = None,
+    tokenizer_output_type: Type = Type.i64,
+    detokenizer_input_type: Type = Type.i64,
+    streaming_detokenizer: bool = False,
+    stateful_detokenizer: bool = False,
+    use_max_padding: bool = False,
+    ragged_output: bool = False,
+    token_count_output: bool = False,
+    deduplicate_inputs: bool = False,
+    truncation: bool = False,
+    handle_special_tokens_with_re: Optional[bool] = None,
+    use_sentencepiece_backend: bool = False,
+    utf8_replace_mode: Optional[UTF8ReplaceMode] = UTF8ReplaceMode.REPLACE,
+    max_length: Optional[int] = None,
+    number_of_inputs: int = 1,
+    unpacked_string_input: bool = False,
+) -> Union[Model, tuple[Model, Model]]:
+    """
+    Converts the tokenizer stored in a GGUF model file into an OpenVINO-compatible model.
+
+    Only the metadata section of the file is read, the tokenizer pipeline is built from the `tokenizer.ggml.*`
+    keys without the transformers and gguf libraries. Byte-level BPE, SentencePiece BPE and Unigram
+    tokenizer models are supported.
+
+    Parameters:
+    -----------
+    gguf_path : Union[str, Path]
+        The path to the GGUF file.
+
+    params : TokenzierConversionParams, optional
+        If provided, the `TokenzierConversionParams` object containing conversion parameters.
+        If not provided, the parameters will be constructed from the other keyword arguments.
+        `use_sentencepiece_backend` is not supported.
+    Returns:
+    --------
+    Union[Model, Tuple[Model, Model]]
+        The converted tokenizer model, or a tuple tokenizer and detokenizer depending on with_detokenizer value.
+    """
+    from .gguf_parser import gguf_to_tokenizer_json, read_gguf_tokenizer_metadata
+
+    logger.info("Read GGUF tokenizer metadata.")
+    tokenizer_json, tokenizer_config = gguf_to_tokenizer_json(read_gguf_tokenizer_metadata(gguf_path))
+    return convert_tokenizer_json(tokenizer_json, params, tokenizer_config=tokenizer_config)
+
+
+def apply_io_params(
+    ov_tokenizers: Union[Model, tuple[Model, Model]], params: TokenzierConversionParams
+) -> Union[Model, tuple[Model, Model]]:
     assert params.number_of_inputs in [1, 2], "Number of inputs should be 1 or 2"
 
+    ov_tokenizer = ov_tokenizers[0] if isinstance(ov_tokenizers, tuple) else ov_tokenizers
     if params.number_of_inputs == 2:
-        add_second_input(ov_tokenizers[0] if isinstance(ov_tokenizers, tuple) else ov_tokenizers)
+        if params.unpacked_string_input:
+            raise ValueError("Unpacked string input is not supported for the tokenizers with two inputs.")
+        if params.token_count_output:
+            raise ValueError("Token count output is not supported for the tokenizers with two inputs.")
+        add_second_input(ov_tokenizer)
+    if params.unpacked_string_input:
+        replace_string_input_with_unpacked(ov_tokenizer)
 
     if isinstance(ov_tokenizers, tuple):
         return (
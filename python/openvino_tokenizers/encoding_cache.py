@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+import hashlib
+import sys
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Optional, Union
+
+import numpy as np
+from openvino import CompiledModel, Model, Node, OVAny
+
+
+DEFAULT_ENCODING_CACHE_SIZE = 256 * 1024**2
+
+
+def get_rt_info_items(rt_info: dict[str, Any], path: tuple[str, ...] = ()) -> list[tuple[str, str]]:
+    items = []
+    for key, value in sorted(rt_info.items()):
+        if isinstance(value, dict) and value:
+            items.extend(get_rt_info_items(value, (*path, key)))
+        else:
+            items.append(("/".join((*path, key)), str(value.value if isinstance(value, OVAny) else value)))
+    return items
+
+
+def hash_constant(hasher: Any, constant: Node) -> None:
+    data = constant.get_data()
+    hasher.update(f"constant={constant.get_element_type()}:{list(data.shape)}".encode())
+    if data.dtype.kind in "OUS":
+        for value in data.ravel():
+            value = value if isinstance(value, bytes) else str(value).encode()
+            hasher.update(len(value).to_bytes(8, "little") + value)
+    else:
+        hasher.update(np.ascontiguousarray(data).data)
+
+
+def get_model_cache_key(model: Union[Model, CompiledModel]) -> str:
+    """Computes the key of the tokenizer outputs from the model graph, constants and rt_info.
+
+    The constants hold the vocab, merges and the other tokenizer data, so the models converted with the same
+    parameters from different tokenizers get different keys. The compiled model has neither the constants
+    nor the rt_info, so each call returns a new key for it and its outputs are not shared with the other
+    runtimes. Pass the `openvino.Model` or the path to the runtime to share the cached outputs between
+    the runtimes.
+
+    :param model: The tokenizer model.
+    :type model: Union[openvino.Model, openvino.CompiledModel]
+    :return: The hex digest of the key.
+    :rtype: str
+    """
+    hasher = hashlib.sha256()
+    if isinstance(model, CompiledModel):
+        # the object id can be reused by a new model after this one is deleted, while the cache outlives it
+        hasher.update(f"compiled_model={uuid.uuid4()}".encode())
+        return hasher.hexdigest()
+
+    for node in model.get_ordered_ops():
+        hasher.update(f"node={node.get_type_name()}".encode())
+        if node.get_type_name() == "Constant":
+            hash_constant(hasher, node)
+    for name, value in get_rt_info_items(model.get_rt_info()):
+        hasher.update(f"{name}={value}".encode())
+    for output in model.outputs:
+        hasher.update(f"output={output.get_any_name()}:{output.get_element_type()}".encode())
+    return hasher.hexdigest()
+
+
+class EncodingCache:
+    """
+    LRU cache of the tokenizer outputs for each text, bounded by the memory of the cached arrays and texts.
+
+    The cache is thread-safe and can be shared by several runtimes, the outputs are keyed by the text
+    and the model key from `get_model_cache_key`.
+
+    :param max_size_bytes: The maximum memory of the cached outputs, the least recently used outputs are evicted
+        to fit the new ones.
+    :type max_size_bytes: int
+    """
+
+    def __init__(self, max_size_bytes: int = DEFAULT_ENCODING_CACHE_SIZE) -> None:
+        if max_size_bytes <= 0:
+            raise ValueError(f"Cache size should be positive, got {max_size_bytes}.")
+        self.max_size_bytes = max_size_bytes
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple[str, str], tuple[dict[str, np.ndarray], int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def get_entry_size(text: str, outputs: dict[str, np.ndarray]) -> int:
+        return sys.getsizeof(text) + sum(output.nbytes for output in outputs.values())
+
+    def get(self, model_key: str, text: str) -> Optional[dict[str, np.ndarray]]:
+        """Returns the cached outputs of the text or None, the cached arrays should not be modified."""
+        with self._lock:
+            entry = self._entries.get((model_key, text))
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((model_key, text))
+            self.hits += 1
+            return entry[0]
+
+    def put(self, model_key: str, text: str, outputs: dict[str, np.ndarray]) -> None:
+        """Caches the outputs of the text, the outputs larger than the cache are not cached."""
+        entry_size = self.get_entry_size(text, outputs)
+        if entry_size > self.max_size_bytes:
+            return
+
+        with self._lock:
+            old_entry = self._entries.pop((model_key, text), None)
+            if old_entry is not None:
+                self.size_bytes -= old_entry[1]
+            while self._entries and self.size_bytes + entry_size > self.max_size_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size_bytes -= evicted_size
+                self.evictions += 1
+            self._entries[(model_key, text)] = (outputs, entry_size)
+            self.size_bytes += entry_size
+
+    def clear(self) -> None:
+        """Removes the cached outputs, the counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get_stats(self) -> dict[str, Union[int, float]]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self.size_bytes,
+                "max_size_bytes": self.max_size_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hit_rate,
+            }
@@ -0,0 +1,500 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+import base64
+import logging
+import re
+import struct
+from enum import IntEnum
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import numpy as np
+from openvino.exceptions import OVTypeError
+
+from .constants import ATTENTION_MASK_INPUT_NAME, TOKEN_IDS_INPUT_NAME
+from .utils import unicode_to_bytes
+
+
+logger = logging.getLogger(__name__)
+
+GGUF_MAGIC = b"GGUF"
+# v1 used 32-bit counts and is not produced by the current llama.cpp
+SUPPORTED_GGUF_VERSIONS = (2, 3)
+
+
+class GGUFValueType(IntEnum):
+    UINT8 = 0
+    INT8 = 1
+    UINT16 = 2
+    INT16 = 3
+    UINT32 = 4
+    INT32 = 5
+    FLOAT32 = 6
+    BOOL = 7
+    STRING = 8
+    ARRAY = 9
+    UINT64 = 10
+    INT64 = 11
+    FLOAT64 = 12
+
+
+GGUF_SCALAR_DTYPES = {
+    GGUFValueType.UINT8: np.dtype("<u1"),
+    GGUFValueType.INT8: np.dtype("<i1"),
+    GGUFValueType.UINT16: np.dtype("<u2"),
+    GGUFValueType.INT16: np.dtype("<i2"),
+    GGUFValueType.UINT32: np.dtype("<u4"),
+    GGUFValueType.INT32: np.dtype("<i4"),
+    GGUFValueType.FLOAT32: np.dtype("<f4"),
+    GGUFValueType.BOOL: np.dtype("?"),
+    GGUFValueType.UINT64: np.dtype("<u8"),
+    GGUFValueType.INT64: np.dtype("<i8"),
+    GGUFValueType.FLOAT64: np.dtype("<f8"),
+}
+
+
+# llama.cpp token types, tokenizer.ggml.token_type
+class GGUFTokenType(IntEnum):
+    NORMAL = 1
+    UNKNOWN = 2
+    CONTROL = 3
+    USER_DEFINED = 4
+    UNUSED = 5
+    BYTE = 6
+
+
+# llama.cpp special token keys, spelled as in llama.cpp
+GGUF_SPECIAL_TOKEN_KEYS = {
+    "bos_token": "tokenizer.ggml.bos_token_id",
+    "eos_token": "tokenizer.ggml.eos_token_id",
+    "unk_token": "tokenizer.ggml.unknown_token_id",
+    "sep_token": "tokenizer.ggml.seperator_token_id",
+    "pad_token": "tokenizer.ggml.padding_token_id",
+    "mask_token": "tokenizer.ggml.mask_token_id",
+}
+
+# the defaults of llama.cpp for the tokenizer models: (add_bos_token, add_eos_token)
+GGUF_ADD_SPECIAL_TOKENS_DEFAULTS = {
+    "gpt2": (False, False),
+    "llama": (True, False),
+    "gemma4": (True, False),
+    "t5": (False, True),
+}
+
+LLAMA3_SPLIT_REGEX = (
+    r"(?i:'s|'t|'re|'ve|'m|'ll|'d)|[^\r\n\p{L}\p{N}]?\p{L}+|\p{N}{1,3}"
+    r"| ?[^\s\p{L}\p{N}]+[\r\n]*|\s*[\r\n]+|\s+(?!\S)|\s+"
+)
+QWEN2_SPLIT_REGEX = (
+    r"(?i:'s|'t|'re|'ve|'m|'ll|'d)|[^\r\n\p{L}\p{N}]?\p{L}+|\p{N}"
+    r"| ?[^\s\p{L}\p{N}]+[\r\n]*|\s*[\r\n]+|\s+(?!\S)|\s+"
+)
+QWEN35_SPLIT_REGEX = (
+    r"(?i:'s|'t|'re|'ve|'m|'ll|'d)|[^\r\n\p{L}\p{N}]?[\p{L}\p{M}]+|\p{N}"
+    r"| ?[^\s\p{L}\p{M}\p{N}]+[\r\n]*|\s*[\r\n]+|\s+(?!\S)|\s+"
+)
+TEKKEN_SPLIT_REGEX = (
+    r"[^\r\n\p{L}\p{N}]?[\p{Lu}\p{Lt}\p{Lm}\p{Lo}\p{M}]*[\p{Ll}\p{Lm}\p{Lo}\p{M}]+"
+    r"|[^\r\n\p{L}\p{N}]?[\p{Lu}\p{Lt}\p{Lm}\p{Lo}\p{M}]+[\p{Ll}\p{Lm}\p{Lo}\p{M}]*"
+    r"|\p{N}| ?[^\s\p{L}\p{N}]+[\r\n/]*|\s*[\r\n]+|\s+(?!\S)|\s+"
+)
+GPT4O_SPLIT_REGEX = (
+    r"[^\r\n\p{L}\p{N}]?[\p{Lu}\p{Lt}\p{Lm}\p{Lo}\p{M}]*[\p{Ll}\p{Lm}\p{Lo}\p{M}]+(?i:'s|'t|'re|'ve|'m|'ll|'d)?"
+    r"|[^\r\n\p{L}\p{N}]?[\p{Lu}\p{Lt}\p{Lm}\p{Lo}\p{M}]+[\p{Ll}\p{Lm}\p{Lo}\p{M}]*(?i:'s|'t|'re|'ve|'m|'ll|'d)?"
+    r"|\p{N}{1,3}| ?[^\s\p{L}\p{N}]+[\r\n/]*|\s*[\r\n]+|\s+(?!\S)|\s+"
+)
+
+# tokenizer.ggml.pre values of byte-level tokenizers that do not use the GPT-2 split regex
+GGUF_PRE_TOKENIZER_SPLIT_REGEXES = {
+    "llama3": LLAMA3_SPLIT_REGEX,
+    "llama-v3": LLAMA3_SPLIT_REGEX,
+    "llama-bpe": LLAMA3_SPLIT_REGEX,
+    "falcon3": LLAMA3_SPLIT_REGEX,
+    "falcon-h1": LLAMA3_SPLIT_REGEX,
+    "pixtral": LLAMA3_SPLIT_REGEX,
+    "midm-2.0": LLAMA3_SPLIT_REGEX,
+    "lfm2": LLAMA3_SPLIT_REGEX,
+    "dbrx": LLAMA3_SPLIT_REGEX,
+    "smaug-bpe": LLAMA3_SPLIT_REGEX,
+    "tekken": TEKKEN_SPLIT_REGEX,
+    "qwen2": QWEN2_SPLIT_REGEX,
+    "deepseek-r1-qwen": QWEN2_SPLIT_REGEX,
+    "megrez": QWEN2_SPLIT_REGEX,
+    "qwen35": QWEN35_SPLIT_REGEX,
+    "gpt-4o": GPT4O_SPLIT_REGEX,
+    "llama4": GPT4O_SPLIT_REGEX,
+    "minimax-m2": GPT4O_SPLIT_REGEX,
+}
+
+# SentencePiece BPE tokenizers with the Gemma layout: spaces are replaced in the normalizer, no prefix space
+GEMMA_ARCHITECTURES = {"gemma", "gemma2", "gemma3"}
+# SentencePiece BPE tokenizers that prepend the prefix space in the normalizer
+PREPEND_NORMALIZER_ARCHITECTURES = {"phi3"}
+
+T5_EXTRA_IDS_COUNT = 100
+T5_EXTRA_ID_PLACEHOLDER = re.compile(r"^\[PAD\d+\]$")
+
+
+class GGUFReader:
+    """
+    Reads the metadata section of a GGUF file.
+
+    The file is memory-mapped, numeric arrays, such as token scores and types, are returned as read-only views
+    of the mapped file without copying. The tensor data is never read.
+
+    :param path: The path to the GGUF file.
+    :type path: Union[str, Path]
+    :param string_array_keys: The keys of the string arrays to decode, the other string arrays are skipped
+        and replaced with their lengths. If None, all string arrays are decoded.
+    :type string_array_keys: Optional[set[str]]
+    """
+
+    def __init__(self, path: Union[str, Path], string_array_keys: Optional[set[str]] = None) -> None:
+        self.path = Path(path)
+        self.string_array_keys = string_array_keys
+        self.data = np.memmap(self.path, dtype=np.uint8, mode="r")
+        # struct and str work with the memoryview much faster than with the numpy array
+        self.buffer = memoryview(self.data)
+
+        if self.buffer[:4] != GGUF_MAGIC:
+            raise ValueError(f"{self.path} is not a GGUF file.")
+
+        self.version, self.tensor_count, self.kv_count = struct.unpack_from("<IQQ", self.buffer, 4)
+        if self.version not in SUPPORTED_GGUF_VERSIONS:
+            raise ValueError(
+                f"GGUF version {self.version} of {self.path} is not supported, "
+                f"supported versions: {SUPPORTED_GGUF_VERSIONS}."
+            )
+
+    def read_metadata(self) -> dict[str, Any]:
+        """
+        Reads all key-value pairs of the metadata section.
+
+        :return: The metadata, string arrays are lists of str, numeric arrays are numpy arrays.
+        :rtype: dict[str, Any]
+        """
+        offset = 24  # magic, version, tensor count and kv count
+        metadata = {}
+        for _ in range(self.kv_count):
+            key, offset = self._read_string(offset)
+            (value_type,) = struct.unpack_from("<I", self.buffer, offset)
+            metadata[key], offset = self._read_value(offset + 4, value_type, key)
+        return metadata
+
+    def _read_string(self, offset: int) -> tuple[str, int]:
+        (length,) = struct.unpack_from("<Q", self.buffer, offset)
+        offset += 8
+        return str(self.buffer[offset : offset + length], "utf-8", "replace"), offset + length
+
+    def _read_value(self, offset: int, value_type: int, key: str) -> tuple[Any, int]:
+        if value_type == GGUFValueType.STRING:
+            return self._read_string(offset)
+
+        if value_type != GGUFValueType.ARRAY:
+            dtype = self._get_dtype(value_type)
+            return self.data[offset : offset + dtype.itemsize].view(dtype)[0].item(), offset + dtype.itemsize
+
+        element_type, count = struct.unpack_from("<IQ", self.buffer, offset)
+        offset += 12
+
+        if element_type == GGUFValueType.STRING:
+            if self.string_array_keys is not None and key not in self.string_array_keys:
+                # the strings have variable length, walk through them without decoding
+                for _ in range(count):
+                    (length,) = struct.unpack_from("<Q", self.buffer, offset)
+                    offset += 8 + length
+                return count, offset
+
+            values = []
+            for _ in range(count):
+                value, offset = self._read_string(offset)
+                values.append(value)
+            return values, offset
+
+        dtype = self._get_dtype(element_type)
+        end = offset + dtype.itemsize * count
+        return self.data[offset:end].view(dtype), end
+
+    def _get_dtype(self, value_type: int) -> np.dtype:
+        try:
+            return GGUF_SCALAR_DTYPES[GGUFValueType(value_type)]
+        except (KeyError, ValueError):
+            raise ValueError(f"Unsupported GGUF value type {value_type} in {self.path}.") from None
+
+
+def read_gguf_tokenizer_metadata(path: Union[str, Path]) -> dict[str, Any]:
+    """
+    Reads the tokenizer metadata from a GGUF file, skipping the string arrays that are not related to the tokenizer.
+
+    :param path: The path to the GGUF file.
+    :type path: Union[str, Path]
+    :return: The metadata of the file.
+    :rtype: dict[str, Any]
+    """
+    string_array_keys = {"tokenizer.ggml.tokens", "tokenizer.ggml.merges"}
+    return GGUFReader(path, string_array_keys).read_metadata()
+
+
+def generate_merges(tokens: list[str], scores: Union[np.ndarray, list[float]]) -> list[list[str]]:
+    """
+    Restores the BPE merges of a SentencePiece model from its vocab and scores.
+
+    Every split of a token into two vocab tokens is a merge, merges with higher token score are applied first.
+    Follows the `generate_merges` from the transformers library.
+    """
+    vocab = {token: idx for idx, token in enumerate(tokens)}
+    token_scores = dict(zip(tokens, scores.tolist() if isinstance(scores, np.ndarray) else scores))
+
+    merges = []
+    for token, score in token_scores.items():
+        local = []
+        for idx in range(1, len(token)):
+            left, right = token[:idx], token[idx:]
+            if left in vocab and right in vocab:
+                local.append((left, right, score))
+        local.sort(key=lambda merge: (vocab[merge[0]], vocab[merge[1]]))
+        merges.extend(local)
+
+    merges.sort(key=lambda merge: (merge[2], len(merge[0]), len(merge[1])), reverse=True)
+    return [[left, right] for left, right, _ in merges]
+
+
+def get_template_processing(prefix_tokens: list[tuple[str, int]], suffix_tokens: list[tuple[str, int]]) -> dict:
+    def get_template(sequence_id: str, type_id: int) -> list[dict[str, Any]]:
+        return [
+            *({"SpecialToken": {"id": token, "type_id": type_id}} for token, _ in prefix_tokens),
+            {"Sequence": {"id": sequence_id, "type_id": type_id}},
+            *({"SpecialToken": {"id": token, "type_id": type_id}} for token, _ in suffix_tokens),
+        ]
+
+    return {
+        "type": "TemplateProcessing",
+        "single": get_template("A", 0),
+        "pair": get_template("A", 0) + get_template("B", 1),
+        "special_tokens": {
+            token: {"id": token, "ids": [idx], "tokens": [token]} for token, idx in prefix_tokens + suffix_tokens
+        },
+    }
+
+
+def get_metaspace(prepend_scheme: str, split: bool) -> dict[str, Any]:
+    return {"type": "Metaspace", "replacement": "▁", "prepend_scheme": prepend_scheme, "split": split}
+
+
+def build_byte_level_bpe(metadata: dict[str, Any], tokens: list[str]) -> dict[str, Any]:
+    split_regex = GGUF_PRE_TOKENIZER_SPLIT_REGEXES.get(metadata.get("tokenizer.ggml.pre"))
+    if split_regex is not None:
+        pre_tokenizer = {
+            "type": "Sequence",
+            "pretokenizers": [
+                {"type": "Split", "pattern": {"Regex": split_regex}, "behavior": "Isolated", "invert": False},
+                {"type": "ByteLevel", "add_prefix_space": False, "trim_offsets": True, "use_regex": False},
+            ],
+        }
+    else:
+        pre_tokenizer = {"type": "ByteLevel", "add_prefix_space": False, "trim_offsets": True, "use_regex": True}
+
+    return {
+        "normalizer": None,
+        "pre_tokenizer": pre_tokenizer,
+        "decoder": {"type": "ByteLevel", "add_prefix_space": True, "trim_offsets": True, "use_regex": True},
+        "model": {
+            "type": "BPE",
+            "dropout": None,
+            "unk_token": None,
+            "continuing_subword_prefix": "",
+            "end_of_word_suffix": "",
+            "fuse_unk": False,
+            "byte_fallback": False,
+            "ignore_merges": False,
+            "vocab": {token: idx for idx, token in enumerate(tokens)},
+            "merges": metadata["tokenizer.ggml.merges"],
+        },
+    }
+
+
+def build_sentencepiece_bpe(metadata: dict[str, Any], tokens: list[str], unk_token: Optional[str]) -> dict[str, Any]:
+    architecture = metadata.get("general.architecture")
+    is_gemma = architecture in GEMMA_ARCHITECTURES or metadata["tokenizer.ggml.model"] == "gemma4"
+    add_prefix_space = metadata.get("tokenizer.ggml.add_space_prefix", True)
+
+    merges = metadata.get("tokenizer.ggml.merges")
+    if merges is None:
+        logger.info("GGUF file has no merges, restore them from the vocab.")
+        if architecture in GEMMA_ARCHITECTURES:
+            # Gemma scores do not follow the merge order, the order of the tokens in the vocab does
+            merges = generate_merges(tokens, -np.arange(len(tokens)))
+        else:
+            merges = generate_merges(tokens, metadata["tokenizer.ggml.scores"])
+
+    decoders = [
+        {"type": "Replace", "pattern": {"String": "▁"}, "content": " "},
+        {"type": "ByteFallback"},
+        {"type": "Fuse"},
+    ]
+    if is_gemma:
+        normalizer = {"type": "Replace", "pattern": {"String": " "}, "content": "▁"}
+        pre_tokenizer = {
+            "type": "Split",
+            "pattern": {"String": " "},
+            "behavior": "MergedWithPrevious",
+            "invert": False,
+        }
+    elif architecture in PREPEND_NORMALIZER_ARCHITECTURES:
+        normalizer = {
+            "type": "Sequence",
+            "normalizers": [
+                {"type": "Prepend", "prepend": "▁"},
+                {"type": "Replace", "pattern": {"String": " "}, "content": "▁"},
+            ],
+        }
+        pre_tokenizer = None
+        decoders.append({"type": "Strip", "content": " ", "start": 1, "stop": 0})
+    else:
+        normalizer = None
+        pre_tokenizer = get_metaspace("first" if add_prefix_space else "never", split=False)
+        if add_prefix_space:
+            decoders.append({"type": "Strip", "content": " ", "start": 1, "stop": 0})
+
+    return {
+        "normalizer": normalizer,
+        "pre_tokenizer": pre_tokenizer,
+        "decoder": {"type": "Sequence", "decoders": decoders},
+        "model": {
+            "type": "BPE",
+            "dropout": None,
+            "unk_token": unk_token,
+            "continuing_subword_prefix": None,
+            "end_of_word_suffix": None,
+            "fuse_unk": True,
+            "byte_fallback": True,
+            "ignore_merges": False,
+            "vocab": {token: idx for idx, token in enumerate(tokens)},
+            "merges": merges,
+        },
+    }
+
+
+def build_unigram(metadata: dict[str, Any], tokens: list[str], unk_id: Optional[int]) -> dict[str, Any]:
+    prepend_scheme = "always" if metadata.get("tokenizer.ggml.add_space_prefix", True) else "never"
+
+    normalizer = None
+    if (precompiled_charsmap := metadata.get("tokenizer.ggml.precompiled_charsmap")) is not None:
+        normalizer = {
+            "type": "Precompiled",
+            "precompiled_charsmap": base64.b64encode(np.asarray(precompiled_charsmap).tobytes()).decode(),
+        }
+
+    return {
+        "normalizer": normalizer,
+        "pre_tokenizer": {
+            "type": "Sequence",
+            "pretokenizers": [{"type": "WhitespaceSplit"}, get_metaspace(prepend_scheme, split=True)],
+        },
+        "decoder": get_metaspace(prepend_scheme, split=True),
+        "model": {
+            "type": "Unigram",
+            "unk_id": unk_id,
+            "byte_fallback": False,
+            "vocab": [[token, score] for token, score in zip(tokens, metadata["tokenizer.ggml.scores"].tolist())],
+        },
+    }
+
+
+def gguf_to_tokenizer_json(metadata: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    Builds the content of tokenizer.json and tokenizer_config.json from the GGUF tokenizer metadata.
+
+    Supports the byte-level BPE (`gpt2`), SentencePiece BPE (`llama`, `gemma4`) and Unigram (`t5`) tokenizer
+    models. The tokenizers are built the same way as in the GGUF integration of the transformers library,
+    the BOS and EOS tokens are added according to the `tokenizer.ggml.add_bos_token` and
+    `tokenizer.ggml.add_eos_token` keys, the same as in llama.cpp.
+
+    :param metadata: The GGUF metadata from `read_gguf_tokenizer_metadata`.
+    :type metadata: dict[str, Any]
+    :return: The tokenizer.json and the tokenizer config dicts.
+    :rtype: tuple[dict[str, Any], dict[str, Any]]
+    """
+    tokenizer_model = metadata.get("tokenizer.ggml.model")
+    if tokenizer_model not in GGUF_ADD_SPECIAL_TOKENS_DEFAULTS:
+        raise OVTypeError(
+            f"GGUF tokenizer model {tokenizer_model!r} is not supported, "
+            f"supported models: {list(GGUF_ADD_SPECIAL_TOKENS_DEFAULTS)}."
+        )
+
+    tokens = metadata["tokenizer.ggml.tokens"]
+    token_types = metadata.get("tokenizer.ggml.token_type")
+    token_types = token_types.tolist() if token_types is not None else [GGUFTokenType.NORMAL] * len(tokens)
+
+    added_token_types = (GGUFTokenType.CONTROL, GGUFTokenType.USER_DEFINED)
+    if tokenizer_model == "gpt2":
+        # tokens are stored in the byte-level alphabet, added tokens keep their original content as in tokenizer.json
+        bytes_to_unicode = {byte: char for char, byte in unicode_to_bytes().items()}
+        byte_level_alphabet = set(bytes_to_unicode.values())
+        tokens = [
+            token
+            if token_type in added_token_types or set(token) <= byte_level_alphabet
+            else "".join(bytes_to_unicode[byte] for byte in token.encode())
+            for token, token_type in zip(tokens, token_types)
+        ]
+    elif tokenizer_model == "llama" and metadata.get("general.architecture") in GEMMA_ARCHITECTURES:
+        # Gemma stores the whitespace tokens with the spaces instead of the metaspace symbol
+        tokens = ["▁" * len(token) if " " in token and not token.strip() else token for token in tokens]
+    elif tokenizer_model == "t5":
+        # T5 sentinel tokens are stored as [PADnnn] placeholders in the reversed order
+        tokens = list(tokens)
+        placeholders = [idx for idx, token in enumerate(tokens) if T5_EXTRA_ID_PLACEHOLDER.match(token)]
+        for offset, idx in enumerate(placeholders[:T5_EXTRA_IDS_COUNT]):
+            tokens[idx] = f"<extra_id_{T5_EXTRA_IDS_COUNT - 1 - offset}>"
+
+    # the tokenizer classes of the GGUF integration of transformers do not return token type ids
+    tokenizer_config = {
+        "chat_template": metadata.get("tokenizer.chat_template"),
+        "model_input_names": [TOKEN_IDS_INPUT_NAME, ATTENTION_MASK_INPUT_NAME],
+    }
+    special_token_ids = {}
+    for name, key in GGUF_SPECIAL_TOKEN_KEYS.items():
+        token_id = metadata.get(key)
+        if token_id is not None and 0 <= token_id < len(tokens):
+            special_token_ids[name] = token_id
+            tokenizer_config[name] = tokens[token_id]
+
+    added_tokens = dict.fromkeys(special_token_ids.values(), True)
+    for idx, token_type in enumerate(token_types):
+        if token_type in added_token_types:
+            added_tokens.setdefault(idx, token_type == GGUFTokenType.CONTROL)
+
+    if tokenizer_model == "gpt2":
+        tokenizer_json = build_byte_level_bpe(metadata, tokens)
+    elif tokenizer_model == "t5":
+        tokenizer_json = build_unigram(metadata, tokens, special_token_ids.get("unk_token"))
+    else:
+        tokenizer_json = build_sentencepiece_bpe(metadata, tokens, tokenizer_config.get("unk_token"))
+
+    add_bos_default, add_eos_default = GGUF_ADD_SPECIAL_TOKENS_DEFAULTS[tokenizer_model]
+    prefix_tokens, suffix_tokens = [], []
+    if metadata.get("tokenizer.ggml.add_bos_token", add_bos_default) and "bos_token" in special_token_ids:
+        prefix_tokens.append((tokenizer_config["bos_token"], special_token_ids["bos_token"]))
+    if metadata.get("tokenizer.ggml.add_eos_token", add_eos_default) and "eos_token" in special_token_ids:
+        suffix_tokens.append((tokenizer_config["eos_token"], special_token_ids["eos_token"]))
+
+    tokenizer_json.update(
+        version="1.0",
+        truncation=None,
+        padding=None,
+        added_tokens=[
+            {
+                "id": idx,
+                "content": tokens[idx],
+                "single_word": False,
+                "lstrip": False,
+                "rstrip": False,
+                "normalized": False,
+                "special": special,
+            }
+            for idx, special in sorted(added_tokens.items())
+        ],
+        post_processor=get_template_processing(prefix_tokens, suffix_tokens),
+    )
+    return tokenizer_json, tokenizer_config
@@ -7,9 +7,10 @@ import sys
 import tempfile
 from collections.abc import Callable
 from copy import deepcopy
+from importlib.util import find_spec
 from itertools import zip_longest
 from pathlib import Path
-from tempfile import TemporaryDirectory
+from types import SimpleNamespace
 from typing import Any, Optional, Union
 
 import numpy as np
@@ -17,20 +18,19 @@ import openvino.opset14 as opset
 from openvino import Model, Node, PartialShape, Type, op
 from openvino.exceptions import OVTypeError
 from openvino.utils.types import as_node, make_constant_node
-from transformers import PreTrainedTokenizerBase, PreTrainedTokenizerFast
-from transformers.convert_slow_tokenizer import import_protobuf
-from transformers.utils.versions import require_version
 
 from . import _get_factory, _get_opset_factory
 from .constants import (
     ATTENTION_MASK_INPUT_NAME,
     DETOKENIZER_NAME,
+    ROW_OFFSETS_OUTPUT_NAME,
     STRING_OUTPUT_NAME,
     TOKEN_IDS_INPUT_NAME,
     TOKEN_TYPE_IDS_INPUT_NAME,
     TOKENIZER_NAME,
     UTF8ReplaceMode,
 )
+from .profiling import profile_stage
 from .tokenizer_pipeline import (
     AddToken,
     BPETokenizationStep,
@@ -61,11 +61,65 @@ from .tokenizer_pipeline import (
     WhitespaceSplitStep,
     WordPieceTokenizationStep,
 )
-from .utils import TokenzierConversionParams, create_string_constant_node
+from .utils import TokenzierConversionParams, create_string_constant_node, get_tokenizer_json
+
+
+# the default model_max_length of the Huggingface tokenizers
+VERY_LARGE_INTEGER = int(1e30)
+# Huggingface tokenizer classes that override the default model_input_names of PreTrainedTokenizerBase
+# and do not return token type ids
+TOKENIZERS_WITHOUT_TOKEN_TYPE_IDS = {
+    "BartTokenizer",
+    "BarthezTokenizer",
+    "BartphoTokenizer",
+    "BertGenerationTokenizer",
+    "BigBirdTokenizer",
+    "BlenderbotSmallTokenizer",
+    "BlenderbotTokenizer",
+    "BloomTokenizer",
+    "ByT5Tokenizer",
+    "CamembertTokenizer",
+    "CLIPTokenizer",
+    "CodeGenTokenizer",
+    "CodeLlamaTokenizer",
+    "DistilBertTokenizer",
+    "FSMTTokenizer",
+    "GemmaTokenizer",
+    "GPT2Tokenizer",
+    "GPTNeoXJapaneseTokenizer",
+    "GPTNeoXTokenizer",
+    "LayoutXLMTokenizer",
+    "LEDTokenizer",
+    "LlamaTokenizer",
+    "LongformerTokenizer",
+    "M2M100Tokenizer",
+    "MarianTokenizer",
+    "MBart50Tokenizer",
+    "MBartTokenizer",
+    "MPNetTokenizer",
+    "MT5Tokenizer",
+    "NllbTokenizer",
+    "OpenAIGPTTokenizer",
+    "PegasusTokenizer",
+    "PLBartTokenizer",
+    "ProphetNetTokenizer",
+    "Qwen2Tokenizer",
+    "ReformerTokenizer",
+    "RobertaTokenizer",
+    "SeamlessM4TTokenizer",
+    "Speech2TextTokenizer",
+    "SpeechT5Tokenizer",
+    "T5Tokenizer",
+    "WhisperTokenizer",
+    "XGLMTokenizer",
+    "XLMRobertaTokenizer",
+}
 
 
 def transformers_version_at_least(requirement: str) -> bool:
     try:
+        from transformers.utils.versions import require_version
+
         require_version(f"transformers>={requirement}")
         return True
     except ImportError:
@@ -162,17 +216,140 @@ def parse_metaspace(pretokenizer_dict: dict[str, Any]) -> list[Union[Normalizati
     return steps
 
 
+class TokenizerJson:
+    """
+    Replaces the Huggingface fast tokenizer object when only the tokenizer files are available.
+
+    Provides the attributes of `PreTrainedTokenizerFast` that are used by the conversion, so the pipeline
+    can be built from tokenizer.json and tokenizer_config.json without the transformers library.
+    """
+
+    is_fast = True
+    special_token_names = (
+        "bos_token",
+        "eos_token",
+        "unk_token",
+        "sep_token",
+        "pad_token",
+        "cls_token",
+        "mask_token",
+    )
+
+    def __init__(self, tokenizer_json: dict[str, Any], tokenizer_config: Optional[dict[str, Any]] = None) -> None:
+        tokenizer_config = tokenizer_config or {}
+
+        self.tokenizer_json = tokenizer_json
+        self.added_tokens_decoder = {
+            added_token["id"]: SimpleNamespace(**added_token)
+            for added_token in sorted(tokenizer_json.get("added_tokens", []), key=lambda token: token["id"])
+        }
+        self._vocab = None
+
+        for name in self.special_token_names:
+            token = tokenizer_config.get(name)
+            setattr(self, name, token["content"] if isinstance(token, dict) else token)
+
+        # the defaults of PreTrainedTokenizerBase
+        self.model_max_length = tokenizer_config.get("model_max_length") or VERY_LARGE_INTEGER
+        self.padding_side = tokenizer_config.get("padding_side", "right")
+        self.truncation_side = tokenizer_config.get("truncation_side", "right")
+        self.chat_template = tokenizer_config.get("chat_template")
+        self.model_input_names = tokenizer_config.get("model_input_names") or self.get_model_input_names(
+            tokenizer_config
+        )
+        self.clean_up_tokenization_spaces = tokenizer_config.get("clean_up_tokenization_spaces", False)
+        self.clean_up_tokenization_spaces_for_bpe_even_though_it_will_corrupt_output = tokenizer_config.get(
+            "clean_up_tokenization_spaces_for_bpe_even_though_it_will_corrupt_output", False
+        )
+        # transformers>=5.7.0 does not clean up the spaces for BPE models unless it is forced, follow the installed
+        # transformers version and the latest behaviour when transformers is not installed
+        if tokenizer_json["model"]["type"] == "BPE" and (
+            find_spec("transformers") is None or transformers_version_at_least("5.7.0")
+        ):
+            self.clean_up_tokenization_spaces = (
+                self.clean_up_tokenization_spaces
+                and self.clean_up_tokenization_spaces_for_bpe_even_though_it_will_corrupt_output
+            )
+
+    @classmethod
+    def from_pretrained(cls, path: Union[str, Path]) -> "TokenizerJson":
+        """
+        Reads tokenizer.json and the tokenizer config files next to it.
+
+        :param path: The path to the tokenizer.json file or to the directory with it.
+        :type path: Union[str, Path]
+        :return: The tokenizer object for the conversion.
+        :rtype: TokenizerJson
+        """
+        path = Path(path)
+        tokenizer_json_path = path / "tokenizer.json" if path.is_dir() else path
+        tokenizer_dir = tokenizer_json_path.parent
+
+        # Windows uses cp1252 encoding by default, need to use utf-8 explicitly
+        with open(tokenizer_json_path, encoding="utf-8") as f:
+            tokenizer_json = json.load(f)
+
+        # special tokens map overrides the tokenizer config, the same as in transformers
+        tokenizer_config = {}
+        for config_name in ("tokenizer_config.json", "special_tokens_map.json"):
+            if (tokenizer_dir / config_name).is_file():
+                with open(tokenizer_dir / config_name, encoding="utf-8") as f:
+                    tokenizer_config.update(json.load(f))
+
+        if (chat_template_path := tokenizer_dir / "chat_template.jinja").is_file():
+            tokenizer_config["chat_template"] = chat_template_path.read_text(encoding="utf-8")
+
+        return cls(tokenizer_json, tokenizer_config)
+
+    @staticmethod
+    def get_model_input_names(tokenizer_config: dict[str, Any]) -> list[str]:
+        # the default of PreTrainedTokenizerBase, unless the tokenizer class overrides it
+        tokenizer_class = (tokenizer_config.get("tokenizer_class") or "").removesuffix("Fast")
+        if tokenizer_class in TOKENIZERS_WITHOUT_TOKEN_TYPE_IDS:
+            return [TOKEN_IDS_INPUT_NAME, ATTENTION_MASK_INPUT_NAME]
+        return [TOKEN_IDS_INPUT_NAME, TOKEN_TYPE_IDS_INPUT_NAME, ATTENTION_MASK_INPUT_NAME]
+
+    def get_vocab(self) -> dict[str, int]:
+        if self._vocab is None:
+            vocab = self.tokenizer_json["model"]["vocab"]
+            if isinstance(vocab, list):
+                # Unigram vocab is a list of pieces with scores
+                vocab = {piece: idx for idx, (piece, _) in enumerate(vocab)}
+            self._vocab = {**vocab, **{token.content: idx for idx, token in self.added_tokens_decoder.items()}}
+        return self._vocab
+
+    def convert_tokens_to_ids(self, token: Optional[str]) -> Optional[int]:
+        if token is None:
+            return None
+        return self.get_vocab().get(token, self.get_vocab().get(self.unk_token))
+
+    @property
+    def bos_token_id(self) -> Optional[int]:
+        return self.convert_tokens_to_ids(self.bos_token)
+
+    @property
+    def eos_token_id(self) -> Optional[int]:
+        return self.convert_tokens_to_ids(self.eos_token)
+
+    @property
+    def unk_token_id(self) -> Optional[int]:
+        return self.convert_tokens_to_ids(self.unk_token)
+
+    @property
+    def pad_token_id(self) -> Optional[int]:
+        return self.convert_tokens_to_ids(self.pad_token)
+
+
 class TransformersTokenizerPipelineParser:
     def __init__(self, tokenizer_object: Any, params: TokenzierConversionParams) -> None:
         if not tokenizer_object.is_fast:
             raise OVTypeError("Tokenizer is not supported.")
 
         self.original_tokenizer = tokenizer_object
-        with TemporaryDirectory() as tmpdir:
-            tokenizer_object.save_pretrained(tmpdir)
-            # Windows uses cp1252 encoding by default, need to use utf-8 explicitly
-            with open(Path(tmpdir) / "tokenizer.json", encoding="utf-8") as tj:
-                self.tokenizer_json = json.load(tj)
+        with profile_stage("tokenizer_json", kind="loading"):
+            self.tokenizer_json = get_tokenizer_json(tokenizer_object)
+        if self.tokenizer_json is None:
+            raise OVTypeError("Cannot convert tokenizer of this type without `tokenizer.json` file.")
         self.pipeline = TokenizerPipeline()
 
         self.number_of_inputs = params.number_of_inputs
@@ -180,6 +357,7 @@ class TransformersTokenizerPipelineParser:
         self.skip_special_tokens = params.skip_special_tokens
         self.clean_up_tokenization_spaces = params.clean_up_tokenization_spaces
         self.use_max_padding = params.use_max_padding
+        self.ragged_output = params.ragged_output
         self.truncation = params.truncation
         self.utf8_replace_mode = params.utf8_replace_mode
         self.number_of_inputs = params.number_of_inputs
@@ -195,7 +373,8 @@ class TransformersTokenizerPipelineParser:
             self.post_tokenization,
             self.decoding,
         ]:
-            add_steps()
+            with profile_stage(add_steps.__name__, kind="parser_stage"):
+                add_steps()
 
         return self.pipeline
 
@@ -364,7 +543,14 @@ class TransformersTokenizerPipelineParser:
         self.num_of_added_tokens += getattr(combine_segments_step, "number_of_added_tokens", 0)
 
         self.add_truncation()
-        self.pipeline.add_steps(combine_segments_step)
+        # ByteLevel post-processor adds no tokens, so the CombineSegments node would only copy the token ids
+        skip_combine_segments = (
+            self.number_of_inputs == 1
+            and combine_segments_step.is_identity
+            and TOKEN_TYPE_IDS_INPUT_NAME not in self.original_tokenizer.model_input_names
+        )
+        if not skip_combine_segments:
+            self.pipeline.add_steps(combine_segments_step)
 
         self.add_padding(use_max_padding=self.use_max_padding)
 
@@ -400,6 +586,7 @@ class TransformersTokenizerPipelineParser:
                     pad_to_max_length=use_max_padding,
                     max_length=max_length,
                     pad_right=pad_right,
+                    ragged_output=self.ragged_output,
                 )
             )
         else:
@@ -410,6 +597,7 @@ class TransformersTokenizerPipelineParser:
                     pad_to_max_length=use_max_padding,
                     max_length=max_length,
                     pad_right=pad_right,
+                    ragged_output=self.ragged_output,
                 )
             )
 
@@ -480,7 +668,10 @@ class TransformersTokenizerPipelineParser:
         return
 
 
-def parse_special_tokens(hf_tokenizer: PreTrainedTokenizerBase, only_special_tokens: bool = True) -> dict[int, str]:
+def parse_special_tokens(
+    hf_tokenizer: "PreTrainedTokenizerBase",  # noqa
+    only_special_tokens: bool = True,
+) -> dict[int, str]:
     # the order matters
     result = {}
     result.update(
@@ -502,14 +693,10 @@ def parse_special_tokens(hf_tokenizer: PreTrainedTokenizerBase, only_special_tok
     return result
 
 
-def convert_fast_tokenizer(
-    hf_tokenizer: PreTrainedTokenizerBase, params: TokenzierConversionParams, number_of_inputs: int = 1
-) -> Union[Model, tuple[Model, Model]]:
-    pipeline = TransformersTokenizerPipelineParser(hf_tokenizer, params).parse()
-    ov_tokenizer = pipeline.get_tokenizer_ov_subgraph()
-    output_names = hf_tokenizer.model_input_names
-
-    ov_tokenizer_output_names = [TOKEN_IDS_INPUT_NAME, ATTENTION_MASK_INPUT_NAME]
+def filter_tokenizer_outputs(ov_tokenizer: Model, output_names: list[str], ragged_output: bool = False) -> Model:
+    # the ragged output has the row offsets instead of the attention mask
+    last_output_name = ROW_OFFSETS_OUTPUT_NAME if ragged_output else ATTENTION_MASK_INPUT_NAME
+    ov_tokenizer_output_names = [TOKEN_IDS_INPUT_NAME, last_output_name]
     if len(output_names) == 3 and len(ov_tokenizer.outputs) == 3:
         ov_tokenizer_output_names.insert(1, TOKEN_TYPE_IDS_INPUT_NAME)
 
@@ -530,59 +717,103 @@ def convert_fast_tokenizer(
 
     tokenizer_model = Model(filtered_outputs, ov_tokenizer.get_parameters(), TOKENIZER_NAME)
     tokenizer_model.add_sinks(ov_tokenizer.get_sinks())
+    return tokenizer_model
+
+
+def convert_fast_tokenizer(
+    hf_tokenizer: "PreTrainedTokenizerBase",  # noqa
+    params: TokenzierConversionParams,
+    number_of_inputs: int = 1,
+) -> Union[Model, tuple[Model, Model]]:
+    pipeline = TransformersTokenizerPipelineParser(hf_tokenizer, params).parse()
+    with profile_stage(TOKENIZER_NAME, kind="model"):
+        tokenizer_model = pipeline.get_tokenizer_ov_subgraph(
+            token_count_output=params.token_count_output, deduplicate_inputs=params.deduplicate_inputs
+        )
+    # the token count model has a single output, so there is nothing to filter
+    if not params.token_count_output:
+        tokenizer_model = filter_tokenizer_outputs(
+            tokenizer_model, hf_tokenizer.model_input_names, ragged_output=params.ragged_output
+        )
+
     if params.with_detokenizer:
-        return tokenizer_model, pipeline.get_detokenizer_ov_subgraph()
+        with profile_stage(DETOKENIZER_NAME, kind="model"):
+            ov_detokenizer = pipeline.get_detokenizer_ov_subgraph(stateful=params.stateful_detokenizer)
+        return tokenizer_model, ov_detokenizer
 
     return tokenizer_model
 
 
 @functools.lru_cache(1)
-def is_sentencepiece_model(hf_tokenizer: PreTrainedTokenizerBase) -> bool:
+def get_sentencepiece_model_proto(hf_tokenizer: "PreTrainedTokenizerBase") -> Optional[bytes]:  # noqa
+    """
+    Returns the serialized SentencePiece model of the tokenizer or None if the tokenizer does not have `.model` file.
+
+    The model is taken from the same sources that `save_pretrained` copies it from, the tokenizer is saved
+    to a temporary directory only if it is not clear whether it has one.
+    """
+    vocab_file_name = getattr(hf_tokenizer, "vocab_files_names", {}).get("vocab_file", "")
+    if not vocab_file_name.endswith(".model"):
+        return None
+
+    # fast tokenizers save the original .model file along with the slow tokenizer files, which is not done since
+    # transformers 5.0
+    is_fast = getattr(hf_tokenizer, "is_fast", False)
+    can_save_model_file = not is_fast or (
+        getattr(hf_tokenizer, "can_save_slow_tokenizer", False) and not transformers_version_at_least("5.0.0")
+    )
+    vocab_file = getattr(hf_tokenizer, "vocab_file", None)
+    if can_save_model_file and isinstance(vocab_file, (str, Path)) and Path(vocab_file).is_file():
+        return Path(vocab_file).read_bytes()
+
+    sp_model = getattr(hf_tokenizer, "sp_model", None)
+    if not is_fast and hasattr(sp_model, "serialized_model_proto"):
+        return sp_model.serialized_model_proto()
+
     with tempfile.TemporaryDirectory() as tmp:
         try:
             hf_tokenizer.save_pretrained(tmp)
         except Exception:
-            return False
-        if not hasattr(hf_tokenizer, "vocab_files_names") or "vocab_file" not in hf_tokenizer.vocab_files_names:
-            return False
-        vocab_file = Path(tmp) / hf_tokenizer.vocab_files_names["vocab_file"]
-        vocab_file_exists = (
-            getattr(hf_tokenizer, "vocab_files_names", {}).get("vocab_file", "").endswith(".model")
-            and vocab_file.exists()
-        )
-        if vocab_file_exists:
-            try:
-                from google.protobuf.message import DecodeError
-            except (ImportError, ModuleNotFoundError):
-                return False
-
-            model_pb = import_protobuf()
-            model = model_pb.ModelProto()
-            try:
-                with open(vocab_file, "rb") as model_file:
-                    model.ParseFromString(model_file.read())
-                return True
-            except DecodeError:
-                pass  # protobuf file is corrupted
+            return None
+        vocab_file = Path(tmp) / vocab_file_name
+        return vocab_file.read_bytes() if vocab_file.exists() else None
 
+
+@functools.lru_cache(1)
+def is_sentencepiece_model(hf_tokenizer: "PreTrainedTokenizerBase") -> bool:  # noqa
+    sp_model_proto = get_sentencepiece_model_proto(hf_tokenizer)
+    if sp_model_proto is None:
+        return False
+
+    try:
+        from google.protobuf.message import DecodeError
+    except (ImportError, ModuleNotFoundError):
         return False
 
+    from transformers.convert_slow_tokenizer import import_protobuf
+
+    model_pb = import_protobuf()
+    model = model_pb.ModelProto()
+    try:
+        model.ParseFromString(sp_model_proto)
+        return True
+    except DecodeError:
+        return False  # protobuf file is corrupted
+
 
 @functools.lru_cache(1)
-def get_sentencepiece_model_type(hf_tokenizer: PreTrainedTokenizerBase) -> int:
-    with tempfile.TemporaryDirectory() as tmp:
-        hf_tokenizer.save_pretrained(tmp)
-        vocab_file = Path(tmp) / hf_tokenizer.vocab_files_names["vocab_file"]
-        model_pb = import_protobuf()
-        model = model_pb.ModelProto()
-        with open(vocab_file, "rb") as model_file:
-            model.ParseFromString(model_file.read())
-            return model.trainer_spec.model_type  # UNIGRAM=1, BPE=2, WORD=3, CHAR=4
+def get_sentencepiece_model_type(hf_tokenizer: "PreTrainedTokenizerBase") -> int:  # noqa
+    from transformers.convert_slow_tokenizer import import_protobuf
+
+    model_pb = import_protobuf()
+    model = model_pb.ModelProto()
+    model.ParseFromString(get_sentencepiece_model_proto(hf_tokenizer))
+    return model.trainer_spec.model_type  # UNIGRAM=1, BPE=2, WORD=3, CHAR=4
 
 
 def align_model_file(
     model: "ModelProto",  # noqa
-    hf_tokenizer: PreTrainedTokenizerBase,
+    hf_tokenizer: "PreTrainedTokenizerBase",  # noqa
     added_tokens: Optional[dict[int, str]] = None,
 ) -> None:
     if added_tokens is None:
@@ -658,18 +889,19 @@ def align_model_file(
 
 
 def modify_sentencepiece_model(
-    sp_model_path: Path,
+    sp_model_proto: bytes,
     add_tokens: dict[int, str],
-    hf_tokenizer: PreTrainedTokenizerBase,
+    hf_tokenizer: "PreTrainedTokenizerBase",  # noqa
     skip_special_tokens: bool = False,
     add_prefix_space: Optional[bool] = None,
     byte_fallback: Optional[bool] = None,
     preserve_control_tokens: bool = False,
 ) -> str:
+    from transformers.convert_slow_tokenizer import import_protobuf
+
     model_pb = import_protobuf()
     model = model_pb.ModelProto()
-    with open(sp_model_path, "rb") as model_file:
-        model.ParseFromString(model_file.read())
+    model.ParseFromString(sp_model_proto)
 
     if add_prefix_space is not None:
         model.normalizer_spec.add_dummy_prefix = add_prefix_space
@@ -736,10 +968,22 @@ def modify_sentencepiece_model(
 
 
 def convert_sentencepiece_model_tokenizer(
-    hf_tokenizer: PreTrainedTokenizerBase, params: TokenzierConversionParams, add_attention_mask: bool = True
+    hf_tokenizer: "PreTrainedTokenizerBase",  # noqa
+    params: TokenzierConversionParams,
+    add_attention_mask: bool = True,
 ) -> Union[Model, tuple[Model, Model]]:
+    from transformers import PreTrainedTokenizerFast
+
     if not is_sentencepiece_model(hf_tokenizer):
         raise OVTypeError("Cannot convert tokenizer of this type without `.model` file.")
+    if params.ragged_output:
+        raise OVTypeError("Ragged output is not supported for the SentencePiece backend.")
+    if params.token_count_output:
+        raise OVTypeError("Token count output is not supported for the SentencePiece backend.")
+    if params.deduplicate_inputs:
+        raise OVTypeError("Input deduplication is not supported for the SentencePiece backend.")
+    if params.stateful_detokenizer:
+        raise OVTypeError("Stateful detokenizer is not supported for the SentencePiece backend.")
 
     sentencepiece_model_type = get_sentencepiece_model_type(hf_tokenizer)
     if params.handle_special_tokens_with_re is None:
@@ -776,78 +1020,70 @@ def convert_sentencepiece_model_tokenizer(
     if params.add_special_tokens is False:
         add_bos_token = add_eos_token = False
 
-    with tempfile.TemporaryDirectory() as tmp:
-        hf_tokenizer.save_pretrained(tmp)
-        vocab_file = Path(tmp) / hf_tokenizer.vocab_files_names["vocab_file"]
-        if not vocab_file.exists():
-            raise OVTypeError("Cannot convert tokenizer of this type without `.model` file.")
-
-        byte_fallback = None
-        tokenizer_json_file = Path(tmp) / "tokenizer.json"
-        prepend_scheme = ""
-        if (
-            params.add_prefix_space is None
-            and isinstance(hf_tokenizer, PreTrainedTokenizerFast)
-            and tokenizer_json_file.exists()
-        ):
-            # specify encoding for windows - uses cp-1252 otherwise
-            with open(tokenizer_json_file, encoding="utf-8") as f:
-                tokenizer_json = json.load(f)
-                pre_tokenizer = tokenizer_json.get("pre_tokenizer")
-
-                byte_fallback = tokenizer_json.get("model", {}).get("byte_fallback", None)
-
-                if pre_tokenizer and pre_tokenizer.get("type") == "Metaspace":
-                    metaspace = pre_tokenizer
-                elif pre_tokenizer and pre_tokenizer.get("type") == "Sequence":
-                    metaspace = next(
-                        (pre for pre in pre_tokenizer["pretokenizers"] if pre["type"] == "Metaspace"), None
-                    )
-                else:
-                    metaspace = None
-
-                if metaspace is not None:
-                    prepend_scheme = metaspace.get("prepend_scheme", "")
-                    if prepend_scheme == "always":
-                        params.add_prefix_space = True
-                    elif prepend_scheme == "never":
-                        params.add_prefix_space = False
-                    elif prepend_scheme == "first":
-                        params.add_prefix_space = True
-
-                # metaspace can be emulated with sequence of normalizers
-                if params.add_prefix_space is None:
-                    normalizers = tokenizer_json.get("normalizer", {}).get("normalizers", [])
-                    params.add_prefix_space = any(normalizer.get("prepend") == "▁" for normalizer in normalizers)
-                    prepend_scheme = "never"
-
-        elif params.add_prefix_space is None and isinstance(hf_tokenizer, PreTrainedTokenizerFast):
-            params.add_prefix_space = True
-
-        add_tokens = parse_special_tokens(hf_tokenizer, only_special_tokens=False)
-
-        sp_model_string = modify_sentencepiece_model(
-            sp_model_path=vocab_file,
-            add_tokens=add_tokens,
-            hf_tokenizer=hf_tokenizer,
-            skip_special_tokens=False,
-            add_prefix_space=params.add_prefix_space,
-            byte_fallback=byte_fallback,
-            preserve_control_tokens=True,
-        )
-        sp_model = np.frombuffer(sp_model_string, dtype=np.uint8)
-        sp_model_node = as_node(sp_model)
-
-        sp_detokenizer_model_string = modify_sentencepiece_model(
-            sp_model_path=vocab_file,
-            add_tokens=add_tokens,
-            hf_tokenizer=hf_tokenizer,
-            skip_special_tokens=params.skip_special_tokens,
-            add_prefix_space=params.add_prefix_space,
-            byte_fallback=byte_fallback,
-        )
-        sp_detokenizer_model = np.frombuffer(sp_detokenizer_model_string, dtype=np.uint8)
-        sp_detokenizer_model_node = as_node(sp_detokenizer_model)
+    sp_model_proto = get_sentencepiece_model_proto(hf_tokenizer)
+    if sp_model_proto is None:
+        raise OVTypeError("Cannot convert tokenizer of this type without `.model` file.")
+
+    byte_fallback = None
+    prepend_scheme = ""
+    if (
+        params.add_prefix_space is None
+        and isinstance(hf_tokenizer, PreTrainedTokenizerFast)
+        and (tokenizer_json := get_tokenizer_json(hf_tokenizer)) is not None
+    ):
+        pre_tokenizer = tokenizer_json.get("pre_tokenizer")
+
+        byte_fallback = tokenizer_json.get("model", {}).get("byte_fallback", None)
+
+        if pre_tokenizer and pre_tokenizer.get("type") == "Metaspace":
+            metaspace = pre_tokenizer
+        elif pre_tokenizer and pre_tokenizer.get("type") == "Sequence":
+            metaspace = next((pre for pre in pre_tokenizer["pretokenizers"] if pre["type"] == "Metaspace"), None)
+        else:
+            metaspace = None
+
+        if metaspace is not None:
+            prepend_scheme = metaspace.get("prepend_scheme", "")
+            if prepend_scheme == "always":
+                params.add_prefix_space = True
+            elif prepend_scheme == "never":
+                params.add_prefix_space = False
+            elif prepend_scheme == "first":
+                params.add_prefix_space = True
+
+        # metaspace can be emulated with sequence of normalizers
+        if params.add_prefix_space is None:
+            normalizers = tokenizer_json.get("normalizer", {}).get("normalizers", [])
+            params.add_prefix_space = any(normalizer.get("prepend") == "▁" for normalizer in normalizers)
+            prepend_scheme = "never"
+
+    elif params.add_prefix_space is None and isinstance(hf_tokenizer, PreTrainedTokenizerFast):
+        params.add_prefix_space = True
+
+    add_tokens = parse_special_tokens(hf_tokenizer, only_special_tokens=False)
+
+    sp_model_string = modify_sentencepiece_model(
+        sp_model_proto=sp_model_proto,
+        add_tokens=add_tokens,
+        hf_tokenizer=hf_tokenizer,
+        skip_special_tokens=False,
+        add_prefix_space=params.add_prefix_space,
+        byte_fallback=byte_fallback,
+        preserve_control_tokens=True,
+    )
+    sp_model = np.frombuffer(sp_model_string, dtype=np.uint8)
+    sp_model_node = as_node(sp_model)
+
+    sp_detokenizer_model_string = modify_sentencepiece_model(
+        sp_model_proto=sp_model_proto,
+        add_tokens=add_tokens,
+        hf_tokenizer=hf_tokenizer,
+        skip_special_tokens=params.skip_special_tokens,
+        add_prefix_space=params.add_prefix_space,
+        byte_fallback=byte_fallback,
+    )
+    sp_detokenizer_model = np.frombuffer(sp_detokenizer_model_string, dtype=np.uint8)
+    sp_detokenizer_model_node = as_node(sp_detokenizer_model)
 
     input_node = op.Parameter(Type.string, PartialShape(["?"]))
     input_node.set_friendly_name("string_input")
@@ -1069,7 +1305,7 @@ def get_sp_detokenizer(
     return tokenizer_detokenizer
 
 
-def is_tiktoken_model(hf_tokenizer: PreTrainedTokenizerBase) -> bool:
+def is_tiktoken_model(hf_tokenizer: "PreTrainedTokenizerBase") -> bool:  # noqa
     try:
         from tiktoken import Encoding
     except (ImportError, ModuleNotFoundError):
@@ -1083,7 +1319,8 @@ def is_tiktoken_model(hf_tokenizer: PreTrainedTokenizerBase) -> bool:
 
 
 def convert_tiktoken_model_tokenizer(
-    hf_tokenizer: PreTrainedTokenizerBase, params: TokenzierConversionParams
+    hf_tokenizer: "PreTrainedTokenizerBase",  # noqa
+    params: TokenzierConversionParams,
 ) -> Union[Model, tuple[Model, Model]]:
     encoding = getattr(hf_tokenizer, "tokenizer", None) or hf_tokenizer.encoder
     split_pattern = encoding._pat_str
@@ -1110,6 +1347,7 @@ def convert_tiktoken_model_tokenizer(
                 _token_id=getattr(hf_tokenizer, "pad_token_id"),
                 pad_right=(hf_tokenizer.padding_side == "right"),
                 pad_to_max_length=params.use_max_padding,
+                ragged_output=params.ragged_output,
             ),
         ]
     )
@@ -1136,7 +1374,10 @@ def convert_tiktoken_model_tokenizer(
     if params.clean_up_tokenization_spaces:
         pipeline.add_steps(RegexDecodingStep.clean_up_tokenization_spaces())
 
+    ov_tokenizer = pipeline.get_tokenizer_ov_subgraph(
+        token_count_output=params.token_count_output, deduplicate_inputs=params.deduplicate_inputs
+    )
     if not params.with_detokenizer:
-        return pipeline.get_tokenizer_ov_subgraph()
+        return ov_tokenizer
 
-    return pipeline.get_tokenizer_ov_subgraph(), pipeline.get_detokenizer_ov_subgraph()
+    return ov_tokenizer, pipeline.get_detokenizer_ov_subgraph(stateful=params.stateful_detokenizer)
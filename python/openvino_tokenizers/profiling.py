@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+import json
+import logging
+import sys
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import openvino
+
+from .__version__ import __version__ as openvino_tokenizers_version
+
+
+logger = logging.getLogger(__name__)
+
+_active_profiler: ContextVar[Optional["ConversionProfiler"]] = ContextVar("_active_profiler", default=None)
+
+MB = 1024**2
+
+
+def get_max_rss_mb() -> Optional[float]:
+    """Returns the peak resident set size of the process in MB, or None if the platform does not report it."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports the value in kilobytes, macOS in bytes
+    return max_rss / MB if sys.platform == "darwin" else max_rss / 1024
+
+
+@dataclass
+class StageRecord:
+    name: str
+    kind: str
+    parent: Optional[int]
+    info: dict[str, Any] = field(default_factory=dict)
+    wall_time_ms: Optional[float] = None
+    peak_memory_mb: Optional[float] = None
+    max_rss_mb: Optional[float] = None
+
+
+class ConversionProfiler:
+    """
+    Collects the wall time and peak memory of the conversion stages.
+
+    The stages are reported by `profile_stage` calls inside the conversion code while the profiler is active:
+
+        with ConversionProfiler() as profiler:
+            ov_tokenizer = convert_tokenizer(hf_tokenizer)
+        profiler.save_report("profile.json")
+
+    The peak memory is the peak of the memory allocated by Python and numpy during the stage, measured with
+    `tracemalloc`, above the allocated memory at the start of the stage. The memory allocated by OpenVINO is not
+    traced, the peak resident set size of the process at the end of each stage is reported for it.
+
+    :param trace_memory: Trace the allocated memory, slows down the conversion.
+    :type trace_memory: bool
+    """
+
+    def __init__(self, trace_memory: bool = True) -> None:
+        self.trace_memory = trace_memory
+        self.records: list[StageRecord] = []
+        self._stack: list[tuple[int, int]] = []  # record index and traced memory peak of the active stages
+        self._started_tracemalloc = False
+        self._context_token = None
+
+    def __enter__(self) -> "ConversionProfiler":
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._context_token = _active_profiler.set(self)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        _active_profiler.reset(self._context_token)
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    @contextmanager
+    def stage(self, name: str, kind: str = "stage", **info: Any) -> Iterator[StageRecord]:
+        parent = self._stack[-1][0] if self._stack else None
+        record = StageRecord(name=name, kind=kind, parent=parent, info=info)
+        self.records.append(record)
+
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        start_memory = 0
+        if tracing:
+            start_memory, peak = tracemalloc.get_traced_memory()
+            # save the peak of the parent stage before resetting it for the current stage
+            if self._stack:
+                self._stack[-1] = (self._stack[-1][0], max(self._stack[-1][1], peak))
+            tracemalloc.reset_peak()
+
+        self._stack.append((len(self.records) - 1, start_memory))
+        start_time = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.wall_time_ms = (time.perf_counter() - start_time) * 1000
+            _, peak = self._stack.pop()
+            if tracing:
+                peak = max(peak, tracemalloc.get_traced_memory()[1])
+                record.peak_memory_mb = (peak - start_memory) / MB
+                if self._stack:
+                    self._stack[-1] = (self._stack[-1][0], max(self._stack[-1][1], peak))
+            record.max_rss_mb = get_max_rss_mb()
+
+    def get_report(self) -> dict[str, Any]:
+        return {
+            "openvino_version": openvino.get_version(),
+            "openvino_tokenizers_version": openvino_tokenizers_version,
+            "memory_traced": self.trace_memory,
+            "stages": [{"id": idx, **asdict(record)} for idx, record in enumerate(self.records)],
+        }
+
+    def save_report(self, path: Union[str, Path]) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.get_report(), f, indent=2)
+        logger.info(f"Conversion profile is saved to {path}")
+
+
+@contextmanager
+def profile_stage(name: str, kind: str = "stage", **info: Any) -> Iterator[Optional[StageRecord]]:
+    """Reports the stage to the active `ConversionProfiler`, does nothing if the profiling is not enabled."""
+    profiler = _active_profiler.get()
+    if profiler is None:
+        yield None
+        return
+
+    with profiler.stage(name, kind, **info) as record:
+        yield record
@@ -0,0 +1,503 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+import asyncio
+import queue
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import numpy as np
+from openvino import CompiledModel, Core, InferRequest, Model, Tensor, Type, properties
+
+from .constants import ATTENTION_MASK_INPUT_NAME, ROW_OFFSETS_OUTPUT_NAME, STRING_OUTPUT_NAME
+from .encoding_cache import EncodingCache, get_model_cache_key
+from .utils import is_arrow_array, unpack_strings
+
+
+DEFAULT_RUNTIME_CONFIG = {properties.hint.performance_mode(): properties.hint.PerformanceMode.THROUGHPUT}
+# the texts of different lengths to find the padding of the tokenizer outputs
+PADDING_PROBE_TEXTS = ["a", "a a a a"]
+
+TextInput = Union[str, Iterable[str], np.ndarray]
+
+
+def detach_outputs(request: InferRequest, compiled_model: CompiledModel) -> list[Tensor]:
+    """Takes the output tensors of the finished request and gives the request new empty output tensors.
+
+    The request writes the next results to the new tensors, so the taken tensors and the numpy views of them stay
+    valid without copying the data.
+    """
+    tensors = []
+    for idx, output in enumerate(compiled_model.outputs):
+        tensors.append(request.get_output_tensor(idx))
+        empty_shape = [0] * output.get_partial_shape().rank.get_length()
+        request.set_output_tensor(idx, Tensor(output.get_element_type(), empty_shape))
+    return tensors
+
+
+def prepare_string_inputs(compiled_model: CompiledModel, *texts: TextInput) -> list[np.ndarray]:
+    """Prepares the inputs of the tokenizer for the texts, one batch of texts for each string input.
+
+    The tokenizer converted with `unpacked_string_input` gets the begins, ends and chars of the texts, Arrow string
+    arrays and numpy arrays of bytes are passed without copying the chars.
+    """
+    texts = [[batch] if isinstance(batch, (str, bytes)) else batch for batch in texts]
+    if compiled_model.input(0).get_element_type() != Type.string:
+        return [array for batch in texts for array in unpack_strings(batch)]
+
+    inputs = []
+    for batch in texts:
+        if is_arrow_array(batch):
+            batch = batch.to_pylist()
+        inputs.append(batch if isinstance(batch, np.ndarray) else np.array(list(batch)))
+    return inputs
+
+
+def split_rows(outputs: dict[str, np.ndarray]) -> list[dict[str, np.ndarray]]:
+    """Splits the tokenizer outputs for a batch into the outputs for each text without padding.
+
+    The padded outputs are unpadded with the attention mask, so the padding side does not matter. The outputs of
+    the tokenizers converted with `ragged_output` are split by the row offsets, the token counts of the tokenizers
+    converted with `token_count_output` are split into scalars.
+    """
+    row_offsets = outputs.get(ROW_OFFSETS_OUTPUT_NAME)
+    if row_offsets is not None:
+        return [
+            {name: output[begin:end] for name, output in outputs.items() if name != ROW_OFFSETS_OUTPUT_NAME}
+            for begin, end in zip(row_offsets[:-1], row_offsets[1:])
+        ]
+
+    attention_mask = outputs.get(ATTENTION_MASK_INPUT_NAME)
+    batch_size = len(next(iter(outputs.values())))
+    rows = []
+    for idx in range(batch_size):
+        row_mask = None if attention_mask is None else attention_mask[idx].astype(bool)
+        rows.append(
+            {
+                name: output[idx] if row_mask is None or output.ndim == 1 else output[idx][row_mask]
+                for name, output in outputs.items()
+                if output.ndim in (1, 2)
+            }
+        )
+    return rows
+
+
+@dataclass
+class RowPadding:
+    """
+    The padding of the tokenizer outputs, used to merge the rows of different batches into one batch.
+
+    :param pad_values: The pad value of each output, the outputs without pad values are padded with zeros.
+    :type pad_values: dict[str, int]
+    :param pad_right: Whether the rows are padded on the right.
+    :type pad_right: bool
+    :param length: The minimal length of the padded rows for the tokenizers converted with `use_max_padding`,
+        the longer rows are not truncated and the rows are padded to the longest row.
+    :type length: Optional[int]
+    """
+
+    pad_values: dict[str, int] = field(default_factory=dict)
+    pad_right: bool = True
+    length: Optional[int] = None
+
+    @classmethod
+    def from_outputs(cls, outputs: dict[str, np.ndarray]) -> "RowPadding":
+        """Finds the padding from the padded outputs for a batch of texts with different numbers of tokens."""
+        attention_mask = outputs[ATTENTION_MASK_INPUT_NAME]
+        lengths = attention_mask.sum(axis=-1)
+        width = attention_mask.shape[-1]
+        length = width if lengths.max(initial=0) < width else None
+
+        shortest_row = int(np.argmin(lengths))
+        pad_mask = attention_mask[shortest_row] == 0
+        if not pad_mask.any():
+            return cls(length=length)
+        return cls(
+            pad_values={name: output[shortest_row][pad_mask][0].item() for name, output in outputs.items()},
+            pad_right=bool(pad_mask[-1]),
+            length=length,
+        )
+
+
+def merge_rows(
+    rows: list[dict[str, np.ndarray]],
+    output_types: dict[str, np.dtype],
+    padding: Optional[RowPadding] = None,
+) -> dict[str, np.ndarray]:
+    """Merges the outputs for each text into the tokenizer outputs for a batch, the inverse of `split_rows`.
+
+    :param rows: The outputs for each text.
+    :type rows: list[dict[str, np.ndarray]]
+    :param output_types: The types of the tokenizer outputs by the output names in the output order.
+    :type output_types: dict[str, np.dtype]
+    :param padding: The padding of the outputs, the rows are padded with zeros on the right if None.
+    :type padding: Optional[RowPadding]
+    :return: The tokenizer outputs by the output names.
+    :rtype: dict[str, np.ndarray]
+    """
+    if ROW_OFFSETS_OUTPUT_NAME in output_types:
+        lengths = [len(next(iter(row.values()))) for row in rows]
+        return {
+            name: np.concatenate([[0], np.cumsum(lengths)]).astype(dtype)
+            if name == ROW_OFFSETS_OUTPUT_NAME
+            else np.concatenate([row[name] for row in rows]).astype(dtype, copy=False)
+            for name, dtype in output_types.items()
+        }
+
+    padding = padding or RowPadding()
+    outputs = {}
+    for name, dtype in output_types.items():
+        row_outputs = [row[name] for row in rows]
+        if row_outputs[0].ndim == 0:
+            outputs[name] = np.array(row_outputs, dtype=dtype)
+            continue
+
+        width = max(padding.length or 0, *(len(row_output) for row_output in row_outputs))
+        output = np.full((len(rows), width), padding.pad_values.get(name, 0), dtype=dtype)
+        for idx, row_output in enumerate(row_outputs):
+            if padding.pad_right:
+                output[idx, : len(row_output)] = row_output
+            else:
+                output[idx, width - len(row_output) :] = row_output
+        outputs[name] = output
+    return outputs
+
+
+class InferRequestPool:
+    """
+    Runs a compiled model with a pool of infer requests.
+
+    Each inference runs in a worker thread with an idle infer request, the results are extracted from the request
+    before it is reused. The inference errors are raised by the returned futures. The pool can be used from several
+    threads and from asyncio tasks.
+
+    :param compiled_model: The compiled model.
+    :type compiled_model: openvino.CompiledModel
+    :param num_requests: The number of infer requests, the optimal number for the compiled model is used if 0.
+    :type num_requests: int
+    """
+
+    def __init__(self, compiled_model: CompiledModel, num_requests: int = 0) -> None:
+        self.compiled_model = compiled_model
+        if num_requests <= 0:
+            num_requests = compiled_model.get_property(properties.optimal_number_of_infer_requests())
+        self.num_requests = num_requests
+        self._idle_requests = queue.SimpleQueue()
+        for _ in range(num_requests):
+            self._idle_requests.put(compiled_model.create_infer_request())
+        # a worker per request, so a worker always gets an idle request
+        self._executor = ThreadPoolExecutor(num_requests, thread_name_prefix="InferRequestPool")
+        # the number of submitted inferences, submit waits for an idle request if all requests are busy
+        self._slots = threading.BoundedSemaphore(num_requests)
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def _infer(self, inputs: list[Any], get_result: Callable[[InferRequest], Any]) -> Any:
+        request = self._idle_requests.get()
+        try:
+            # the input tensors share memory with the arrays, the arrays are kept alive until the inference ends
+            request.infer(inputs, share_inputs=True, share_outputs=True)
+            return get_result(request)
+        finally:
+            self._idle_requests.put(request)
+
+    def _submit(self, inputs: list[Any], get_result: Callable[[InferRequest], Any]) -> Future:
+        future = self._executor.submit(self._infer, inputs, get_result)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future: Future) -> None:
+        with self._lock:
+            self._pending.discard(future)
+
+    def submit(self, inputs: list[Any], get_result: Callable[[InferRequest], Any]) -> Future:
+        # waits for an idle request if all requests are busy
+        self._slots.acquire()
+        try:
+            future = self._submit(inputs, get_result)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    async def submit_async(self, inputs: list[Any], get_result: Callable[[InferRequest], Any]) -> Any:
+        # the executor runs at most num_requests inferences and queues the rest, so the event loop is not blocked
+        return await asyncio.wrap_future(self._submit(inputs, get_result))
+
+    def wait_all(self) -> None:
+        with self._lock:
+            pending = list(self._pending)
+        wait(pending)
+
+
+class TokenizerRuntime:
+    """
+    Runs the converted tokenizer and detokenizer with a pool of infer requests.
+
+    A single `CompiledModel` call uses one implicit infer request, so the calls from several threads run one
+    by one. The runtime keeps a pool of infer requests for each model, so the concurrent `encode` and `decode`
+    calls, `encode_batch` and the async methods run in parallel and load all CPU streams:
+
+        runtime = TokenizerRuntime.from_hf_tokenizer(hf_tokenizer)
+        runtime.encode(["Test string"])["input_ids"]
+        runtime.encode_batch(["First text", "Second text"])
+        await runtime.encode_async("Test string")
+
+    The returned arrays are numpy views of the output tensors without copies, the infer request gets new
+    output tensors after each inference. Stateful streaming detokenizers keep the state in an infer request
+    and should not be used with the pool.
+
+    With the `EncodingCache`, the outputs for each text are cached and the repeated texts, like system prompts,
+    are not tokenized again: only the texts missing from the cache are tokenized in one batch and the outputs
+    are merged in the order of the texts. The cached outputs are copied, so they do not share memory with
+    the output tensors. Pass `use_cache=False` to bypass the cache for one call:
+
+        runtime = TokenizerRuntime("openvino_tokenizer.xml", cache=EncodingCache(max_size_bytes=64 * 1024**2))
+        runtime.encode([system_prompt, user_message])
+        runtime.cache.get_stats()["hit_rate"]
+
+    :param tokenizer: The tokenizer model, compiled model or a path to the model file.
+    :type tokenizer: Union[openvino.Model, openvino.CompiledModel, str, Path]
+    :param detokenizer: The detokenizer model, compiled model or a path to the model file.
+    :type detokenizer: Optional[Union[openvino.Model, openvino.CompiledModel, str, Path]]
+    :param device: The device to compile the models for.
+    :type device: str
+    :param config: The compilation config, the THROUGHPUT performance hint is used by default.
+    :type config: Optional[dict[str, Any]]
+    :param num_requests: The number of infer requests for each model, the optimal number is used if 0.
+    :type num_requests: int
+    :param core: The core to read and compile the models with.
+    :type core: Optional[openvino.Core]
+    :param cache: The cache of the tokenizer outputs, the outputs are keyed by the texts and the model
+        from `get_model_cache_key`, so one cache can be shared by several runtimes.
+    :type cache: Optional[EncodingCache]
+    """
+
+    def __init__(
+        self,
+        tokenizer: Optional[Union[Model, CompiledModel, str, Path]] = None,
+        detokenizer: Optional[Union[Model, CompiledModel, str, Path]] = None,
+        device: str = "CPU",
+        config: Optional[dict[str, Any]] = None,
+        num_requests: int = 0,
+        core: Optional[Core] = None,
+        cache: Optional[EncodingCache] = None,
+    ) -> None:
+        if tokenizer is None and detokenizer is None:
+            raise ValueError("Pass the tokenizer or the detokenizer model.")
+
+        core = core or Core()
+        config = DEFAULT_RUNTIME_CONFIG if config is None else config
+        self.cache = cache if tokenizer is not None else None
+        if self.cache is not None:
+            if isinstance(tokenizer, (str, Path)):
+                # the compiled model has no rt_info, read it from the model file
+                tokenizer = core.read_model(tokenizer)
+            self._cache_key = get_model_cache_key(tokenizer)
+
+        self.tokenizer_pool = self._create_pool(tokenizer, core, device, config, num_requests)
+        self.detokenizer_pool = self._create_pool(detokenizer, core, device, config, num_requests)
+
+        if self.cache is not None:
+            compiled_model = self.tokenizer_pool.compiled_model
+            if sum(model_input.get_element_type() == Type.string for model_input in compiled_model.inputs) > 1:
+                raise ValueError("The encoding cache does not support the tokenizers with two inputs.")
+            self._output_types = {
+                output.get_any_name(): output.get_element_type().to_dtype() for output in compiled_model.outputs
+            }
+            self._row_padding = self._get_row_padding()
+
+    @classmethod
+    def from_hf_tokenizer(
+        cls,
+        hf_tokenizer: "PreTrainedTokenizerBase",  # noqa
+        device: str = "CPU",
+        config: Optional[dict[str, Any]] = None,
+        num_requests: int = 0,
+        cache: Optional[EncodingCache] = None,
+        **convert_kwargs: Any,
+    ) -> "TokenizerRuntime":
+        """Converts the Huggingface tokenizer with a detokenizer and creates the runtime for them.
+
+        :param convert_kwargs: The `convert_tokenizer` parameters.
+        """
+        from .convert_tokenizer import convert_tokenizer
+
+        convert_kwargs["with_detokenizer"] = True
+        ov_tokenizer, ov_detokenizer = convert_tokenizer(hf_tokenizer, **convert_kwargs)
+        return cls(ov_tokenizer, ov_detokenizer, device=device, config=config, num_requests=num_requests, cache=cache)
+
+    @staticmethod
+    def _create_pool(
+        model: Optional[Union[Model, CompiledModel, str, Path]],
+        core: Core,
+        device: str,
+        config: dict[str, Any],
+        num_requests: int,
+    ) -> Optional[InferRequestPool]:
+        if model is None:
+            return None
+        if not isinstance(model, CompiledModel):
+            model = core.compile_model(model, device, config)
+        return InferRequestPool(model, num_requests)
+
+    def _get_tokenizer_pool(self) -> InferRequestPool:
+        if self.tokenizer_pool is None:
+            raise ValueError("The runtime is created without the tokenizer model.")
+        return self.tokenizer_pool
+
+    def _get_detokenizer_pool(self) -> InferRequestPool:
+        if self.detokenizer_pool is None:
+            raise ValueError("The runtime is created without the detokenizer model.")
+        return self.detokenizer_pool
+
+    def _prepare_texts(self, texts: TextInput, pair_texts: Optional[TextInput] = None) -> list[np.ndarray]:
+        texts = (texts,) if pair_texts is None else (texts, pair_texts)
+        return prepare_string_inputs(self._get_tokenizer_pool().compiled_model, *texts)
+
+    def _prepare_token_ids(self, token_ids: Union[np.ndarray, Iterable[Iterable[int]]]) -> list[np.ndarray]:
+        input_type = self._get_detokenizer_pool().compiled_model.input(0).get_element_type().to_dtype()
+        token_ids = np.asarray(token_ids).astype(input_type, copy=False)
+        if token_ids.ndim == 1:
+            token_ids = token_ids[np.newaxis, :]
+        return [token_ids]
+
+    def _get_encoded(self, request: InferRequest) -> dict[str, np.ndarray]:
+        compiled_model = self.tokenizer_pool.compiled_model
+        tensors = detach_outputs(request, compiled_model)
+        return {output.get_any_name(): tensor.data for output, tensor in zip(compiled_model.outputs, tensors)}
+
+    def _get_row_padding(self) -> Optional[RowPadding]:
+        outputs = self.encode(PADDING_PROBE_TEXTS, use_cache=False)
+        if ROW_OFFSETS_OUTPUT_NAME in outputs or all(output.ndim == 1 for output in outputs.values()):
+            return None
+        if ATTENTION_MASK_INPUT_NAME not in outputs:
+            raise ValueError("The encoding cache needs the attention mask output to unpad the tokenizer outputs.")
+        return RowPadding.from_outputs(outputs)
+
+    def _get_cached_texts(
+        self, texts: TextInput, pair_texts: Optional[TextInput], use_cache: bool
+    ) -> Optional[list[str]]:
+        # the cache is used for the Python strings only, the Arrow and numpy inputs bypass it
+        if self.cache is None or not use_cache or pair_texts is not None:
+            return None
+        if isinstance(texts, str):
+            return [texts]
+        if isinstance(texts, (list, tuple)) and texts and all(isinstance(text, str) for text in texts):
+            return list(texts)
+        return None
+
+    def _prepare_encode(
+        self, texts: TextInput, pair_texts: Optional[TextInput], use_cache: bool
+    ) -> tuple[Optional[list[np.ndarray]], Callable[[Optional[InferRequest]], dict[str, np.ndarray]]]:
+        """Returns the tokenizer inputs, None if all texts are cached, and the function to get the outputs."""
+        cached_texts = self._get_cached_texts(texts, pair_texts, use_cache)
+        if cached_texts is None:
+            return self._prepare_texts(texts, pair_texts), self._get_encoded
+
+        rows = [self.cache.get(self._cache_key, text) for text in cached_texts]
+        # the repeated texts missing from the cache are tokenized once
+        missing_texts = list(dict.fromkeys(text for text, row in zip(cached_texts, rows) if row is None))
+        inputs = self._prepare_texts(missing_texts) if missing_texts else None
+        return inputs, partial(self._get_encoded_with_cache, cached_texts, rows, missing_texts)
+
+    def _get_encoded_with_cache(
+        self,
+        texts: list[str],
+        rows: list[Optional[dict[str, np.ndarray]]],
+        missing_texts: list[str],
+        request: Optional[InferRequest],
+    ) -> dict[str, np.ndarray]:
+        if missing_texts:
+            # copy the rows, so the cached rows do not keep the output tensors of the whole batch alive
+            missing_rows = [
+                {name: np.array(output) for name, output in row.items()}
+                for row in split_rows(self._get_encoded(request))
+            ]
+            for text, row in zip(missing_texts, missing_rows):
+                self.cache.put(self._cache_key, text, row)
+            row_by_text = dict(zip(missing_texts, missing_rows))
+            rows = [row_by_text[text] if row is None else row for text, row in zip(texts, rows)]
+        return merge_rows(rows, self._output_types, self._row_padding)
+
+    def _get_decoded(self, request: InferRequest) -> list[str]:
+        compiled_model = self.detokenizer_pool.compiled_model
+        return request.get_tensor(compiled_model.output(STRING_OUTPUT_NAME)).str_data.tolist()
+
+    def encode(
+        self, texts: TextInput, pair_texts: Optional[TextInput] = None, use_cache: bool = True
+    ) -> dict[str, np.ndarray]:
+        """Tokenizes the text or the batch of texts.
+
+        :param texts: The text or the batch of texts, Arrow string arrays and numpy arrays of bytes are passed
+            without copying to the tokenizers converted with `unpacked_string_input`.
+        :type texts: Union[str, Iterable[str], np.ndarray, pyarrow.Array]
+        :param pair_texts: The second texts for the tokenizers converted with two inputs.
+        :type pair_texts: Optional[Union[str, Iterable[str]]]
+        :param use_cache: Whether to use the encoding cache of the runtime, pass False to bypass it.
+        :type use_cache: bool
+        :return: The tokenizer outputs by the output names.
+        :rtype: dict[str, np.ndarray]
+        """
+        return self.submit_encode(texts, pair_texts, use_cache).result()
+
+    def encode_batch(self, batch: Iterable[TextInput]) -> list[dict[str, np.ndarray]]:
+        """Tokenizes each item of the batch with a separate inference, the inferences run in parallel.
+
+        Unlike `encode` with a list of texts, the outputs of different items are not padded to the same length.
+
+        :param batch: The texts or the batches of texts.
+        :type batch: Iterable[Union[str, Iterable[str]]]
+        :return: The tokenizer outputs for each item.
+        :rtype: list[dict[str, np.ndarray]]
+        """
+        futures = [self.submit_encode(texts) for texts in batch]
+        return [future.result() for future in futures]
+
+    def decode(self, token_ids: Union[np.ndarray, Iterable[Iterable[int]]]) -> list[str]:
+        """Detokenizes the token ids.
+
+        :param token_ids: The token ids of one sequence or a batch of sequences of the same length.
+        :type token_ids: Union[np.ndarray, Iterable[Iterable[int]]]
+        :return: The decoded strings.
+        :rtype: list[str]
+        """
+        return self.submit_decode(token_ids).result()
+
+    def submit_encode(
+        self, texts: TextInput, pair_texts: Optional[TextInput] = None, use_cache: bool = True
+    ) -> Future:
+        """Starts the tokenization and returns the future of the `encode` result without waiting for it."""
+        inputs, get_result = self._prepare_encode(texts, pair_texts, use_cache)
+        if inputs is None:
+            future = Future()
+            future.set_result(get_result(None))
+            return future
+        return self._get_tokenizer_pool().submit(inputs, get_result)
+
+    def submit_decode(self, token_ids: Union[np.ndarray, Iterable[Iterable[int]]]) -> Future:
+        """Starts the detokenization and returns the future of the `decode` result without waiting for it."""
+        pool = self._get_detokenizer_pool()
+        return pool.submit(self._prepare_token_ids(token_ids), self._get_decoded)
+
+    async def encode_async(
+        self, texts: TextInput, pair_texts: Optional[TextInput] = None, use_cache: bool = True
+    ) -> dict[str, np.ndarray]:
+        """The asyncio version of `encode`."""
+        inputs, get_result = self._prepare_encode(texts, pair_texts, use_cache)
+        if inputs is None:
+            return get_result(None)
+        return await self._get_tokenizer_pool().submit_async(inputs, get_result)
+
+    async def decode_async(self, token_ids: Union[np.ndarray, Iterable[Iterable[int]]]) -> list[str]:
+        """The asyncio version of `decode`."""
+        pool = self._get_detokenizer_pool()
+        return await pool.submit_async(self._prepare_token_ids(token_ids), self._get_decoded)
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from openvino import Core, Model, Node, OVAny, save_model
+
+from .constants import DETOKENIZER_NAME, SHARED_WEIGHTS_RT_INFO_NAME, TOKENIZER_NAME
+
+
+def get_node_ids(outputs: list[Node]) -> set[int]:
+    """Collects the instance ids of the nodes that the passed nodes depend on, including the nodes themselves."""
+    node_ids = set()
+    stack = list(outputs)
+    while stack:
+        node = stack.pop()
+        if node.get_instance_id() in node_ids:
+            continue
+        node_ids.add(node.get_instance_id())
+        stack.extend(input_value.get_node() for input_value in node.input_values())
+    return node_ids
+
+
+def copy_rt_info(source: dict[str, Any], target: Model, path: Optional[list[str]] = None) -> None:
+    path = path or []
+    for key, value in source.items():
+        if key == SHARED_WEIGHTS_RT_INFO_NAME and not path:
+            continue
+        if isinstance(value, dict) and value:
+            copy_rt_info(value, target, [*path, key])
+        else:
+            target.set_rt_info(value.value if isinstance(value, OVAny) else value, [*path, key])
+
+
+def save_tokenizers_with_shared_weights(
+    ov_tokenizer: Model,
+    ov_detokenizer: Model,
+    path: Union[str, Path],
+    compress_to_fp16: bool = True,
+) -> None:
+    """Saves the tokenizer and detokenizer models to a single IR with deduplicated constants.
+
+    The tokenizer and detokenizer use the same vocabulary constants. The serialization writes the constants with
+    the same data to the weights file once, so the saved IR is smaller than two separately saved models.
+    Use `read_tokenizers_with_shared_weights` to read the models back, the loaded models share the memory
+    of the deduplicated constants. The rt_info of the tokenizer model is saved for both models.
+
+    :param ov_tokenizer: The tokenizer model.
+    :type ov_tokenizer: openvino.Model
+    :param ov_detokenizer: The detokenizer model.
+    :type ov_detokenizer: openvino.Model
+    :param path: The path to the .xml file, the weights are saved to the .bin file next to it.
+    :type path: Union[str, Path]
+    :param compress_to_fp16: Passed to `openvino.save_model`.
+    :type compress_to_fp16: bool
+    """
+    combined_model = Model(
+        ov_tokenizer.get_results() + ov_detokenizer.get_results(),
+        ov_tokenizer.get_sinks() + ov_detokenizer.get_sinks(),
+        ov_tokenizer.get_parameters() + ov_detokenizer.get_parameters(),
+        f"{ov_tokenizer.get_name()}_and_{ov_detokenizer.get_name()}",
+    )
+    copy_rt_info(ov_tokenizer.get_rt_info(), combined_model)
+    # the order of the inputs and outputs is kept in the IR, the counts are enough to split the models
+    combined_model.set_rt_info(len(ov_tokenizer.inputs), [SHARED_WEIGHTS_RT_INFO_NAME, "tokenizer_inputs"])
+    combined_model.set_rt_info(len(ov_tokenizer.outputs), [SHARED_WEIGHTS_RT_INFO_NAME, "tokenizer_outputs"])
+    save_model(combined_model, path, compress_to_fp16=compress_to_fp16)
+
+
+def split_tokenizers(combined_model: Model) -> tuple[Model, Model]:
+    """Splits the model saved by `save_tokenizers_with_shared_weights` into tokenizer and detokenizer models.
+
+    :param combined_model: The model with tokenizer and detokenizer subgraphs.
+    :type combined_model: openvino.Model
+    :return: The tokenizer and detokenizer models.
+    :rtype: tuple[openvino.Model, openvino.Model]
+    """
+    if not combined_model.has_rt_info(SHARED_WEIGHTS_RT_INFO_NAME):
+        raise ValueError("The model is not saved with `save_tokenizers_with_shared_weights`.")
+
+    num_inputs = combined_model.get_rt_info([SHARED_WEIGHTS_RT_INFO_NAME, "tokenizer_inputs"]).astype(int)
+    num_outputs = combined_model.get_rt_info([SHARED_WEIGHTS_RT_INFO_NAME, "tokenizer_outputs"]).astype(int)
+    parameters = combined_model.get_parameters()
+    results = combined_model.get_results()
+
+    # a stateful op belongs to the model that reads the state, the subgraphs of the models are disjoint
+    tokenizer_node_ids = get_node_ids(results[:num_outputs])
+    tokenizer_sinks, detokenizer_sinks = [], []
+    for sink in combined_model.get_sinks():
+        is_tokenizer_sink = not tokenizer_node_ids.isdisjoint(get_node_ids([sink]))
+        (tokenizer_sinks if is_tokenizer_sink else detokenizer_sinks).append(sink)
+
+    rt_info = combined_model.get_rt_info()
+    models = []
+    for name, model_results, model_sinks, model_parameters in (
+        (TOKENIZER_NAME, results[:num_outputs], tokenizer_sinks, parameters[:num_inputs]),
+        (DETOKENIZER_NAME, results[num_outputs:], detokenizer_sinks, parameters[num_inputs:]),
+    ):
+        model = Model(model_results, model_sinks, model_parameters, name)
+        copy_rt_info(rt_info, model)
+        models.append(model)
+
+    return models[0], models[1]
+
+
+def read_tokenizers_with_shared_weights(path: Union[str, Path], core: Optional[Core] = None) -> tuple[Model, Model]:
+    """Reads the tokenizer and detokenizer models saved by `save_tokenizers_with_shared_weights`.
+
+    The weights file is memory mapped by `openvino.Core.read_model`, the deduplicated constants of both models
+    point to the same memory.
+
+    :param path: The path to the .xml file.
+    :type path: Union[str, Path]
+    :param core: The core to read the model with, a new core is created if not passed.
+    :type core: Optional[openvino.Core]
+    :return: The tokenizer and detokenizer models.
+    :rtype: tuple[openvino.Model, openvino.Model]
+    """
+    core = core or Core()
+    return split_tokenizers(core.read_model(path))
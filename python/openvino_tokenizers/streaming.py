@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+# Copyright (C) 2018-2026 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+import re
+from collections import deque
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Optional, TextIO, Union
+
+import numpy as np
+from openvino import CompiledModel
+
+from .constants import TOKEN_IDS_INPUT_NAME
+from .runtime import TokenizerRuntime, prepare_string_inputs, split_rows
+
+
+DEFAULT_CHUNK_SIZE = 1024**2
+# a letter or a digit followed by a whitespace: no pre-tokenizer split pattern continues a letter or digit run
+# with a whitespace, so the whitespace starts a new split both in the whole text and in the next chunk
+SAFE_CUT_PATTERN = re.compile(r"[^\W_](?=\s)")
+SAFE_CUT_SEARCH_WINDOW = 4096
+
+TextSource = Union[str, Path, TextIO, Iterable[str]]
+
+
+def find_safe_cut(text: str, end: int) -> int:
+    """Finds the last safe cut position of the text not greater than `end`.
+
+    The cut is safe between a letter or a digit and a whitespace. The pre-tokenizers of the byte-level BPE
+    tokenizers, like GPT-2, cl100k and o200k, and of the WordPiece tokenizers never put these characters into
+    one split, so the text can be tokenized in parts with the same token ids.
+
+    :param text: The text to cut.
+    :type text: str
+    :param end: The maximum length of the text before the cut.
+    :type end: int
+    :return: The cut position, 0 if the text has no safe cut position up to `end`.
+    :rtype: int
+    """
+    # search the windows from the end, a match takes two characters, so the windows overlap by one character
+    window_end = min(end, len(text) - 1) + 1
+    while window_end > 0:
+        window_start = max(window_end - SAFE_CUT_SEARCH_WINDOW, 0)
+        cut = 0
+        for match in SAFE_CUT_PATTERN.finditer(text, window_start, window_end):
+            cut = match.end()
+        if cut or window_start == 0:
+            return cut
+        window_end = window_start + 1
+    return 0
+
+
+def _iter_text_pieces(source: TextSource, chunk_size: int) -> Iterator[str]:
+    if isinstance(source, (str, Path)):
+        # the line endings are kept as is, like in the whole text read from the file
+        with open(source, encoding="utf-8", newline="") as f:
+            yield from _iter_text_pieces(f, chunk_size)
+    elif hasattr(source, "read"):
+        while piece := source.read(chunk_size):
+            yield piece
+    else:
+        yield from source
+
+
+def iter_text_chunks(
+    source: TextSource, chunk_size: int = DEFAULT_CHUNK_SIZE, max_chunk_size: Optional[int] = None
+) -> Iterator[str]:
+    """Reads the text from the source and splits it into chunks at the safe cut positions, see `find_safe_cut`.
+
+    Only the current chunk and the next read piece are kept in memory. A chunk is cut at the last safe position
+    within `chunk_size` characters or, if there is none, at the first one within `max_chunk_size` characters.
+
+    :param source: The path to a UTF-8 text file, a text file object or an iterable of text pieces.
+    :type source: Union[str, Path, TextIO, Iterable[str]]
+    :param chunk_size: The preferred maximum number of characters in a chunk.
+    :type chunk_size: int
+    :param max_chunk_size: The maximum number of characters in a chunk, 16 times `chunk_size` by default.
+    :type max_chunk_size: Optional[int]
+    :return: The chunks of the text.
+    :rtype: Iterator[str]
+    :raises ValueError: If the text has no safe cut position within `max_chunk_size` characters.
+    """
+    max_chunk_size = max_chunk_size or 16 * chunk_size
+    if chunk_size <= 0 or max_chunk_size < chunk_size:
+        raise ValueError(
+            f"Chunk size should be positive and not greater than the maximum chunk size, "
+            f"got {chunk_size} and {max_chunk_size}."
+        )
+
+    buffer = ""
+    for piece in _iter_text_pieces(source, chunk_size):
+        buffer += piece
+        while len(buffer) > chunk_size:
+            cut = find_safe_cut(buffer, chunk_size)
+            if not cut:
+                match = SAFE_CUT_PATTERN.search(buffer, chunk_size, max_chunk_size + 1)
+                if match is not None:
+                    cut = match.end()
+                elif len(buffer) > max_chunk_size:
+                    raise ValueError(
+                        f"The text has no safe cut position within {max_chunk_size} characters, "
+                        "increase the maximum chunk size."
+                    )
+                else:
+                    break  # read more text to find the cut
+            yield buffer[:cut]
+            buffer = buffer[cut:]
+    if buffer:
+        yield buffer
+
+
+def _encode_chunks(
+    tokenizer: Union[CompiledModel, TokenizerRuntime], chunks: Iterable[list[str]]
+) -> Iterator[dict[str, np.ndarray]]:
+    if not isinstance(tokenizer, TokenizerRuntime):
+        for batch in chunks:
+            # the compiled model reuses the output memory for the next call
+            outputs = tokenizer(prepare_string_inputs(tokenizer, batch))
+            yield {output.get_any_name(): value.copy() for output, value in outputs.items()}
+        return
+
+    # keep one batch for each infer request in flight, the results are returned in the chunk order
+    pending = deque()
+    for batch in chunks:
+        pending.append(tokenizer.submit_encode(batch))
+        if len(pending) > tokenizer.tokenizer_pool.num_requests:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _batch_chunks(chunks: Iterator[str], batch_size: int) -> Iterator[list[str]]:
+    batch = []
+    for chunk in chunks:
+        batch.append(chunk)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def encode_stream(
+    tokenizer: Union[CompiledModel, TokenizerRuntime],
+    source: TextSource,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_chunk_size: Optional[int] = None,
+    batch_size: int = 1,
+) -> Iterator[np.ndarray]:
+    """Tokenizes a large text in chunks and yields the token ids of each chunk.
+
+    The text is read from the source and cut into chunks at the safe positions, so the memory is bounded by
+    the chunk size instead of the text size, and the concatenated token ids are the same as for the whole text:
+
+        token_ids = np.concatenate(list(encode_stream(compiled_tokenizer, "large_document.txt")))
+
+    The chunks are tokenized separately, so the tokenizer should be converted with `add_special_tokens=False`,
+    without truncation and without `add_prefix_space`, the special tokens of the whole text are added by
+    the caller. The safe cut positions are defined for the byte-level BPE and WordPiece tokenizers, the other
+    pre-tokenizers, like the SentencePiece ones with the `▁` prefix, and the added tokens with whitespaces
+    are not guaranteed to give the same token ids. The chunks run in parallel with `TokenizerRuntime`.
+
+    :param tokenizer: The compiled tokenizer model or the runtime with the tokenizer model.
+    :type tokenizer: Union[openvino.CompiledModel, TokenizerRuntime]
+    :param source: The path to a UTF-8 text file, a text file object or an iterable of text pieces.
+    :type source: Union[str, Path, TextIO, Iterable[str]]
+    :param chunk_size: The preferred maximum number of characters in a chunk.
+    :type chunk_size: int
+    :param max_chunk_size: The maximum number of characters in a chunk, see `iter_text_chunks`.
+    :type max_chunk_size: Optional[int]
+    :param batch_size: The number of chunks tokenized in one inference.
+    :type batch_size: int
+    :return: The token ids of each chunk.
+    :rtype: Iterator[np.ndarray]
+    """
+    chunks = iter_text_chunks(source, chunk_size, max_chunk_size)
+    for outputs in _encode_chunks(tokenizer, _batch_chunks(chunks, batch_size)):
+        for row in split_rows(outputs):
+            yield row[TOKEN_IDS_INPUT_NAME]
@@ -1,23 +1,28 @@
+from math import inf
 from typing import Optional
 
 from tiktoken import Encoding
 
 
 def bpe(mergeable_ranks: dict[bytes, int], token: bytes, max_rank: Optional[int] = None) -> list[bytes]:
-    parts = [bytes([b]) for b in token]
-    while True:
-        min_idx = None
-        min_rank = None
-        for i, pair in enumerate(zip(parts[:-1], parts[1:])):
-            rank = mergeable_ranks.get(pair[0] + pair[1])
-            if rank is not None and (min_rank is None or rank < min_rank):
-                min_idx = i
-                min_rank = rank
-        if min_rank is None or (max_rank is not None and min_rank >= max_rank):
+    rank_limit = inf if max_rank is None else max_rank
+    get_rank = mergeable_ranks.get
+
+    parts = [token[idx : idx + 1] for idx in range(len(token))]
+    # rank of the merge of each pair of adjacent parts, only the neighbours of the merged pair change on each step
+    pair_ranks = [get_rank(left + right, inf) for left, right in zip(parts, parts[1:])]
+    while pair_ranks:
+        min_rank = min(pair_ranks)
+        if min_rank >= rank_limit:
             break
-        if min_idx is None:
-            raise ValueError(f"Tiktoken conversion error: cannot determine bpe for token {token}.")
-        parts = parts[:min_idx] + [parts[min_idx] + parts[min_idx + 1]] + parts[min_idx + 2 :]
+        # the leftmost pair wins the tie
+        min_idx = pair_ranks.index(min_rank)
+        parts[min_idx : min_idx + 2] = [parts[min_idx] + parts[min_idx + 1]]
+        del pair_ranks[min_idx]
+        if min_idx > 0:
+            pair_ranks[min_idx - 1] = get_rank(parts[min_idx - 1] + parts[min_idx], inf)
+        if min_idx < len(pair_ranks):
+            pair_ranks[min_idx] = get_rank(parts[min_idx] + parts[min_idx + 1], inf)
     return parts
 
 
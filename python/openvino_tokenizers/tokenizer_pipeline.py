@@ -27,13 +27,16 @@ from .constants import (
     ATTENTION_MASK_INPUT_NAME,
     DETOKENIZER_NAME,
     MIN_CACHE_CAPACITY,
+    ROW_OFFSETS_OUTPUT_NAME,
     STRING_OUTPUT_NAME,
+    TOKEN_COUNT_OUTPUT_NAME,
     TOKEN_IDS_INPUT_NAME,
     TOKEN_TYPE_IDS_INPUT_NAME,
     TOKENIZER_NAME,
     VOCAB_SIZE_CACHE_PROPORTION,
     UTF8ReplaceMode,
 )
+from .profiling import profile_stage
 from .utils import (
     apply_unicode_to_bytes,
     create_string_constant_node,
@@ -1026,6 +1029,13 @@ class CombineSegmentsStep(PostTokenizationStep):
     def number_of_added_tokens(self) -> int:
         return sum(1 for input_ in self.inputs if (isinstance(input_, AddToken) and input_.enabled_by_default))
 
+    @property
+    def is_identity(self) -> bool:
+        """
+        A single sequence without added tokens, CombineSegments only copies the ragged tensor in that case.
+        """
+        return len(self.inputs) == 1 and isinstance(self.inputs[0], Sequence)
+
     @classmethod
     def from_hf_json_template_postprocessor(
         cls, post_processor_dict: dict[str, Any], number_of_inputs: int = 1, add_special_tokens: bool = True
@@ -1170,6 +1180,7 @@ class PaddingStep(PostTokenizationStep, SpecialTokenWithId):
     max_length: int = -1
     axis: int = -1
     pad_to_max_length: bool = False
+    ragged_output: bool = False
 
     @classmethod
     def from_hf_json(
@@ -1178,6 +1189,7 @@ class PaddingStep(PostTokenizationStep, SpecialTokenWithId):
         pad_to_max_length: bool = False,
         max_length: int = -1,
         pad_right: bool = True,
+        ragged_output: bool = False,
     ) -> "PaddingStep":
         padding_dict = tokenizer_json["padding"]
         padding_strategy = padding_dict.get("strategy", {})
@@ -1191,6 +1203,7 @@ class PaddingStep(PostTokenizationStep, SpecialTokenWithId):
             token_type_id=padding_dict["pad_type_id"],
             max_length=max_length,
             pad_to_max_length=pad_to_max_length,
+            ragged_output=ragged_output,
         )
 
     @staticmethod
@@ -1202,8 +1215,39 @@ class PaddingStep(PostTokenizationStep, SpecialTokenWithId):
                 f"Number of input nodes should be divisible by 3 and bigger or equal 3. Got {len(input_nodes)}"
             )
 
+    def get_ragged_ov_subgraph(self, input_nodes: list[Output]) -> list[Output]:
+        """Packs the rows into flat tensors without gaps and the row offsets instead of padding them.
+
+        The tokens of the row `i` are `input_ids[row_offsets[i]:row_offsets[i + 1]]`, the same layout as
+        the Arrow list arrays.
+        """
+        lengths = opset.subtract(input_nodes[1], input_nodes[0])
+        row_ends = opset.cumsum(lengths, make_constant_node(0, Type.i32))
+        row_offsets = opset.concat([make_constant_node([0], Type.i32), row_ends], axis=0)
+        total_length = opset.reduce_sum(lengths, make_constant_node(0, Type.i32))
+
+        # the row of each output position is the number of row ends that are not greater than the position
+        positions = opset.range(make_constant_node(0, Type.i32), total_length, make_constant_node(1, Type.i32), "i32")
+        rows = opset.bucketize(positions, row_ends, output_type="i32", with_right_bound=False)
+        positions_in_row = opset.subtract(positions, opset.gather(row_offsets, rows, 0))
+
+        outputs = []
+        names = [TOKEN_IDS_INPUT_NAME, TOKEN_TYPE_IDS_INPUT_NAME][: len(input_nodes) // 3]
+        for idx, name in enumerate(names):
+            begins, _, data = input_nodes[3 * idx : 3 * (idx + 1)]
+            data_indices = opset.add(opset.gather(begins, rows, 0), positions_in_row)
+            output = opset.gather(data, data_indices, 0).output(0)
+            output.tensor.add_names({name})
+            outputs.append(output)
+
+        outputs.append(row_offsets.output(0))
+        outputs[-1].add_names({ROW_OFFSETS_OUTPUT_NAME})
+        return outputs
+
     def get_ov_subgraph(self, input_nodes: list[Output]) -> list[Output]:
         self.validate_inputs(input_nodes)
+        if self.ragged_output:
+            return self.get_ragged_ov_subgraph(input_nodes)
 
         outputs = []
 
@@ -1230,6 +1274,9 @@ class PaddingStep(PostTokenizationStep, SpecialTokenWithId):
                     {
                         "pad_right": self.pad_right,
                         "pad_max_length": self.pad_to_max_length,
+                        "mask_element_type": "i32",
+                        # the attention mask is taken from the token ids padding
+                        "compute_mask": idx == 0,
                     },
                 )
                 .outputs()
@@ -1238,9 +1285,7 @@ class PaddingStep(PostTokenizationStep, SpecialTokenWithId):
 
             outputs.append(cur_outputs[0])
             if idx == 0:
-                mask = opset.convert(cur_outputs[1], "i32").output(
-                    0
-                )  # TODO: Change RaggedToDense to generate mask of any type
+                mask = cur_outputs[1]
 
         outputs.append(mask)
         outputs[-1].add_names({ATTENTION_MASK_INPUT_NAME})
@@ -1360,6 +1405,51 @@ class UTF8ValidateStep(DecodingStep):
         return _get_factory().create("UTF8Validate", input_nodes, {"replace_mode": replace_mode}).outputs()
 
 
+@dataclass
+class UTF8StreamStep(DecodingStep):
+    """
+    Holds back the incomplete UTF-8 symbol at the end of the decoded bytes in the model state
+    and prepends it to the bytes decoded on the next call.
+    """
+
+    _stateful_assigns: list[op.Node] = field(default_factory=list, init=False, repr=False)
+
+    HELD_BACK_BYTES_VAR_ID = "held_back_bytes"
+
+    def get_ov_subgraph(self, input_nodes: list[Output]) -> list[Output]:
+        if len(input_nodes) == 5:
+            input_nodes = FuseStep().get_ov_subgraph(input_nodes)
+
+        variable_ids = [f"{self.HELD_BACK_BYTES_VAR_ID}_{part}" for part in ("begins", "ends", "chars")]
+        # empty held back bytes for every string, initial values depend on the input so their shapes are dynamic
+        batch_shape = opset.shape_of(input_nodes[0])
+        empty_shape = opset.multiply(batch_shape, make_constant_node(0, Type.i64))
+        initial_values = [
+            opset.broadcast(make_constant_node(0, Type.i32), batch_shape),
+            opset.broadcast(make_constant_node(0, Type.i32), batch_shape),
+            opset.broadcast(make_constant_node(0, Type.u8), empty_shape),
+        ]
+        held_back_bytes = [
+            opset.read_value(initial_value, variable_id, initial_value.get_output_element_type(0), PartialShape(["?"]))
+            for initial_value, variable_id in zip(initial_values, variable_ids)
+        ]
+
+        outputs = (
+            _get_factory()
+            .create("UTF8StreamSplit", input_nodes + [node.output(0) for node in held_back_bytes])
+            .outputs()
+        )
+        # opset.assign accepts only single output nodes
+        self._stateful_assigns = [
+            _get_opset_factory("opset6").create("Assign", [output], {"variable_id": variable_id})
+            for output, variable_id in zip(outputs[3:], variable_ids)
+        ]
+        return outputs[:3]
+
+    def get_stateful_sinks(self) -> list[op.Node]:
+        return self._stateful_assigns
+
+
 @dataclass
 class ByteFallbackStep(DecodingStep):
     def get_ov_subgraph(self, input_nodes: list[Output]) -> list[Output]:
@@ -1376,6 +1466,10 @@ class RegexDecodingStep(DecodingStep):
     regex_search_pattern: str
     replace_term: str
 
+    @property
+    def is_anchored(self) -> bool:
+        return self.regex_search_pattern.startswith(("^", "(^")) or self.regex_search_pattern.endswith("$")
+
     @classmethod
     def clean_up_tokenization_spaces(cls) -> "RegexDecodingStep":
         return cls(
@@ -1582,22 +1676,45 @@ class TokenizerPipeline:
         if self.finalized:
             return
 
-        self.merge_normalization_steps()
-        self.del_duplicated_split_steps()
-        self.update_metaspace_step_with_special_tokens()
-
-        for step in copy(self.steps):
-            step.finalize()
-
-        # merge after finalizing steps to make sure that BytesToCharsStep is removed
-        self.merge_regex_split_steps()
+        with profile_stage("finalize", kind="finalize"):
+            for finalize_pass in [
+                self.merge_normalization_steps,
+                self.del_duplicated_split_steps,
+                self.update_metaspace_step_with_special_tokens,
+            ]:
+                with profile_stage(finalize_pass.__name__, kind="finalize"):
+                    finalize_pass()
+
+            for step in copy(self.steps):
+                with profile_stage(type(step).__name__, kind="finalize"):
+                    step.finalize()
+
+            # merge after finalizing steps to make sure that BytesToCharsStep is removed
+            with profile_stage("merge_regex_split_steps", kind="finalize"):
+                self.merge_regex_split_steps()
         self.finalized = True
 
+    @staticmethod
+    def get_step_ov_subgraph(step: BasePipelineStep, input_nodes: list[Output]) -> list[Output]:
+        with profile_stage(type(step).__name__, kind="get_ov_subgraph"):
+            return step.get_ov_subgraph(input_nodes)
+
     @property
     def is_metaspace_prepend_first(self) -> bool:
         return isinstance(self.steps[0], RegexNormalizationStep)
 
-    def get_tokenizer_ov_subgraph(self) -> Model:
+    def get_tokenizer_ov_subgraph(self, token_count_output: bool = False, deduplicate_inputs: bool = False) -> Model:
+        """
+        Builds the tokenizer model.
+
+        :param token_count_output: If True, the model ends after the tokenization model and returns only the number
+            of tokens of each row, including the added special tokens. The post-tokenization steps are not
+            built, so the counts are not truncated.
+        :type token_count_output: bool
+        :param deduplicate_inputs: If True, only the unique strings of the batch are normalized, split and tokenized,
+            the duplicates get the tokens of the first occurrence before the post-tokenization steps.
+        :type deduplicate_inputs: bool
+        """
         self.finalize()
 
         string_inputs = [op.Parameter(Type.string, PartialShape(["?"]))]
@@ -1605,19 +1722,21 @@ class TokenizerPipeline:
         processing_outputs = []
         for input_node in string_inputs:
             input_node = _get_opset_factory("opset15").create("StringTensorUnpack", input_node.outputs()).outputs()
+            if deduplicate_inputs:
+                unique_idxs, input_node = self.get_unique_strings(input_node)
 
             if self.is_metaspace_prepend_first:
                 prepend_metaspace_step = self.steps.pop(0)
-                input_node = prepend_metaspace_step.get_ov_subgraph(input_node)
+                input_node = self.get_step_ov_subgraph(prepend_metaspace_step, input_node)
 
             ragged = []
             if isinstance(self.steps[0], SpecialTokensSplit):
                 input_node = self.add_ragged_dimension(input_node)
-                input_node = self.steps[0].get_ov_subgraph(input_node)
+                input_node = self.get_step_ov_subgraph(self.steps[0], input_node)
                 ragged, input_node = input_node[:2], input_node[2:]
 
             for step in self.normalization_steps:
-                input_node = step.get_ov_subgraph(input_node)
+                input_node = self.get_step_ov_subgraph(step, input_node)
 
             if not ragged:
                 input_node = self.add_ragged_dimension(input_node)
@@ -1625,15 +1744,21 @@ class TokenizerPipeline:
                 input_node = ragged + input_node
 
             for step in self.pre_tokenization_steps:
-                input_node = step.get_ov_subgraph(input_node)
+                input_node = self.get_step_ov_subgraph(step, input_node)
 
             for step in self.tokenization_steps:
-                input_node = step.get_ov_subgraph(input_node[:-1])
+                input_node = self.get_step_ov_subgraph(step, input_node[:-1])
+
+            if deduplicate_inputs:
+                input_node = self.gather_unique_rows(input_node, unique_idxs)
 
             processing_outputs.extend(input_node)
 
+        if token_count_output:
+            return self.get_token_count_ov_subgraph(processing_outputs, string_inputs)
+
         for step in self.post_tokenization_steps:
-            processing_outputs = step.get_ov_subgraph(processing_outputs)
+            processing_outputs = self.get_step_ov_subgraph(step, processing_outputs)
 
         model = Model(processing_outputs, string_inputs, name=TOKENIZER_NAME)
 
@@ -1645,6 +1770,43 @@ class TokenizerPipeline:
 
         return model
 
+    @staticmethod
+    def get_unique_strings(input_node: list[Output]) -> tuple[Output, list[Output]]:
+        """
+        Returns the index of the unique string for each input string and the unique strings.
+
+        The unique strings share the chars with the input strings.
+        """
+        unique_begins, unique_ends, unique_idxs = _get_factory().create("UniqueStrings", input_node).outputs()
+        return unique_idxs, [unique_begins, unique_ends, input_node[2]]
+
+    @staticmethod
+    def gather_unique_rows(ragged_node: list[Output], unique_idxs: Output) -> list[Output]:
+        # the rows of the duplicates point to the same elements, the elements are not copied
+        begins, ends, *elements = ragged_node
+        return [
+            opset.gather(begins, unique_idxs, as_node(0)).output(0),
+            opset.gather(ends, unique_idxs, as_node(0)).output(0),
+            *elements,
+        ]
+
+    def get_token_count_ov_subgraph(self, ragged_outputs: list[Output], string_inputs: list[op.Parameter]) -> Model:
+        # CombineSegments adds the same number of special tokens to every row, so the count is the ragged row length
+        # plus a constant
+        begins, ends = ragged_outputs[:2]
+        token_count = opset.subtract(ends, begins)
+
+        number_of_added_tokens = sum(
+            step.number_of_added_tokens
+            for step in self.post_tokenization_steps
+            if isinstance(step, CombineSegmentsStep) and step.add_special_tokens
+        )
+        if number_of_added_tokens:
+            token_count = opset.add(token_count, make_constant_node(number_of_added_tokens, Type.i32))
+
+        token_count.output(0).tensor.set_names({TOKEN_COUNT_OUTPUT_NAME})
+        return Model(token_count.outputs(), string_inputs, name=TOKENIZER_NAME)
+
     @property
     def normalization_steps(self) -> list[NormalizationStep]:
         return [step for step in self.steps if isinstance(step, NormalizationStep)]
@@ -1675,22 +1837,58 @@ class TokenizerPipeline:
         ).outputs()
         return ragged_begins + ragged_ends + input_node
 
-    def create_decoding_pipeline(self, input_nodes: list[Output]) -> list[Output]:
-        for step in self.decoding_steps:
-            pipeline_step = step.get_ov_subgraph(input_nodes)
+    def get_stateful_decoding_steps(self) -> list[DecodingStep]:
+        """
+        Decoding steps for the stateful detokenizer that gets only new token ids on each call.
+
+        The incomplete UTF-8 symbol at the end of the decoded bytes is held back until the next call.
+        Anchored regex steps are skipped: the text of one call is not the beginning or the end of the whole text.
+        The clean up of tokenization spaces can match across the calls, so it is not supported.
+        """
+        clean_up_pattern = RegexDecodingStep.clean_up_tokenization_spaces().regex_search_pattern
+        if any(
+            isinstance(step, RegexDecodingStep) and step.regex_search_pattern == clean_up_pattern
+            for step in self.decoding_steps
+        ):
+            raise ValueError(
+                "Stateful detokenizer does not support clean_up_tokenization_spaces: "
+                "the result would depend on how the token ids are split between the calls. "
+                "Convert the tokenizer with clean_up_tokenization_spaces=False."
+            )
+
+        byte_steps = (VocabDecoderStep, CharsToBytesStep, ByteFallbackStep, FuseStep)
+        steps = self.decoding_steps
+        stream_step_idx = max(idx for idx, step in enumerate(steps) if isinstance(step, byte_steps)) + 1
+        steps = [*steps[:stream_step_idx], UTF8StreamStep(), *steps[stream_step_idx:]]
+        return [step for step in steps if not (isinstance(step, RegexDecodingStep) and step.is_anchored)]
+
+    def create_decoding_pipeline(
+        self, input_nodes: list[Output], decoding_steps: Optional[list[DecodingStep]] = None
+    ) -> list[Output]:
+        for step in decoding_steps if decoding_steps is not None else self.decoding_steps:
+            pipeline_step = self.get_step_ov_subgraph(step, input_nodes)
             input_nodes = pipeline_step
 
         return _get_opset_factory("opset15").create("StringTensorPack", input_nodes).outputs()
 
-    def get_detokenizer_ov_subgraph(self) -> Model:
+    def get_detokenizer_ov_subgraph(self, stateful: bool = False) -> Model:
         self.finalize()
 
         if not any(isinstance(step, VocabDecoderStep) for step in self.decoding_steps):
             raise NotImplementedError("Detokenizer is not supported for this model yet!")
 
+        decoding_steps = self.get_stateful_decoding_steps() if stateful else self.decoding_steps
+
         input_node = op.Parameter(Type.i32, PartialShape(["?", "?"]))
         token_ids = input_node
-        outputs = self.create_decoding_pipeline([token_ids])
+        outputs = self.create_decoding_pipeline([token_ids], decoding_steps)
         model = Model(outputs, [input_node], name=DETOKENIZER_NAME)
         model.output().tensor.add_names({STRING_OUTPUT_NAME})
+
+        stateful_sinks = []
+        for step in decoding_steps:
+            if isinstance(step, UTF8StreamStep):
+                stateful_sinks.extend(step.get_stateful_sinks())
+        model.add_sinks(stateful_sinks)
+
         return model
@@ -13,7 +13,12 @@ from openvino.passes import Manager, ModelPass
 from openvino.utils.types import make_constant_node
 
 from . import _get_factory
-from .constants import PROCESSED_POST_PROCESSOR_NAME
+from .constants import (
+    PROCESSED_POST_PROCESSOR_NAME,
+    STRING_BEGINS_INPUT_NAME,
+    STRING_CHARS_INPUT_NAME,
+    STRING_ENDS_INPUT_NAME,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -302,3 +307,54 @@ def add_second_input(model: ov.Model):
     manager = Manager()
     manager.register_pass(ModifyCombineSegmentsForPairInput())
     manager.run_passes(model)
+
+
+class ReplaceStringInputWithUnpacked(ModelPass):
+    """
+    Replaces the string input of the tokenizer with the begins, ends and chars inputs.
+
+    The string input is consumed by the `StringTensorUnpack` node only, its outputs are replaced with the new
+    Parameters, so the caller passes the unpacked strings and the string tensor is not created.
+    """
+
+    def run_on_model(self, model: ov.Model) -> bool:
+        string_parameters = [
+            (idx, parameter)
+            for idx, parameter in enumerate(model.get_parameters())
+            if parameter.get_element_type() == Type.string
+        ]
+        if len(string_parameters) != 1:
+            return False
+
+        idx, parameter = string_parameters[0]
+        target_inputs = list(parameter.output(0).get_target_inputs())
+        if len(target_inputs) != 1 or target_inputs[0].get_node().get_type_name() != "StringTensorUnpack":
+            return False
+        str_unpack = target_inputs[0].get_node()
+
+        new_parameters = []
+        for output in str_unpack.outputs():
+            new_parameter = ov.op.Parameter(output.get_element_type(), PartialShape([-1]))
+            output.replace(new_parameter.output(0))
+            new_parameters.append(new_parameter)
+
+        model.replace_parameter(idx, new_parameters[0])
+        model.add_parameters(new_parameters[1:])
+        # the replaced parameter passes its tensor names to the new one
+        for new_parameter, name in zip(
+            new_parameters, (STRING_BEGINS_INPUT_NAME, STRING_ENDS_INPUT_NAME, STRING_CHARS_INPUT_NAME)
+        ):
+            new_parameter.set_friendly_name(name)
+            new_parameter.output(0).set_names({name})
+        return True
+
+
+def replace_string_input_with_unpacked(model: ov.Model) -> None:
+    """
+    Replaces inplace the string input of the tokenizer with the begins, ends and chars inputs.
+    """
+    manager = Manager()
+    manager.register_pass(ReplaceStringInputWithUnpacked())
+    manager.run_passes(model)
+    if any(parameter.get_element_type() == Type.string for parameter in model.get_parameters()):
+        raise ValueError("Only the tokenizers with a single string input can take unpacked strings.")
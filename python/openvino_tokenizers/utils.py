@@ -54,9 +54,32 @@ class TokenzierConversionParams:
     streaming_detokenizer : bool
         If True, enables streaming mode for the detokenizer. Default is False.
 
+    stateful_detokenizer : bool
+        If True, the detokenizer is stateful: it takes only new token ids on each call, returns only the new text
+        and holds back an incomplete UTF-8 symbol until the next call. Use `reset_state` of the infer request
+        to start a new sequence. Not supported for the SentencePiece backend and with
+        `clean_up_tokenization_spaces`. Default is False.
+
     use_max_padding : bool
         If True, enables maximum padding for the tokenizer. Default is False.
 
+    ragged_output : bool
+        If True, the tokenizer returns the token ids of all rows in a flat `input_ids` tensor and the `row_offsets`
+        tensor instead of the padded `input_ids` and `attention_mask`, the tokens of the row `i` are
+        `input_ids[row_offsets[i]:row_offsets[i + 1]]`. Not supported for the SentencePiece backend. Default is False.
+
+    token_count_output : bool
+        If True, the tokenizer returns only the `token_count` output with the number of tokens of each row, including
+        the added special tokens. The graph ends after the tokenization model: the tokens are not combined with the
+        special tokens, truncated or padded, so the counts are not limited by `max_length`. Not supported for the
+        SentencePiece backend and with `number_of_inputs=2`. Default is False.
+
+    deduplicate_inputs : bool
+        If True, the tokenizer processes each unique string of the batch once and copies its tokens to the duplicates
+        before the special tokens are added, so the batches with repeated texts, such as a system prompt or a query
+        paired with many documents, take the time of the unique texts. Not supported for the SentencePiece backend.
+        Default is False.
+
     truncation : bool
         If True, enables truncation by default for the tokenizer. Default is False.
 
@@ -74,6 +97,10 @@ class TokenzierConversionParams:
         Allowed values are UTF8ReplaceMode.DISABLE, UTF8ReplaceMode.IGNORE and UTF8ReplaceMode.REPLACE. Default is UTF8ReplaceMode.REPLACE.
     number_of_inputs: int
         The number of inputs for the model. Default is 1.
+    unpacked_string_input: bool
+        If True, the tokenizer takes the begins, ends and chars of the strings, the outputs of `StringTensorUnpack`,
+        instead of the string tensor. Use `unpack_strings` to get the inputs from Arrow or numpy arrays
+        without copying the text. Not supported for the models with two inputs. Default is False.
     """
 
     with_detokenizer: bool = False
@@ -83,7 +110,11 @@ class TokenzierConversionParams:
     tokenizer_output_type: Type = Type.i64
     detokenizer_input_type: Type = Type.i64
     streaming_detokenizer: bool = False
+    stateful_detokenizer: bool = False
     use_max_padding: bool = False
+    ragged_output: bool = False
+    token_count_output: bool = False
+    deduplicate_inputs: bool = False
     truncation: bool = False
     max_length: Optional[int] = None
     handle_special_tokens_with_re: Optional[bool] = None
@@ -92,6 +123,7 @@ class TokenzierConversionParams:
     add_attention_mask: bool = True
     add_prefix_space: Optional[bool] = None
     number_of_inputs: int = 1
+    unpacked_string_input: bool = False
 
 
 logger = logging.getLogger(__name__)
@@ -263,27 +295,60 @@ def update_rt_info_with_environment(ov_tokenizer: Model) -> None:
             ov_tokenizer.set_rt_info(version, f"{name}_version")
 
 
-def get_processor_template(
+def get_tokenizer_json(
     hf_tokenizer: "PreTrainedTokenizerBase",  # noqa
 ) -> Optional[dict[str, Any]]:
-    """Gets the JSON representation of the tokenizer post-processor template.
+    """Gets the content of the tokenizer.json file of the fast Huggingface tokenizer.
+
+    The JSON is serialized by the tokenizer backend in memory, saving the tokenizer to a temporary directory
+    is used only for tokenizers without the backend.
 
     :param hf_tokenizer: The Huggingface tokenizer object.
     :type hf_tokenizer: transformers.tokenization_utils_base.PreTrainedTokenizerBase
-    :return: The JSON representation of the Huggingface tokenizer.
+    :return: The parsed tokenizer.json or None if the tokenizer is not fast.
     :rtype: dict[str, Any]
     """
     if not getattr(hf_tokenizer, "is_fast", False):
         return
 
+    # the tokenizer read from the files without transformers
+    if (tokenizer_json := getattr(hf_tokenizer, "tokenizer_json", None)) is not None:
+        return tokenizer_json
+
+    backend_tokenizer = getattr(hf_tokenizer, "backend_tokenizer", None)
+    if backend_tokenizer is not None:
+        return json.loads(backend_tokenizer.to_str())
+
     with tempfile.TemporaryDirectory() as tmpdir:
         hf_tokenizer.save_pretrained(tmpdir)
         try:
+            # Windows uses cp1252 encoding by default, need to use utf-8 explicitly
             with open(f"{tmpdir}/tokenizer.json", "r", encoding="utf-8") as f:
-                tokenizer_json = json.load(f)
+                return json.load(f)
         except FileNotFoundError:
             return
 
+
+def get_processor_template(
+    hf_tokenizer: "PreTrainedTokenizerBase",  # noqa
+) -> Optional[dict[str, Any]]:
+    """Gets the JSON representation of the tokenizer post-processor template.
+
+    :param hf_tokenizer: The Huggingface tokenizer object.
+    :type hf_tokenizer: transformers.tokenization_utils_base.PreTrainedTokenizerBase
+    :return: The JSON representation of the Huggingface tokenizer.
+    :rtype: dict[str, Any]
+    """
+    backend_tokenizer = getattr(hf_tokenizer, "backend_tokenizer", None)
+    if getattr(hf_tokenizer, "is_fast", False) and backend_tokenizer is not None:
+        # serialize the post-processor only, the whole tokenizer.json includes the vocab
+        post_processor = backend_tokenizer.post_processor
+        return None if post_processor is None else json.loads(post_processor.__getstate__())
+
+    tokenizer_json = get_tokenizer_json(hf_tokenizer)
+    if tokenizer_json is None:
+        return
+
     return tokenizer_json.get("post_processor", None)
 
 
@@ -384,10 +449,8 @@ def update_rt_info_with_processor_template(
         ov_tokenizer.set_rt_info(json.dumps(parsed_post_processor), PROCESSED_POST_PROCESSOR_NAME)
     else:
         ov_tokenizer.set_rt_info(
-            json.dumps(
-                {"single": {"ids": [-1], "type_ids": [0]}, "pair": {"ids": [-1, -2], "type_ids": [0, 0]}}
-            ),
-            PROCESSED_POST_PROCESSOR_NAME
+            json.dumps({"single": {"ids": [-1], "type_ids": [0]}, "pair": {"ids": [-1, -2], "type_ids": [0, 0]}}),
+            PROCESSED_POST_PROCESSOR_NAME,
         )
 
 
@@ -429,40 +492,100 @@ def quote_meta(unquoted: Union[str, bytes]) -> str:
     return "".join(symbols)
 
 
-def to_bytes(number: int) -> bytes:
-    return number.to_bytes(4, "little")
+def is_arrow_array(value: Any) -> bool:
+    return type(value).__module__.split(".")[0] == "pyarrow"
+
+
+def _unpack_arrow_strings(strings: Any) -> list[np.ndarray]:
+    import pyarrow as pa
 
+    if isinstance(strings, pa.ChunkedArray):
+        strings = strings.chunk(0) if strings.num_chunks == 1 else strings.combine_chunks()
+    if not (pa.types.is_string(strings.type) or pa.types.is_large_string(strings.type)):
+        raise ValueError(f"Expected Arrow string or large_string array, got {strings.type}")
 
-def create_unpacked_string(strings: Iterable[str]) -> list[Output]:
+    _, offsets_buffer, data_buffer = strings.buffers()
+    offset_type = np.int64 if pa.types.is_large_string(strings.type) else np.int32
+    # the offsets of a sliced array start at the array offset, the chars before it are skipped by begins
+    offsets = np.frombuffer(offsets_buffer, offset_type)[strings.offset : strings.offset + len(strings) + 1]
+    if offsets.size and offsets[-1] > np.iinfo(np.int32).max:
+        raise ValueError(f"Total size of the strings {offsets[-1]} exceeds the maximum size of the string tensor")
+    offsets = offsets.astype(np.int32, copy=False)
+    chars = np.empty(0, np.uint8) if data_buffer is None else np.frombuffer(data_buffer, np.uint8)
+    # null items have equal offsets and are passed as empty strings
+    return [offsets[:-1], offsets[1:], chars]
+
+
+def unpack_strings(strings: Union[Iterable[Union[str, bytes]], np.ndarray], compact: bool = False) -> list[np.ndarray]:
     """
-    Convert any list of strings to U8/1D numpy array with begins, ends, and chars
+    Convert any list of strings to the begins, ends and chars numpy arrays, the outputs of `StringTensorUnpack`.
+
+    Arrow `string` and `large_string` arrays with less than 2 GB of text and numpy arrays of bytes are unpacked
+    without copying the chars: the arrays share the memory with the Arrow buffers or the numpy array.
+    Arrow null items are empty strings. Bytes and numpy arrays of bytes are used without re-encoding.
+    Items of fixed width numpy arrays lose trailing zero bytes, use lists or object arrays for such strings.
+
+    :param strings: The strings to unpack.
+    :type strings: Union[Iterable[Union[str, bytes]], np.ndarray, pyarrow.Array, pyarrow.ChunkedArray]
+    :param compact: If True, the chars of fixed width numpy arrays are copied without the padding zero bytes.
+    :type compact: bool
+    :return: The begins, ends and chars arrays.
+    :rtype: list[np.ndarray]
     """
-    begins = BytesIO()
-    ends = BytesIO()
-    chars = BytesIO()
-    offset = 0
+    if is_arrow_array(strings):
+        return _unpack_arrow_strings(strings)
+
+    if isinstance(strings, np.ndarray) and strings.dtype.kind == "S":
+        byte_strings = strings.ravel()
+        if not byte_strings.size:
+            return [np.empty(0, np.int32), np.empty(0, np.int32), np.empty(0, np.uint8)]
+
+        lengths = np.char.str_len(byte_strings).astype(np.int64)
+        if compact:
+            # fixed width items are padded with zero bytes, mask them out to get the chars of all strings at once
+            padded_chars = np.frombuffer(byte_strings.tobytes(), np.uint8).reshape(len(byte_strings), -1)
+            chars = padded_chars[np.arange(padded_chars.shape[1]) < lengths[:, None]]
+        else:
+            begins = np.arange(len(byte_strings), dtype=np.int64) * byte_strings.itemsize
+            if begins.size and begins[-1] + byte_strings.itemsize > np.iinfo(np.int32).max:
+                raise ValueError("Total size of the strings exceeds the maximum size of the string tensor")
+            chars = np.frombuffer(byte_strings, np.uint8)
+            return [begins.astype(np.int32), (begins + lengths).astype(np.int32), chars]
+    else:
+        if isinstance(strings, np.ndarray):
+            strings = strings.ravel().tolist()
+        byte_strings = [string.encode("utf-8") if isinstance(string, str) else string for string in strings]
+        lengths = np.fromiter(map(len, byte_strings), np.int64, len(byte_strings))
+        # bytes.join allocates a buffer descriptor per item, which is several times larger than a short token
+        chars = BytesIO()
+        chars.writelines(byte_strings)
+        chars = np.frombuffer(chars.getbuffer(), np.uint8)
 
-    for string in strings:
-        byte_string = string.encode("utf-8") if isinstance(string, str) else string
-        length = len(byte_string)
+    ends = np.cumsum(lengths)
+    if ends.size and ends[-1] > np.iinfo(np.int32).max:
+        raise ValueError(f"Total size of the strings {ends[-1]} exceeds the maximum size of the string tensor")
+    begins = (ends - lengths).astype(np.int32)
+    ends = ends.astype(np.int32)
 
-        begins.write(to_bytes(offset))
-        offset += length
-        ends.write(to_bytes(offset))
-        chars.write(byte_string)
+    return [begins, ends, chars]
 
-    begins = np.frombuffer(begins.getvalue(), np.int32)
-    ends = np.frombuffer(ends.getvalue(), np.int32)
-    chars = np.frombuffer(chars.getvalue(), np.uint8)
 
-    return [Constant(Tensor(x)).output(0) for x in [begins, ends, chars]]
+def create_unpacked_string(strings: Union[Iterable[Union[str, bytes]], np.ndarray]) -> list[Output]:
+    """
+    Convert any list of strings to U8/1D numpy array with begins, ends, and chars
+
+    Bytes and numpy arrays of bytes are used without re-encoding. Items of fixed width numpy arrays lose
+    trailing zero bytes, use lists or object arrays for such strings.
+    """
+    return [Constant(Tensor(x)).output(0) for x in unpack_strings(strings, compact=True)]
 
 
-def create_string_constant_node(value: Union[str, Iterable[str]]) -> list[Output]:
-    if isinstance(value, str):
+def create_string_constant_node(value: Union[str, bytes, Iterable[Union[str, bytes]], np.ndarray]) -> list[Output]:
+    if isinstance(value, (str, bytes)):
         # string scalar
-        return Constant(np.frombuffer(bytes(value, "utf-8"), dtype=np.uint8)).outputs()
-    elif isinstance(value, Iterable):
+        byte_value = value.encode("utf-8") if isinstance(value, str) else value
+        return Constant(np.frombuffer(byte_value, dtype=np.uint8)).outputs()
+    elif isinstance(value, (Iterable, np.ndarray)):
         # support only 1D strings for now
         return create_unpacked_string(value)
     else:
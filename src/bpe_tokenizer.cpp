@@ -139,9 +139,9 @@ bool BPETokenizer::evaluate(ov::TensorVector& outputs, const ov::TensorVector& i
     auto new_ends   = outputs[1].data<int32_t>();
     auto new_elems  = outputs[2].data<int32_t>();
     int32_t ragged_offset = 0;
-    std::vector<int32_t> token_buffer;
-    token_buffer.reserve(256);
-    BPETokenizerScratch bpe_scratch;
+    // Per-word temporaries are kept between calls, so the steady state makes no allocations
+    auto& token_buffer = get_scratch_buffer<int32_t, struct BPETokenizerTokens>();
+    thread_local BPETokenizerScratch bpe_scratch;
 
     for(size_t seq = 0; seq < num_rows; ++seq) {
         new_begins[seq] = ragged_offset;
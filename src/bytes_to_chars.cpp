@@ -282,8 +282,6 @@ void BytesToChars::validate_and_infer_types() {
 }
 
 bool BytesToChars::evaluate(ov::TensorVector& outputs, const ov::TensorVector& inputs) const {
-    auto ragged_begins = inputs[0].data<const int32_t>();
-    auto ragged_ends   = inputs[1].data<const int32_t>();
     auto begins = inputs[2].data<const int32_t>();
     auto ends   = inputs[3].data<const int32_t>();
     auto chars  = inputs[4].data<const uint8_t>();
@@ -296,44 +294,33 @@ bool BytesToChars::evaluate(ov::TensorVector& outputs, const ov::TensorVector& i
     outputs[1] = inputs[1];
     outputs[2].set_shape(inputs[2].get_shape());
     outputs[3].set_shape(inputs[3].get_shape());
-    outputs[4].set_shape(Shape({inputs[4].get_size() * 2}));
     if (has_skips) {
         outputs[5] = inputs[5];
     }
-    const size_t num_elems = inputs[0].get_size();
+    const size_t num_words = inputs[2].get_size();
 
-    // Get pointers in the output tensors
-    auto new_begins = outputs[2].data<int32_t>();
-    auto new_ends   = outputs[3].data<int32_t>();
-    auto new_chars  = outputs[4].data<uint8_t>();
-    uint32_t char_pointer = 0;
-
-    for(size_t j = 0; j < num_elems; ++j) {
-        for(size_t i = ragged_begins[j]; i < ragged_ends[j]; ++i) {
-            const auto word_len = ends[i] - begins[i];
-            new_begins[i] = char_pointer;
-
-            if (has_skips) {
-                if (skips[i]) {
-                      std::copy(chars + begins[i], chars + ends[i], new_chars + char_pointer);
-                      char_pointer += word_len;
-                } else {
-                    for (size_t k = 0; k < word_len; ++k) {
-                        for (auto byte : m_bytes_to_chars[chars[begins[i] + k]]) {
-                            new_chars[char_pointer++] = byte;
-                        }
-                    }
-                }
-            } else {
-                for (size_t k = 0; k < word_len; ++k) {
-                    for (auto byte : m_bytes_to_chars[chars[begins[i] + k]]) {
-                        new_chars[char_pointer++] = byte;
-                    }
-                }
-            };
-            new_ends[i] = char_pointer;
+    // Every byte maps to one or two chars, count them first to allocate the exact output size
+    auto count = [&](size_t i) -> size_t {
+        if (has_skips && skips[i]) {
+            return ends[i] - begins[i];
         }
-    }
-    outputs[4].set_shape({char_pointer});
+        size_t word_size = 0;
+        for (auto k = begins[i]; k < ends[i]; ++k) {
+            word_size += m_bytes_to_chars[chars[k]].size();
+        }
+        return word_size;
+    };
+    auto fill = [&](size_t i, uint8_t* new_chars) {
+        if (has_skips && skips[i]) {
+            std::copy(chars + begins[i], chars + ends[i], new_chars);
+            return;
+        }
+        for (auto k = begins[i]; k < ends[i]; ++k) {
+            for (auto byte : m_bytes_to_chars[chars[k]]) {
+                *new_chars++ = byte;
+            }
+        }
+    };
+    count_then_fill<uint8_t>(num_words, count, fill, outputs[2].data<int32_t>(), outputs[3].data<int32_t>(), outputs[4]);
     return true;
 }
@@ -2,6 +2,8 @@
 // SPDX-License-Identifier: Apache-2.0
 //
 
+#include <openvino/core/parallel.hpp>
+
 #include "combine_segments.hpp"
 #include "utils.hpp"
 
@@ -44,7 +46,6 @@ bool CombineSegments::evaluate(ov::TensorVector& outputs, const ov::TensorVector
     auto element_type = inputs[2].get_element_type();
     auto elem_size = element_type.size();
     size_t max_nelems = 0;
-    size_t flat_out_size = 0;
     Shape ps;
 
     for(size_t i = 0; i < num_of_ragged; ++i) {
@@ -60,17 +61,6 @@ bool CombineSegments::evaluate(ov::TensorVector& outputs, const ov::TensorVector
         max_nelems = std::max(max_nelems, nelems.back());
     }
 
-    // flat_out_size is going to be an estimation of the final size
-    // This is only an estimation, not the exact output size, because ragged tensor may have gaps in the representation
-
-    for(size_t i = 0; i < num_of_ragged; ++i) {
-        if(nelems[i] == 1) {
-            flat_out_size += max_nelems * inputs[3*i + 2].get_size(); // broadcast
-        } else {
-            flat_out_size += inputs[3*i + 2].get_size();    // FIXME: doesn't work for overlapped ragged regions
-        }
-    }
-
     auto ids = reinterpret_cast<const char*>(inputs.back().data());
     size_t id_type_size = inputs.back().get_element_type().size();
 
@@ -78,57 +68,52 @@ bool CombineSegments::evaluate(ov::TensorVector& outputs, const ov::TensorVector
     outputs[3*0 + 1].set_shape(ps);
     OPENVINO_ASSERT(max_nelems == outputs[3*0 + 0].get_size());
     OPENVINO_ASSERT(max_nelems == outputs[3*0 + 1].get_size());
-    outputs[3*0 + 2].set_shape({flat_out_size});
 
     outputs[3*1 + 0].set_shape(ps);
     outputs[3*1 + 1].set_shape(ps);
     OPENVINO_ASSERT(max_nelems == outputs[3*1 + 0].get_size());
     OPENVINO_ASSERT(max_nelems == outputs[3*1 + 1].get_size());
-    outputs[3*1 + 2].set_shape({flat_out_size});
 
     auto out_elem_begins = outputs[3*0 + 0].data<int32_t>();
     auto out_elem_ends = outputs[3*0 + 1].data<int32_t>();
-    auto out_elems = reinterpret_cast<char*>(outputs[3*0 + 2].data());
     auto out_id_begins = outputs[3*1 + 0].data<int32_t>();
     auto out_id_ends = outputs[3*1 + 1].data<int32_t>();
-    auto out_ids = reinterpret_cast<char*>(outputs[3*1 + 2].data());
 
-    auto out_elems_orig = out_elems;
-    auto out_ids_orig = out_ids;
-    size_t out_offset = 0;
+    // Broadcast scalar ragged inputs: the only row is used for every output row
+    auto row_index = [&](size_t j, size_t i) {
+        return nelems[j] == 1 ? 0 : i;
+    };
 
+    // Row offsets are computed upfront, so the output has the exact size and rows can be filled independently
+    size_t out_offset = 0;
     for(size_t i = 0; i < max_nelems; ++i) {
         out_elem_begins[i] = out_offset;
         out_id_begins[i] = out_offset;
-
         for(size_t j = 0; j < num_of_ragged; ++j) {
-            const char* begin;
-            size_t len;
-            if(nelems[j] == 1) {
-                begin = elems[j] + elem_size*begins[j][0];
-                len = ends[j][0] - begins[j][0];
-            } else {
-                begin = elems[j] + elem_size*begins[j][i];
-                len = ends[j][i] - begins[j][i];
-            }
-            auto end = begin + elem_size*len;
-            out_elems = std::copy(begin, end, out_elems);
-            for(size_t k = 0; k < len; ++k) {
-                out_ids = std::copy(ids + id_type_size*j, ids + id_type_size*(j + 1), out_ids);
-            }
-            out_offset += len;
+            const auto idx = row_index(j, i);
+            out_offset += ends[j][idx] - begins[j][idx];
         }
-
         out_elem_ends[i] = out_offset;
         out_id_ends[i] = out_offset;
     }
 
-    OPENVINO_ASSERT(out_offset <= flat_out_size);
-
     outputs[3*0 + 2].set_shape({out_offset});
     outputs[3*1 + 2].set_shape({out_offset});
 
-    OPENVINO_ASSERT(out_elems == out_elems_orig + outputs[3*0 + 2].get_byte_size());
-    OPENVINO_ASSERT(out_ids == out_ids_orig + outputs[3*1 + 2].get_byte_size());
+    auto out_elems = reinterpret_cast<char*>(outputs[3*0 + 2].data());
+    auto out_ids = reinterpret_cast<char*>(outputs[3*1 + 2].data());
+
+    ov::parallel_for(max_nelems, [&](size_t i) {
+        size_t offset = out_elem_begins[i];
+        for(size_t j = 0; j < num_of_ragged; ++j) {
+            const auto idx = row_index(j, i);
+            const size_t len = ends[j][idx] - begins[j][idx];
+            const auto begin = elems[j] + elem_size*begins[j][idx];
+            std::copy(begin, begin + elem_size*len, out_elems + elem_size*offset);
+            fill_with_pattern(out_ids + id_type_size*offset, ids + id_type_size*j, id_type_size, len);
+            offset += len;
+        }
+    });
+
     return true;
 }
@@ -75,12 +75,14 @@ OPENVINO_CREATE_EXTENSIONS(
             std::make_shared<ov::OpExtension<RaggedTensorPack>>(),
             std::make_shared<ov::OpExtension<StringTensorUnpack>>(),
             std::make_shared<ov::OpExtension<EqualStr>>(),
+            std::make_shared<ov::OpExtension<UniqueStrings>>(),
             std::make_shared<ov::OpExtension<NumericToString>>(),
             std::make_shared<ov::OpExtension<RegexNormalization>>(),
             std::make_shared<ov::OpExtension<RegexSplit>>(),
             std::make_shared<ov::OpExtension<BPETokenizer>>(),
             std::make_shared<ov::OpExtension<WordpieceTokenizer>>(),
             std::make_shared<ov::OpExtension<UTF8Validate>>(),
+            std::make_shared<ov::OpExtension<UTF8StreamSplit>>(),
             std::make_shared<ov::OpExtension<BytesToChars>>(),
             std::make_shared<ov::OpExtension<CombineSegments>>(),
             std::make_shared<ov::OpExtension<RaggedToDense>>(),
@@ -2,6 +2,7 @@
 // SPDX-License-Identifier: Apache-2.0
 //
 
+#include <openvino/core/parallel.hpp>
 #include <openvino/op/constant.hpp>
 
 #include "ragged_to_dense.hpp"
@@ -10,6 +11,33 @@
 using namespace ov;
 using op::v0::Constant;
 
+namespace {
+
+using MaskFill = void (*)(char*, size_t, bool);
+
+template <typename T>
+void fill_mask(char* dst, size_t count, bool value) {
+    std::fill_n(reinterpret_cast<T*>(dst), count, static_cast<T>(value));
+}
+
+MaskFill get_mask_fill(const element::Type& type) {
+    switch (type) {
+        case element::boolean:
+        case element::u8:
+            return fill_mask<uint8_t>;
+        case element::i32:
+            return fill_mask<int32_t>;
+        case element::i64:
+            return fill_mask<int64_t>;
+        case element::f32:
+            return fill_mask<float>;
+        default:
+            return nullptr;
+    }
+}
+
+}  // namespace
+
 void RaggedToDense::validate_and_infer_types() {
     OPENVINO_ASSERT(get_input_size() == 3 + 1 + 1 ||  get_input_size() == 3 + 1 + 1 + 1,
                     "RaggedToDense requires 5 inputs (begins, ends, data, padding_size, value) and 1 optional input (pad_right).");
@@ -31,6 +59,10 @@ void RaggedToDense::validate_and_infer_types() {
     auto input4_rank = get_input_partial_shape(4).rank();
     OPENVINO_ASSERT(input4_rank.compatible(0));
 
+    OPENVINO_ASSERT(get_mask_fill(m_mask_element_type) != nullptr,
+                    "RaggedToDense: unsupported mask element type ", m_mask_element_type,
+                    ". Supported types are boolean, u8, i32, i64 and f32.");
+
     set_input_is_relevant_to_shape(3);
 
     const auto begins_shape = get_input_partial_shape(0);
@@ -40,7 +72,7 @@ void RaggedToDense::validate_and_infer_types() {
 
     if (begins_rank.is_dynamic() || data_rank.is_dynamic()) {
         set_output_type(0, get_input_element_type(2), PartialShape::dynamic());
-        set_output_type(1, element::boolean, PartialShape::dynamic());
+        set_output_type(1, m_mask_element_type, PartialShape::dynamic());
     } else {
         auto out_shape = begins_shape;
         if (auto target_dim = dynamic_cast<Constant*>(get_input_node_ptr(3))) {
@@ -55,7 +87,7 @@ void RaggedToDense::validate_and_infer_types() {
         }
 
         set_output_type(0, get_input_element_type(2), out_shape);
-        set_output_type(1, element::boolean, out_shape);
+        set_output_type(1, m_mask_element_type, out_shape);
     }
     if (get_input_size() == 3 + 1 + 1 + 1) {
         OPENVINO_ASSERT(get_input_partial_shape(5).is_dynamic() || get_input_partial_shape(5).is_static() && get_input_partial_shape(5).rank().get_length() == 0,
@@ -69,7 +101,6 @@ void RaggedToDense::validate_and_infer_types() {
 
 bool RaggedToDense::evaluate(ov::TensorVector& outputs, const ov::TensorVector& inputs) const {
     // FIXME: Works for POD types only (not for strings!)
-    // FIXME: Output mask is calculated even if there are no consumers
     auto begins = inputs[0].data<const int32_t>();
     auto ends = inputs[1].data<const int32_t>();
     const auto nelems = inputs[0].get_size();
@@ -103,72 +134,38 @@ bool RaggedToDense::evaluate(ov::TensorVector& outputs, const ov::TensorVector&
     }
 
     auto out_elems = reinterpret_cast<char*>(outputs[0].data());
-    // Mask may be unallocated when this op is used as an intermediate node with no consumers
-    auto out_mask = outputs[1] ? outputs[1].data<char>() : nullptr;
+    // Mask may be unallocated when this op is used as an intermediate node with no consumers,
+    // it is also not calculated when the graph does not read it, e.g. for token_type_ids padding
+    auto out_mask = m_compute_mask && outputs[1] ? reinterpret_cast<char*>(outputs[1].data()) : nullptr;
+    const auto mask_elem_size = m_mask_element_type.size();
+    const auto mask_fill = get_mask_fill(m_mask_element_type);
 
-    auto out_elem_orig = out_elems;
-    auto out_mask_orig = out_mask;
-    
     bool pad_right = m_pad_right;
     if (get_input_size() == 6) {
         pad_right = inputs[5].data<bool>()[0];
     }
 
-    auto fill_default_block = [&](char*& dst) {
-        for (size_t k = 0; k < inner_elems; ++k) {
-            dst = std::copy(default_value, default_value + elem_size, dst);
-        }
-    };
-
-    auto mask_fill = [&](char*& dst, size_t count, char value) {
-        if (dst) {
-            dst = std::fill_n(dst, count, value);
-        }
-    };
-
-    if (pad_right) {
-        for (size_t i = 0; i < nelems; ++i) {
-            const size_t data_len = static_cast<size_t>(ends[i] - begins[i]);
-            size_t target_len = (std::min(data_len, target_dim) * (1 - m_pad_max_length) +
-                                 target_dim * m_pad_max_length);
-
-            const auto begin = elems + elem_size * inner_elems * static_cast<size_t>(begins[i]);
-            const auto end = begin + elem_size * inner_elems * target_len;
-            out_elems = std::copy(begin, end, out_elems);
-
-            mask_fill(out_mask, target_len * inner_elems, char(1));
-            if (target_len < target_dim) {
-                mask_fill(out_mask, (target_dim - target_len) * inner_elems, char(0));
-            }
-
-            while (target_len < target_dim) {
-                fill_default_block(out_elems);
-                ++target_len;
-            }
+    const size_t row_elems = target_dim * inner_elems;
+    ov::parallel_for(nelems, [&](size_t i) {
+        const size_t data_len = static_cast<size_t>(ends[i] - begins[i]);
+        const size_t target_len = (std::min(data_len, target_dim) * (1 - m_pad_max_length) +
+                                   target_dim * m_pad_max_length);
+        const size_t data_elems = target_len * inner_elems;
+        const size_t pad_elems = row_elems - data_elems;
+
+        // Row layout is [data, padding] for right padding and [padding, data] otherwise
+        const size_t data_offset = row_elems * i + (pad_right ? 0 : pad_elems);
+        const size_t pad_offset = row_elems * i + (pad_right ? data_elems : 0);
+
+        const auto begin = elems + elem_size * inner_elems * static_cast<size_t>(begins[i]);
+        std::copy(begin, begin + elem_size * data_elems, out_elems + elem_size * data_offset);
+        fill_with_pattern(out_elems + elem_size * pad_offset, default_value, elem_size, pad_elems);
+
+        if (out_mask) {
+            mask_fill(out_mask + mask_elem_size * data_offset, data_elems, true);
+            mask_fill(out_mask + mask_elem_size * pad_offset, pad_elems, false);
         }
-    } else {
-        for (size_t i = 0; i < nelems; ++i) {
-            const size_t data_len = static_cast<size_t>(ends[i] - begins[i]);
-            size_t target_len = (std::min(data_len, target_dim) * (1 - m_pad_max_length) +
-                                 target_dim * m_pad_max_length);
-            const size_t pad_len = target_dim - target_len;
-
-            for (size_t j = 0; j < pad_len; ++j) {
-                fill_default_block(out_elems);
-            }
-
-            const auto begin = elems + elem_size * inner_elems * static_cast<size_t>(begins[i]);
-            const auto end = begin + elem_size * inner_elems * target_len;
-            out_elems = std::copy(begin, end, out_elems);
-
-            mask_fill(out_mask, pad_len * inner_elems, char(0));
-            mask_fill(out_mask, (target_dim - pad_len) * inner_elems, char(1));
-        }
-    }
+    });
 
-    OPENVINO_ASSERT(out_elems == out_elem_orig + outputs[0].get_byte_size());
-    if (out_mask) {
-        OPENVINO_ASSERT(out_mask == out_mask_orig + outputs[1].get_byte_size());
-    }
     return true;
 }
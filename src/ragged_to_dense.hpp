@@ -28,29 +28,37 @@ public:
      * - pad_right  This input has priority over the attribute "pad_right". If true, padding is applied to the right side of the tensor.
      * @param pad_right If true, padding is applied to the right side of the tensor. Default is true.
      * @param pad_max_length If true, padding is applied to the maximum length of the tensor. Default is false.
+     * @param mask_element_type Element type of the output mask. Default is boolean.
+     * @param compute_mask If false, the output mask is not filled, for the graphs that do not read it. Default is true.
      *
      * @note This class inherits from ov::op::Op and overrides necessary methods for validation, cloning, and evaluation.
      */
     RaggedToDense(
         const ov::OutputVector& arguments,
         const bool pad_right = true,
-        const bool pad_max_length = false
+        const bool pad_max_length = false,
+        const ov::element::Type mask_element_type = ov::element::boolean,
+        const bool compute_mask = true
     ) :
         ov::op::Op(arguments),
         m_pad_right(pad_right),
-        m_pad_max_length(pad_max_length) {
+        m_pad_max_length(pad_max_length),
+        m_mask_element_type(mask_element_type),
+        m_compute_mask(compute_mask) {
         constructor_validate_and_infer_types();
     }
 
     void validate_and_infer_types() override;
 
     std::shared_ptr<ov::Node> clone_with_new_inputs(const ov::OutputVector& inputs) const override {
-        return std::make_shared<RaggedToDense>(inputs, m_pad_right, m_pad_max_length);
+        return std::make_shared<RaggedToDense>(inputs, m_pad_right, m_pad_max_length, m_mask_element_type, m_compute_mask);
     }
 
     bool visit_attributes(ov::AttributeVisitor& visitor) override {
         visitor.on_attribute("pad_right", m_pad_right);
         visitor.on_attribute("m_pad_max_length", m_pad_max_length);
+        visitor.on_attribute("mask_element_type", m_mask_element_type);
+        visitor.on_attribute("compute_mask", m_compute_mask);
         return true;
     }
 
@@ -63,4 +71,6 @@ public:
 private:
     bool m_pad_right = true;
     bool m_pad_max_length = false;
+    ov::element::Type m_mask_element_type = ov::element::boolean;
+    bool m_compute_mask = true;
 };
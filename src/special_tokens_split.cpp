@@ -103,6 +103,8 @@ bool SpecialTokensSplit::evaluate(ov::TensorVector& outputs, const ov::TensorVec
     auto new_skips = outputs[5].data<bool>();
 
     int32_t ragged_offset = 0;
+    // Match data is allocated once per call instead of once per match
+    auto match_data = m_search_pattern_pcre2->create_match_data();
 
     for(size_t seq = 0; seq < batch_size; ++seq) {
         new_ragged_begins[seq] = ragged_offset;
@@ -113,10 +115,10 @@ bool SpecialTokensSplit::evaluate(ov::TensorVector& outputs, const ov::TensorVec
                 new_skips[ragged_offset] = true;
                 new_ends[ragged_offset++] = ends[ragged_col];
             } else {
-                auto str = std::string(chars + begins[ragged_col], chars + ends[ragged_col]);
+                auto str = std::string_view(reinterpret_cast<const char*>(chars + begins[ragged_col]), ends[ragged_col] - begins[ragged_col]);
                 size_t curr_start = 0;
-                auto get_next_match = [this](const std::string& s, size_t start) -> std::optional<std::pair<std::pair<size_t, size_t>, std::pair<size_t, size_t>>> {
-                    auto [match, group] = this->m_search_pattern_pcre2->match_and_find_group(s, start);
+                auto get_next_match = [this, &match_data](const std::string_view& s, size_t start) -> std::optional<std::pair<std::pair<size_t, size_t>, std::pair<size_t, size_t>>> {
+                    auto [match, group] = this->m_search_pattern_pcre2->match_and_find_group(s, start, match_data);
                     if (match.first != SIZE_MAX && match.first != match.second) {
                         return std::make_pair(match, group);
                     } else {
@@ -28,6 +28,8 @@
 #include "trie_tokenizer.hpp"
 #include "truncate.hpp"
 #include "unigram_tokenizer.hpp"
+#include "unique_strings.hpp"
+#include "utf8_stream_split.hpp"
 #include "utf8_validate.hpp"
 #include "vocab_decoder.hpp"
 #include "vocab_encoder.hpp"
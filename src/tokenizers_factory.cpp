@@ -34,7 +34,9 @@ ov::OutputVector create_tokenizer_node(const std::string& op_type,
     } else if (op_type == "RaggedToDense") {
         auto pad_right = get_attribute_value<bool>(attributes, "pad_right", true);
         auto pad_max_length = get_attribute_value<bool>(attributes, "pad_max_length", false);
-        return std::make_shared<RaggedToDense>(inputs, pad_right, pad_max_length)->outputs();
+        auto mask_element_type = get_attribute_value<ov::element::Type>(attributes, "mask_element_type", ov::element::boolean);
+        auto compute_mask = get_attribute_value<bool>(attributes, "compute_mask", true);
+        return std::make_shared<RaggedToDense>(inputs, pad_right, pad_max_length, mask_element_type, compute_mask)->outputs();
     } else if (op_type == "VocabDecoder") {
         return std::make_shared<VocabDecoder>(inputs, std::vector<int32_t>{})->outputs();
     } else if (op_type == "FuzeRagged") {
@@ -67,7 +67,7 @@ bool TrieTokenizer::evaluate(ov::TensorVector& outputs, const ov::TensorVector&
         new_begins[seq] = ragged_offset;
 
         for(size_t ragged_col = ragged_begins[seq]; ragged_col < ragged_ends[seq]; ++ragged_col) {
-            auto str = std::vector<unsigned char>(chars + begins[ragged_col], chars + ends[ragged_col]);
+            auto str = std::string_view(reinterpret_cast<const char*>(chars + begins[ragged_col]), ends[ragged_col] - begins[ragged_col]);
             int idx = 0;
             while (idx < str.size()) {
                 auto res = m_trie->find_longest(str, idx);
@@ -0,0 +1,55 @@
+// Copyright (C) 2018-2026 Intel Corporation
+// SPDX-License-Identifier: Apache-2.0
+//
+
+#include <string_view>
+#include <unordered_map>
+
+#include "unique_strings.hpp"
+#include "utils.hpp"
+
+using namespace ov;
+
+
+void UniqueStrings::validate_and_infer_types() {
+    OPENVINO_ASSERT(get_input_size() == 3, "UniqueStrings expects strings as begins/ends/chars");
+    check_string_input(this, 0);
+
+    set_output_type(0, element::i32, PartialShape{Dimension()});
+    set_output_type(1, element::i32, PartialShape{Dimension()});
+    set_output_type(2, element::i32, get_input_partial_shape(0));
+}
+
+bool UniqueStrings::evaluate(ov::TensorVector& outputs, const ov::TensorVector& inputs) const {
+    auto begins = inputs[0].data<const int32_t>();
+    auto ends   = inputs[1].data<const int32_t>();
+    auto chars  = reinterpret_cast<const char*>(inputs[2].data<const uint8_t>());
+    const size_t batch_size = inputs[0].get_size();
+
+    outputs[2].set_shape(inputs[0].get_shape());
+    auto unique_idxs = outputs[2].data<int32_t>();
+
+    // The keys point to the input chars, the strings are hashed and compared without copying
+    std::unordered_map<std::string_view, int32_t> unique_idx_by_string;
+    unique_idx_by_string.reserve(batch_size);
+    std::vector<size_t> unique_rows;
+    unique_rows.reserve(batch_size);
+    for (size_t i = 0; i < batch_size; ++i) {
+        const std::string_view string(chars + begins[i], ends[i] - begins[i]);
+        const auto [it, inserted] = unique_idx_by_string.emplace(string, static_cast<int32_t>(unique_rows.size()));
+        if (inserted) {
+            unique_rows.push_back(i);
+        }
+        unique_idxs[i] = it->second;
+    }
+
+    outputs[0].set_shape({unique_rows.size()});
+    outputs[1].set_shape({unique_rows.size()});
+    auto unique_begins = outputs[0].data<int32_t>();
+    auto unique_ends   = outputs[1].data<int32_t>();
+    for (size_t i = 0; i < unique_rows.size(); ++i) {
+        unique_begins[i] = begins[unique_rows[i]];
+        unique_ends[i]   = ends[unique_rows[i]];
+    }
+    return true;
+}
@@ -0,0 +1,45 @@
+// Copyright (C) 2018-2026 Intel Corporation
+// SPDX-License-Identifier: Apache-2.0
+//
+
+#pragma once
+
+#include <openvino/op/op.hpp>
+
+/**
+ * @class UniqueStrings
+ * @brief Finds the unique strings of the batch to process each of them once.
+ *
+ * Takes strings as begins/ends/chars. The first two outputs are the begins and ends of the unique strings in the
+ * order of their first occurrence, they point to the input chars, so the chars are not copied and the input chars
+ * should be used with them. The third output holds the index of the unique string for each input string:
+ * the ragged results for the unique strings are scattered back to the input rows by gathering their begins
+ * and ends with these indices.
+ */
+class UniqueStrings : public ov::op::Op {
+public:
+    OPENVINO_OP("UniqueStrings");
+
+    UniqueStrings () = default;
+
+    UniqueStrings(const ov::OutputVector& arguments) :
+        ov::op::Op(arguments) {
+        constructor_validate_and_infer_types();
+    }
+
+    void validate_and_infer_types() override;
+
+    std::shared_ptr<ov::Node> clone_with_new_inputs(const ov::OutputVector& inputs) const override {
+        return std::make_shared<UniqueStrings>(inputs);
+    }
+
+    bool visit_attributes(ov::AttributeVisitor& visitor) override {
+        return true;
+    }
+
+    bool evaluate(ov::TensorVector& outputs, const ov::TensorVector& inputs) const override;
+
+    bool has_evaluate() const override {
+        return true;
+    }
+};
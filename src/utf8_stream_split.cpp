@@ -0,0 +1,104 @@
+// Copyright (C) 2018-2026 Intel Corporation
+// SPDX-License-Identifier: Apache-2.0
+//
+
+#include <algorithm>
+
+#include "utf8_stream_split.hpp"
+#include "utils.hpp"
+
+using namespace ov;
+
+namespace {
+
+// Returns the number of bytes at the end of the string that start a multibyte UTF-8 symbol but do not complete it.
+// Only the last 3 bytes are checked: a longer tail cannot be a part of a valid symbol.
+template <typename ByteAt>
+size_t incomplete_tail_size(const ByteAt& byte_at, size_t size) {
+    for (size_t tail = 1; tail <= std::min<size_t>(3, size); ++tail) {
+        const uint8_t byte = byte_at(size - tail);
+        if (byte >> 6 == 0b10) {
+            // continuation byte, keep looking for the leading one
+            continue;
+        }
+        const size_t symbol_size = byte >> 5 == 0b110 ? 2 : (byte >> 4 == 0b1110 ? 3 : (byte >> 3 == 0b11110 ? 4 : 1));
+        return symbol_size > tail ? tail : 0;
+    }
+    return 0;
+}
+
+}  // namespace
+
+void UTF8StreamSplit::validate_and_infer_types() {
+    OPENVINO_ASSERT(get_input_size() == 6, "UTF8StreamSplit expects decoded strings and held back bytes as inputs");
+    check_string_input(this, 0);
+    check_string_input(this, 3);
+
+    set_string_output(this, 0, get_input_partial_shape(0));
+    set_string_output(this, 3, get_input_partial_shape(0));
+}
+
+bool UTF8StreamSplit::evaluate(ov::TensorVector& outputs, const ov::TensorVector& inputs) const {
+    auto begins = inputs[0].data<const int32_t>();
+    auto ends   = inputs[1].data<const int32_t>();
+    auto chars  = inputs[2].data<const uint8_t>();
+    const size_t batch_size = inputs[0].get_size();
+
+    // The state is empty on the first call and after the reset, and it is stale if the batch size changes
+    const bool has_held_back = inputs[3].get_size() == batch_size;
+    auto held_begins = inputs[3].data<const int32_t>();
+    auto held_ends   = inputs[4].data<const int32_t>();
+    auto held_chars  = inputs[5].data<const uint8_t>();
+
+    auto held_size = [&](size_t i) -> size_t {
+        return has_held_back ? held_ends[i] - held_begins[i] : 0;
+    };
+    // Byte of the held back bytes concatenated with the decoded string
+    auto byte_at = [&](size_t i, size_t idx) {
+        const size_t held = held_size(i);
+        return idx < held ? held_chars[held_begins[i] + idx] : chars[begins[i] + idx - held];
+    };
+
+    std::vector<size_t> tail_sizes(batch_size);
+    for (size_t i = 0; i < batch_size; ++i) {
+        const size_t size = held_size(i) + (ends[i] - begins[i]);
+        tail_sizes[i] = incomplete_tail_size([&](size_t idx) { return byte_at(i, idx); }, size);
+    }
+
+    outputs[0].set_shape(inputs[0].get_shape());
+    outputs[1].set_shape(inputs[0].get_shape());
+    outputs[3].set_shape(inputs[0].get_shape());
+    outputs[4].set_shape(inputs[0].get_shape());
+
+    count_then_fill<uint8_t>(
+        batch_size,
+        [&](size_t i) {
+            return held_size(i) + (ends[i] - begins[i]) - tail_sizes[i];
+        },
+        [&](size_t i, uint8_t* out_chars) {
+            const size_t held = held_size(i);
+            const size_t size = held + (ends[i] - begins[i]) - tail_sizes[i];
+            const size_t size_from_held = std::min(held, size);
+            if (size_from_held > 0) {
+                std::copy(held_chars + held_begins[i], held_chars + held_begins[i] + size_from_held, out_chars);
+            }
+            std::copy(chars + begins[i], chars + begins[i] + (size - size_from_held), out_chars + size_from_held);
+        },
+        outputs[0].data<int32_t>(), outputs[1].data<int32_t>(), outputs[2]
+    );
+
+    count_then_fill<uint8_t>(
+        batch_size,
+        [&](size_t i) {
+            return tail_sizes[i];
+        },
+        [&](size_t i, uint8_t* out_chars) {
+            const size_t size = held_size(i) + (ends[i] - begins[i]);
+            for (size_t idx = size - tail_sizes[i]; idx < size; ++idx) {
+                *out_chars++ = byte_at(i, idx);
+            }
+        },
+        outputs[3].data<int32_t>(), outputs[4].data<int32_t>(), outputs[5]
+    );
+    return true;
+}
@@ -0,0 +1,44 @@
+// Copyright (C) 2018-2026 Intel Corporation
+// SPDX-License-Identifier: Apache-2.0
+//
+
+#pragma once
+
+#include <openvino/op/op.hpp>
+
+/**
+ * @class UTF8StreamSplit
+ * @brief Holds back an incomplete UTF-8 symbol at the end of the decoded text for streaming detokenization.
+ *
+ * Takes decoded strings and the bytes held back on the previous call, both as begins/ends/chars.
+ * The first three outputs are the held back bytes followed by the decoded strings without the incomplete UTF-8
+ * symbol at the end, the last three outputs are the bytes of that symbol to be passed to the next call.
+ * Held back bytes are ignored if their batch size does not match the batch size of the decoded strings.
+ */
+class UTF8StreamSplit : public ov::op::Op {
+public:
+    OPENVINO_OP("UTF8StreamSplit");
+
+    UTF8StreamSplit () = default;
+
+    UTF8StreamSplit(const ov::OutputVector& arguments) :
+        ov::op::Op(arguments) {
+        constructor_validate_and_infer_types();
+    }
+
+    void validate_and_infer_types() override;
+
+    std::shared_ptr<ov::Node> clone_with_new_inputs(const ov::OutputVector& inputs) const override {
+        return std::make_shared<UTF8StreamSplit>(inputs);
+    }
+
+    bool visit_attributes(ov::AttributeVisitor& visitor) override {
+        return true;
+    }
+
+    bool evaluate(ov::TensorVector& outputs, const ov::TensorVector& inputs) const override;
+
+    bool has_evaluate() const override {
+        return true;
+    }
+};
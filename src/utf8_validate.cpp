@@ -2,6 +2,9 @@
 // SPDX-License-Identifier: Apache-2.0
 //
 
+#include <cstring>
+#include <vector>
+
 #include "utf8_validate.hpp"
 #include "openvino/opsets/opset13.hpp"
 using namespace ov;
@@ -9,129 +12,153 @@ using namespace ov::opset13;
 
 #undef tokenizer
 
+namespace {
 
-void UTF8Validate::validate_and_infer_types() {
-    check_string_input(this, 0);
-    set_string_output(this, 0, get_input_partial_shape(0));
-}
-
-bool UTF8Validate::evaluate(ov::TensorVector& outputs, const ov::TensorVector& inputs) const {
-    auto begins = inputs[0].data<int32_t>();
-    auto ends   = inputs[1].data<int32_t>();
-    auto bytes = inputs[2].data<uint8_t>();
-    auto begins_shape = inputs[0].get_shape();
-    auto chars_shape = inputs[2].get_shape();
-
-    const unsigned char replacement_symbol[] = {0xEF, 0xBF, 0xBD};  // UTF-8 encoding for "�"
-    outputs[0].set_shape(begins_shape);
-    outputs[1].set_shape(begins_shape);
-
-    // One byte can be replaced by 3 bytes at most,
-    // therefore need to allocate more space
-    size_t last_axis = chars_shape.size() - 1;
-    chars_shape[last_axis] = chars_shape[last_axis] * 3;
-    outputs[2].set_shape(chars_shape);
-
-    auto out_begins = outputs[0].data<int32_t>();
-    auto out_ends   = outputs[1].data<int32_t>();
-    auto out_bytes  = outputs[2].data<uint8_t>();
+const unsigned char replacement_symbol[] = {0xEF, 0xBF, 0xBD};  // UTF-8 encoding for "�"
 
-    // UTF-8 code points should not intersect:
-    // if 2 byte object has code point < 0x80 then it's not valid 2 byte utf-8,
-    // even if it has a valid bit mask.
+// Returns the length of a complete and valid UTF-8 symbol at the beginning of str, or 0 if it is invalid.
+// UTF-8 code points should not intersect: if 2 byte object has code point < 0x80 then it's not valid 2 byte utf-8,
+// even if it has a valid bit mask.
+size_t symbol_length(const uint8_t* str, size_t size) {
     const uint32_t code_point_starts[4] = {0x0, 0x80, 0x800, 0x10000};
-    uint32_t utf_code_point;
-    uint32_t bytes_to_consume;  // Number of additional 0b10xxxxxx bytes to consume to produce a valid UTF8 symbol.
     uint32_t num_bytes;
+    uint32_t utf_code_point;
+    if (str[0] < 0x80) {
+        return 1;
+    } else if (str[0] >> 5 == 0b110) {
+        num_bytes = 2;
+        utf_code_point = 0b11111 & str[0];
+    } else if (str[0] >> 4 == 0b1110) {
+        num_bytes = 3;
+        utf_code_point = 0b1111 & str[0];
+    } else if (str[0] >> 3 == 0b11110) {
+        num_bytes = 4;
+        utf_code_point = 0b111 & str[0];
+    } else {
+        return 0;
+    }
+    if (size < num_bytes) {
+        return 0;
+    }
+    for (size_t k = 1; k < num_bytes; ++k) {
+        if (str[k] >> 6 != 0b10) {
+            return 0;
+        }
+        utf_code_point = (utf_code_point << 6) | (0b111111 & str[k]);
+    }
+    return utf_code_point < code_point_starts[num_bytes - 1] ? 0 : num_bytes;
+}
 
-    size_t out_idx = begins[0];
-    for (size_t i = 0; i < begins_shape[0]; i++) {
-        // Flag indicating whether UTF8 symbol is complete: true means it's complete, false means we expect continuation.
-        // bool new_symbol_flag = true;
-        bytes_to_consume = 0;
-
-        out_begins[i] = out_idx;
-        for (size_t j = begins[i]; j < ends[i]; j += 1) {
-            // Beggining of the symbol.
-            // Check when the last octate of the previous symbol was processed.
-            if (!bytes_to_consume && bytes[j] < 128) {
-                // A valid single byte symbol.
-                out_bytes[out_idx] = bytes[j];
-                out_idx += 1;
-                continue;
-            } else if (!bytes_to_consume && bytes[j] >> 5 == 0b110) {
-                num_bytes = 2;
-                bytes_to_consume = 1;
-                utf_code_point = (0b11111 & bytes[j]) << 6;
-                continue;
-            } else if (!bytes_to_consume && bytes[j] >> 4 == 0b1110) {
-                num_bytes = 3;
-                bytes_to_consume = 2;
-                utf_code_point = (0b1111 & bytes[j]) << 6 * bytes_to_consume;
-                continue;
-            } else if (!bytes_to_consume && bytes[j] >> 3 == 0b11110) {
-                num_bytes = 4;
-                bytes_to_consume = 3;
-                utf_code_point = (0b111 & bytes[j]) << 6 * bytes_to_consume;
-                continue;
-            } else if (!bytes_to_consume) {
-                // Incorrect byte. Replace if flag is true, skip in other case.
-                if (m_replace_mode) {
-                    std::copy(replacement_symbol, replacement_symbol + 3, out_bytes + out_idx);
-                    out_idx += 3;
-                }
-                continue;
+// Returns the length of the longest prefix of str that consists of valid UTF-8 symbols.
+// ASCII runs are checked 8 bytes at a time.
+size_t valid_prefix_length(const uint8_t* str, size_t size) {
+    constexpr uint64_t high_bits = 0x8080808080808080ULL;
+    size_t i = 0;
+    while (i < size) {
+        uint64_t word;
+        while (i + sizeof(word) <= size) {
+            std::memcpy(&word, str + i, sizeof(word));
+            if (word & high_bits) {
+                break;
             }
+            i += sizeof(word);
+        }
+        while (i < size && str[i] < 0x80) {
+            ++i;
+        }
+        if (i == size) {
+            break;
+        }
+        const auto num_bytes = symbol_length(str + i, size - i);
+        if (num_bytes == 0) {
+            break;
+        }
+        i += num_bytes;
+    }
+    return i;
+}
 
-            // Check when we are continuating a multibyte symbol.
-            if (bytes_to_consume > 0 && bytes[j] >> 6 != 0b10) {
-                // Incorrect byte. Replace if flag is true, skip in other case.
-                // Incorrect continuation, but might be a valid beggining of another symbol.
-                // Try to run the cycle from the beggining (therefore j -= 1) but in the state of searching the start bit mask.
-                j -= 1;
-                bytes_to_consume = 0;
-                if (m_replace_mode) {
-                    std::copy(replacement_symbol, replacement_symbol + 3, out_bytes + out_idx);
-                    out_idx += 3;
-                }
-                continue;
-            }
+// Copies valid runs of str as is and replaces or skips invalid bytes in the same way as a byte-by-byte validation:
+// - incorrect leading byte is replaced with one "�";
+// - incomplete symbol is replaced with one "�", the byte that breaks it is processed as a new symbol;
+// - overlong symbol is replaced with "�" for each of its bytes.
+// Returns the number of output bytes, writes them to out only if it is not nullptr.
+size_t validate_utf8(const uint8_t* str, size_t size, bool replace_mode, uint8_t* out) {
+    size_t out_size = 0;
+    auto append = [&](const uint8_t* begin, size_t count) {
+        if (out) {
+            std::copy(begin, begin + count, out + out_size);
+        }
+        out_size += count;
+    };
 
-            if (bytes_to_consume > 0) {
-                bytes_to_consume -= 1;
-                utf_code_point |= (0b111111 & bytes[j]) << 6 * bytes_to_consume;
-            }
+    size_t pos = 0;
+    while (true) {
+        const auto valid_size = valid_prefix_length(str + pos, size - pos);
+        append(str + pos, valid_size);
+        pos += valid_size;
+        if (pos == size) {
+            break;
+        }
 
-            if (!bytes_to_consume && utf_code_point < code_point_starts[num_bytes - 1]) {
-                // utf_code_point is out of range.
-                // Incorrect byte. Replace if flag is true, skip in other case.
-                if (m_replace_mode) {
-                    // For multibyte symbol need to replace with several "�" symbols.
-                    for (size_t num = 0; num < num_bytes; num++) {
-                        std::copy(replacement_symbol, replacement_symbol + 3, out_bytes + out_idx);
-                        out_idx += 3;
-                    }
-                }
-                bytes_to_consume = 0;
-                continue;
-            } else if (!bytes_to_consume) {
-                // We formed a new symbols and utf_code_point is complete.
-                // Add bytes to the resulting sequence.
-                std::copy(bytes + j + 1 - num_bytes, bytes + j + 1, out_bytes + out_idx);
-                out_idx += num_bytes;
-                // Zeroing so that thr new code point from masks can be formed on the next cycle.
-                utf_code_point = 0;
+        size_t num_bytes = 1;
+        size_t num_replacements = 1;
+        if (str[pos] >> 5 == 0b110 || str[pos] >> 4 == 0b1110 || str[pos] >> 3 == 0b11110) {
+            const size_t expected_bytes = str[pos] >> 5 == 0b110 ? 2 : (str[pos] >> 4 == 0b1110 ? 3 : 4);
+            while (pos + num_bytes < size && num_bytes < expected_bytes && str[pos + num_bytes] >> 6 == 0b10) {
+                ++num_bytes;
+            }
+            if (num_bytes == expected_bytes) {
+                // all bytes are in place, so the code point is out of range
+                num_replacements = num_bytes;
             }
         }
-        // Check for unfinished sequence.
-        if (m_replace_mode && bytes_to_consume > 0) {
-            std::copy(replacement_symbol, replacement_symbol + 3, out_bytes + out_idx);
-            out_idx += 3;
+        if (replace_mode) {
+            for (size_t i = 0; i < num_replacements; ++i) {
+                append(replacement_symbol, 3);
+            }
         }
-        out_ends[i] = out_idx;
+        pos += num_bytes;
     }
+    return out_size;
+}
+
+}  // namespace
+
 
-    chars_shape[last_axis] = out_idx - begins[0];
-    outputs[2].set_shape(chars_shape);
+void UTF8Validate::validate_and_infer_types() {
+    check_string_input(this, 0);
+    set_string_output(this, 0, get_input_partial_shape(0));
+}
+
+bool UTF8Validate::evaluate(ov::TensorVector& outputs, const ov::TensorVector& inputs) const {
+    auto begins = inputs[0].data<const int32_t>();
+    auto ends   = inputs[1].data<const int32_t>();
+    auto bytes = inputs[2].data<const uint8_t>();
+    const auto begins_shape = inputs[0].get_shape();
+
+    outputs[0].set_shape(begins_shape);
+    outputs[1].set_shape(begins_shape);
+
+    // Valid strings are copied as is, so the exact output size is known after a validation pass.
+    // The pass remembers which strings are valid, so only the invalid ones are validated again during the copy.
+    const size_t num_strings = inputs[0].get_size();
+    std::vector<char> is_valid(num_strings);
+    count_then_fill<uint8_t>(
+        num_strings,
+        [&](size_t i) {
+            const size_t size = ends[i] - begins[i];
+            is_valid[i] = valid_prefix_length(bytes + begins[i], size) == size;
+            return is_valid[i] ? size : validate_utf8(bytes + begins[i], size, m_replace_mode, nullptr);
+        },
+        [&](size_t i, uint8_t* out_bytes) {
+            if (is_valid[i]) {
+                std::copy(bytes + begins[i], bytes + ends[i], out_bytes);
+            } else {
+                validate_utf8(bytes + begins[i], ends[i] - begins[i], m_replace_mode, out_bytes);
+            }
+        },
+        outputs[0].data<int32_t>(), outputs[1].data<int32_t>(), outputs[2]
+    );
     return true;
 }
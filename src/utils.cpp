@@ -10,6 +10,7 @@
 #include <cstdlib>
 #include <cctype>
 #include <algorithm>
+#include <cstring>
 #include <utility>
 
 using namespace ov;
@@ -253,6 +254,38 @@ void set_node_name(const std::string& node_name, const std::shared_ptr<Node>& no
     }
 }
 
+namespace {
+
+template <typename T>
+void fill_typed_pattern(char* dst, const char* pattern, size_t count) {
+    T value;
+    std::memcpy(&value, pattern, sizeof(T));
+    std::fill_n(reinterpret_cast<T*>(dst), count, value);
+}
+
+}  // namespace
+
+void fill_with_pattern(char* dst, const char* pattern, size_t pattern_size, size_t count) {
+    switch (pattern_size) {
+        case 1:
+            std::fill_n(dst, count, *pattern);
+            break;
+        case 2:
+            fill_typed_pattern<uint16_t>(dst, pattern, count);
+            break;
+        case 4:
+            fill_typed_pattern<uint32_t>(dst, pattern, count);
+            break;
+        case 8:
+            fill_typed_pattern<uint64_t>(dst, pattern, count);
+            break;
+        default:
+            for (size_t i = 0; i < count; ++i) {
+                dst = std::copy(pattern, pattern + pattern_size, dst);
+            }
+    }
+}
+
 PCRE2Wrapper::PCRE2Wrapper(const absl::string_view& pattern) {
     int errorcode;
     PCRE2_SIZE erroroffset;
@@ -424,39 +457,44 @@ std::pair<std::pair<size_t,size_t>, std::pair<size_t,size_t>> PCRE2Wrapper::matc
     if (m_compiled == nullptr) {
         return {{SIZE_MAX, SIZE_MAX}, {SIZE_MAX, SIZE_MAX}};
     }
-    pcre2_match_data* match_data = pcre2_match_data_create_from_pattern(m_compiled, NULL);
-    PCRE2_SIZE subject_length = str.length();
+    auto match_data = create_match_data();
+    return match_and_find_group(std::string_view(str.data(), str.size()), curr_start, match_data);
+}
+
+std::pair<std::pair<size_t,size_t>, std::pair<size_t,size_t>> PCRE2Wrapper::match_and_find_group(const std::string_view& str, size_t curr_start, MatchData& match_data) const {
+    if (m_compiled == nullptr || match_data.get() == nullptr) {
+        return {{SIZE_MAX, SIZE_MAX}, {SIZE_MAX, SIZE_MAX}};
+    }
+    PCRE2_SIZE subject_length = str.size();
 
     const auto match_func = m_is_jit ? pcre2_jit_match : pcre2_match;
     int match_result = match_func(
         m_compiled,
-        (PCRE2_SPTR) str.c_str(), subject_length,
+        (PCRE2_SPTR) str.data(), subject_length,
         curr_start,
         0,
-        match_data,
+        match_data.get(),
         NULL
     );
 
     if (match_result < 0) {
-        pcre2_match_data_free(match_data);
         return {{SIZE_MAX, SIZE_MAX}, {SIZE_MAX, SIZE_MAX}};
     }
 
-    PCRE2_SIZE *ovector = pcre2_get_ovector_pointer(match_data);
+    PCRE2_SIZE *ovector = pcre2_get_ovector_pointer(match_data.get());
     const std::pair<size_t,size_t> full_match = std::make_pair(ovector[0], ovector[1]);
     std::pair<size_t, size_t> group_match = std::make_pair(SIZE_MAX, SIZE_MAX);
 
     // in the old tokenizers #special tokens == #capture groups, find the only one that is inside full match
     // optimize for hundreds of tokens by using parallel_for
     // newer tokenizers (>2025.3.0) has <= 4 capture groups
-    ov::parallel_for(pcre2_get_ovector_count(match_data) - 1, [&](size_t group){
+    ov::parallel_for(pcre2_get_ovector_count(match_data.get()) - 1, [&](size_t group){
         ++group;  // group 0 is full match
         if (full_match.first <= ovector[2*group] && ovector[2*group] <= full_match.second && ovector[2*group + 1] <= full_match.second) {
             group_match = {ovector[2*group], ovector[2*group + 1]};
         }
     });
 
-    pcre2_match_data_free(match_data);
     return {full_match, group_match};
 }
 
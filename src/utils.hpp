@@ -5,7 +5,10 @@
 #pragma once
 
 #include <functional>
+#include <limits>
 #include <string_view>
+#include <vector>
+#include <openvino/core/parallel.hpp>
 #include <openvino/runtime/tensor.hpp>
 #include <openvino/frontend/node_context.hpp>
 #include <pcre2.h>
@@ -76,6 +79,43 @@ std::shared_ptr<ov::Node> string_attribute_to_constant (const ov::frontend::Node
 
 void set_node_name(const std::string& node_name, const std::shared_ptr<ov::Node>& node);
 
+// Fills dst with count copies of the element of pattern_size bytes pointed by pattern
+void fill_with_pattern(char* dst, const char* pattern, size_t pattern_size, size_t count);
+
+// Thread-local buffer that is reused between evaluate calls for per-element temporaries.
+// The buffer keeps its capacity, so the steady state makes no allocations. Tag separates buffers of different ops.
+template <typename T, typename Tag>
+std::vector<T>& get_scratch_buffer() {
+    thread_local std::vector<T> buffer;
+    buffer.clear();
+    return buffer;
+}
+
+// Builds ragged data of the exact size in two passes: count(i) returns the number of elements produced for the i-th
+// ragged element, then the offsets are written to out_begins/out_ends and fill(i, dst) writes the elements in parallel.
+template <typename T, typename Count, typename Fill>
+void count_then_fill(size_t num_elements, const Count& count, const Fill& fill,
+                     int32_t* out_begins, int32_t* out_ends, ov::Tensor& out_data) {
+    ov::parallel_for(num_elements, [&](size_t i) {
+        out_ends[i] = static_cast<int32_t>(count(i));
+    });
+
+    size_t total = 0;
+    for (size_t i = 0; i < num_elements; ++i) {
+        out_begins[i] = static_cast<int32_t>(total);
+        total += out_ends[i];
+        OPENVINO_ASSERT(total <= static_cast<size_t>(std::numeric_limits<int32_t>::max()),
+                        "Ragged tensor data size exceeds int32 range");
+        out_ends[i] = static_cast<int32_t>(total);
+    }
+
+    out_data.set_shape(ov::Shape{total});
+    auto data = out_data.data<T>();
+    ov::parallel_for(num_elements, [&](size_t i) {
+        fill(i, data + out_begins[i]);
+    });
+}
+
 class PCRE2Wrapper {
     public:
         class MatchData {
@@ -103,6 +143,7 @@ class PCRE2Wrapper {
         // Return both full-match offsets and capture-group offsets in one call.
         // Returns {{full_begin, full_end}, {group_begin, group_end}} or {{SIZE_MAX,SIZE_MAX},{SIZE_MAX,SIZE_MAX}} on failure.
         std::pair<std::pair<size_t,size_t>, std::pair<size_t,size_t>> match_and_find_group(const std::string& orig_str, size_t curr_start) const;
+        std::pair<std::pair<size_t,size_t>, std::pair<size_t,size_t>> match_and_find_group(const std::string_view& str, size_t curr_start, MatchData& match_data) const;
         ~PCRE2Wrapper();
     private:
         bool m_is_jit = 0;
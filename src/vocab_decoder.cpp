@@ -39,13 +39,16 @@ bool VocabDecoder::evaluate(ov::TensorVector& outputs, const ov::TensorVector& i
     } else {
         skip_tokens = m_skip_tokens;
     }
+    std::sort(skip_tokens.begin(), skip_tokens.end());
+
+    const size_t row_len = (seq_len > 0) ? seq_len : 1;
+    const size_t num_tokens = batch_size * row_len;
 
     // Set output shapes
     outputs[0].set_shape({batch_size});
     outputs[1].set_shape({batch_size});
-    outputs[2].set_shape({batch_size * ((seq_len > 0) ? seq_len : 1)});
-    outputs[3].set_shape({batch_size * ((seq_len > 0) ? seq_len : 1)});
-    const size_t num_rows = inputs[0].get_size();
+    outputs[2].set_shape({num_tokens});
+    outputs[3].set_shape({num_tokens});
 
     // Get pointers in the output tensors
     auto new_ragged_begins = outputs[0].data<int32_t>();
@@ -53,35 +56,33 @@ bool VocabDecoder::evaluate(ov::TensorVector& outputs, const ov::TensorVector& i
     auto new_begins = outputs[2].data<int32_t>();
     auto new_ends   = outputs[3].data<int32_t>();
 
-    std::deque<uint8_t> buffer;
     for(size_t batch = 0; batch < batch_size; ++batch) {
-        new_ragged_begins[batch] = batch * ((seq_len > 0) ? seq_len : 1);
-        new_ragged_ends[batch]   = new_ragged_begins[batch] + ((seq_len > 0) ? seq_len : 1);
+        new_ragged_begins[batch] = batch * row_len;
+        new_ragged_ends[batch]   = new_ragged_begins[batch] + row_len;
+    }
 
+    // Empty sequences still produce one empty string per batch element
+    auto is_decoded = [&](size_t idx) {
         if (seq_len == 0) {
-            new_begins[batch] = buffer.size();
-            new_ends[batch] = buffer.size();
-            continue;
-        };
+            return false;
+        }
+        const auto token_id = input_data[idx];
+        return token_id >= 0 && static_cast<size_t>(token_id) < vocab_size
+               && !std::binary_search(skip_tokens.begin(), skip_tokens.end(), token_id);
+    };
 
-        for(size_t seq = new_ragged_begins[batch]; seq < new_ragged_ends[batch]; ++seq) {
-            auto token_id = input_data[seq];
-            new_begins[seq] = buffer.size();
-            if (
-                token_id < vocab_size
-                && std::find(skip_tokens.begin(), skip_tokens.end(), token_id) == skip_tokens.end()
-            ) {
-                buffer.insert(
-                    buffer.end(),
-                    vocab_chars + vocab_begins[token_id],
-                    vocab_chars + vocab_ends[token_id]
-                );
+    // The exact number of output chars is known after the first pass, so no intermediate buffer is needed
+    count_then_fill<uint8_t>(
+        num_tokens,
+        [&](size_t idx) -> size_t {
+            return is_decoded(idx) ? vocab_ends[input_data[idx]] - vocab_begins[input_data[idx]] : 0;
+        },
+        [&](size_t idx, uint8_t* dst) {
+            if (is_decoded(idx)) {
+                std::copy(vocab_chars + vocab_begins[input_data[idx]], vocab_chars + vocab_ends[input_data[idx]], dst);
             }
-            new_ends[seq] = buffer.size();
-        }
-    }
-    outputs[4].set_shape({buffer.size()});
-    auto new_chars  = outputs[4].data<uint8_t>();
-    std::copy(buffer.begin(), buffer.end(), new_chars);
+        },
+        new_begins, new_ends, outputs[4]
+    );
     return true;
 }
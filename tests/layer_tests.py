@@ -16,15 +16,19 @@ from openvino_tokenizers.tokenizer_pipeline import (
     CaseFoldStep,
     CharsmapStep,
     DecodingStep,
+    FuseStep,
     NormalizationStep,
     NormalizeUnicode,
+    PaddingStep,
     PreTokenizatinStep,
+    RegexDecodingStep,
     RegexNormalizationStep,
     RegexSplitStep,
     SpecialToken,
     SpecialTokensSplit,
     TokenizerPipeline,
     UTF8ValidateStep,
+    VocabDecoderStep,
 )
 from openvino_tokenizers.utils import TokenzierConversionParams
 
@@ -114,6 +118,7 @@ utf8_validate_strings = [
     b"A\xc3\x28B",  # 'A' and 'B' are valid \x28 is invalid
     b"\xe2\x82",  # 3 byte symbol but is incomplete
     b"A\xc3\xa9\xe2\x82\xac\xf0\x90\x8d\x88",  # Mix of ASCII, 2-byte, 3-byte, and 4-byte characters
+    b"long ascii prefix\xffand\xe2\x82 long ascii suffix",  # Invalid bytes between 8-byte aligned ASCII runs
 ]
 
 
@@ -139,6 +144,48 @@ def test_utf8_validate(test_string, replace_mode):
     assert res_ov == res_py
 
 
+@pytest.mark.parametrize("replace_mode", ["ignore", "replace"])
+def test_utf8_validate_batch(replace_mode):
+    utf_validation_node = UTF8ValidateStep(UTF8ReplaceMode(replace_mode))
+    compiled_model = create_normalization_model(utf_validation_node)
+    res_ov = compiled_model([np.array(utf8_validate_strings)])[0]
+    res_py = [test_string.decode(errors=replace_mode) for test_string in utf8_validate_strings]
+    assert res_ov.tolist() == res_py
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5])
+def test_streaming_detokenizer(chunk_size):
+    vocab = [bytes([byte]) for byte in range(256)]
+    pipeline = TokenizerPipeline(vocab=vocab)
+    pipeline.add_steps([VocabDecoderStep(vocab=vocab), FuseStep(), UTF8ValidateStep(UTF8ReplaceMode.REPLACE)])
+    infer_request = core.compile_model(pipeline.get_detokenizer_ov_subgraph(stateful=True)).create_infer_request()
+
+    test_strings = [" Проверка, 測試字符串 😁 ".encode(), b"A\xc3\xa9\xe2\x82\xac\xf0\x90\x8d\x88\x81"]
+    for test_string in test_strings:
+        infer_request.reset_state()
+        token_ids = list(test_string)
+        res_ov = "".join(
+            infer_request.infer([np.array([token_ids[idx : idx + chunk_size]], dtype=np.int32)])[0][0]
+            for idx in range(0, len(token_ids), chunk_size)
+        )
+        assert res_ov == test_string.decode(errors="replace")
+
+
+def test_detokenizer_is_stateless_by_default():
+    vocab = [bytes([byte]) for byte in range(256)]
+    pipeline = TokenizerPipeline(vocab=vocab)
+    pipeline.add_steps([VocabDecoderStep(vocab=vocab), FuseStep(), UTF8ValidateStep(UTF8ReplaceMode.REPLACE)])
+    assert not pipeline.get_detokenizer_ov_subgraph().get_sinks()
+
+
+def test_stateful_detokenizer_rejects_clean_up_tokenization_spaces():
+    vocab = [bytes([byte]) for byte in range(256)]
+    pipeline = TokenizerPipeline(vocab=vocab)
+    pipeline.add_steps([VocabDecoderStep(vocab=vocab), FuseStep(), RegexDecodingStep.clean_up_tokenization_spaces()])
+    with pytest.raises(ValueError, match="clean_up_tokenization_spaces"):
+        pipeline.get_detokenizer_ov_subgraph(stateful=True)
+
+
 tokenizers_with_charsmap = ["google/flan-t5-xxl"]
 
 
@@ -598,6 +645,65 @@ def test_ragged_to_dense(input_values, expected):
     assert np.all(res[0] == np.array(expected, dtype=np.int32))
 
 
+@pytest.mark.parametrize(
+    "mask_element_type, mask_dtype", [("boolean", np.bool_), ("i32", np.int32), ("i64", np.int64)]
+)
+@pytest.mark.parametrize("pad_right", [True, False])
+def test_ragged_to_dense_mask(mask_element_type, mask_dtype, pad_right):
+    begins = np.array([0, 3, 8], dtype=np.int32)
+    ends = np.array([3, 8, 8], dtype=np.int32)
+    data = np.array([10, 20, 100, 30, 40, 50, 200, 300], dtype=np.int32)
+
+    input_params = [op.Parameter(Type.i32, PartialShape(["?"])) for _ in range(3)]
+    ragged_to_dense = _get_factory().create(
+        "RaggedToDense",
+        [*input_params, op.Constant(np.array(6, dtype=np.int32)), op.Constant(np.array(0, dtype=np.int32))],
+        {"pad_right": pad_right, "mask_element_type": mask_element_type},
+    )
+    compiled_model = core.compile_model(Model(ragged_to_dense.outputs(), input_params, "ragged_to_dense_mask"))
+    res = compiled_model([begins, ends, data])
+
+    expected_mask = np.array([[1, 1, 1, 0, 0, 0], [1, 1, 1, 1, 1, 0], [0, 0, 0, 0, 0, 0]], dtype=mask_dtype)
+    if not pad_right:
+        expected_mask = expected_mask[:, ::-1]
+    assert res[1].dtype == mask_dtype
+    assert np.all(res[1] == expected_mask)
+
+
+def test_ragged_to_dense_without_mask():
+    begins = np.array([0, 3, 8], dtype=np.int32)
+    ends = np.array([3, 8, 8], dtype=np.int32)
+    data = np.array([10, 20, 100, 30, 40, 50, 200, 300], dtype=np.int32)
+
+    # the padding of token_type_ids does not calculate the mask, the attention mask is from the token ids
+    input_params = [op.Parameter(Type.i32, PartialShape(["?"])) for _ in range(6)]
+    padding = PaddingStep(token="<pad>", _token_id=0)
+    outputs = padding.get_ov_subgraph(input_params)
+    compute_mask = [
+        node.get_attributes()["compute_mask"]
+        for node in Model(outputs, input_params).get_ordered_ops()
+        if node.get_type_name() == "RaggedToDense"
+    ]
+    assert compute_mask == [True, False]
+
+    ragged_to_dense = _get_factory().create(
+        "RaggedToDense",
+        [*input_params[:3], op.Constant(np.array(6, dtype=np.int32)), op.Constant(np.array(42, dtype=np.int32))],
+        {"compute_mask": False},
+    )
+    model = Model(ragged_to_dense.outputs()[:1], input_params[:3], "ragged_to_dense_without_mask")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_path = Path(tmp_dir) / "ragged_to_dense.xml"
+        ov.save_model(model, model_path)
+        model = core.read_model(model_path)
+    [node] = [node for node in model.get_ordered_ops() if node.get_type_name() == "RaggedToDense"]
+    assert node.get_attributes()["compute_mask"] is False
+
+    res = core.compile_model(model)([begins, ends, data])
+    expected = [[10, 20, 100, 42, 42, 42], [30, 40, 50, 200, 300, 42], [42, 42, 42, 42, 42, 42]]
+    assert np.all(res[0] == np.array(expected, dtype=np.int32))
+
+
 @pytest.mark.parametrize(
     "input_values, expected",
     [
@@ -624,6 +730,17 @@ def test_ragged_to_dense(input_values, expected):
                 "data": [10, 20, 100, 1000, 2000, 30, 40, 50, 200, 300, 3000],
             },
         ),
+        (
+            [
+                {"begins": [0, 0], "ends": [2, 2], "data": [10, 20]},  # [10, 20], [10, 20] share the elements
+                {"begins": [0, 1], "ends": [1, 3], "data": [100, 200, 300]},  # [100], [200, 300]
+            ],
+            {
+                "begins": [0, 3],
+                "ends": [3, 7],
+                "data": [10, 20, 100, 10, 20, 200, 300],
+            },  # [[10, 20, 100], [10, 20, 200, 300]]
+        ),
     ],
 )
 def test_combine_segments(input_values, expected):
@@ -643,6 +760,36 @@ def test_combine_segments(input_values, expected):
     for (_, val), (_, expect_val) in zip(res.items(), expected.items()):
         assert np.all(val == np.array(expect_val, dtype=np.int32))
 
+    expected_segment_ids = [
+        segment_id
+        for row in range(len(expected["begins"]))
+        for segment_id, value in enumerate(input_values)
+        for _ in range(value["ends"][row] - value["begins"][row])
+    ]
+    assert np.all(res[5] == np.array(expected_segment_ids, dtype=np.int32))
+
+
+@pytest.mark.parametrize(
+    "strings, expected_unique_idxs",
+    [
+        (["a", "b", "a", "", "b", ""], [0, 1, 0, 2, 1, 2]),
+        (["same"] * 4, [0, 0, 0, 0]),
+        (["ab", "a", "b", "abc"], [0, 1, 2, 3]),
+    ],
+)
+def test_unique_strings(strings, expected_unique_idxs):
+    input_node = op.Parameter(Type.string, PartialShape(["?"]))
+    unpacked = _get_opset_factory("opset15").create("StringTensorUnpack", input_node.outputs()).outputs()
+    unique_begins, unique_ends, unique_idxs = _get_factory().create("UniqueStrings", unpacked).outputs()
+    # the unique strings point to the input chars
+    pack_inputs = [unique_begins, unique_ends, unpacked[2]]
+    unique_strings = _get_opset_factory("opset15").create("StringTensorPack", pack_inputs).outputs()
+    model = Model([*unique_strings, unique_idxs], [input_node], "unique_strings")
+
+    res = core.compile_model(model)([np.array(strings)])
+    assert res[0].tolist() == list(dict.fromkeys(strings))
+    assert res[1].tolist() == expected_unique_idxs
+
 
 @pytest.mark.parametrize(
     "values, dtype",
@@ -1,22 +1,53 @@
 # -*- coding: utf-8 -*-
 # Copyright (C) 2018-2026 Intel Corporation
 # SPDX-License-Identifier: Apache-2.0
+import asyncio
 import difflib
+import json
 import os
+import subprocess
 import sys
+import threading
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import fields
+from pathlib import Path
 from typing import Any, Optional, Union
 
 import numpy as np
 import pytest
-from openvino import Core, Model, Type, properties, save_model
-from openvino_tokenizers import convert_tokenizer
-from openvino_tokenizers.constants import ORIGINAL_TOKENIZER_CLASS_NAME, rt_info_to_hf_attribute_map
-from openvino_tokenizers.utils import TokenzierConversionParams, get_hf_tokenizer_attribute
+import transformers
+from openvino import Core, Model, PartialShape, Type, properties, save_model
+from openvino import opset12 as opset
+from openvino_tokenizers import (
+    EncodingCache,
+    TokenizerRuntime,
+    convert_gguf_tokenizer,
+    convert_tokenizer,
+    convert_tokenizer_json,
+    encode_bucketed,
+    encode_stream,
+    read_tokenizers_with_shared_weights,
+    save_tokenizers_with_shared_weights,
+)
+from openvino_tokenizers.bucketing import BucketedBatch
+from openvino_tokenizers.cli_tools import bulk_convert
+from openvino_tokenizers.cli_tools.pretokenize_corpus import open_token_shard, pretokenize_corpus
+from openvino_tokenizers.cli_tools.serve_tokenizer import TokenizerClient, create_server, load_runtime
+from openvino_tokenizers.constants import (
+    ORIGINAL_TOKENIZER_CLASS_NAME,
+    SHARED_WEIGHTS_MODEL_NAME,
+    rt_info_to_hf_attribute_map,
+)
+from openvino_tokenizers.encoding_cache import get_model_cache_key
+from openvino_tokenizers.gguf_parser import gguf_to_tokenizer_json, read_gguf_tokenizer_metadata
+from openvino_tokenizers.hf_parser import TOKENIZERS_WITHOUT_TOKEN_TYPE_IDS, TokenizerJson
+from openvino_tokenizers.runtime import split_rows
+from openvino_tokenizers.streaming import iter_text_chunks
+from openvino_tokenizers.utils import TokenzierConversionParams, get_hf_tokenizer_attribute, unpack_strings
 from transformers import AutoTokenizer
 
-from tests.utils import AsyncTokenizerRunner, get_hf_tokenizer
+from tests.utils import AsyncTokenizerRunner, get_hf_tokenizer, save_tokenizer_to_gguf
 
 
 if os.environ.get("OV_TOKENIZERS_TESTS_PRINT_WHOLE_DIFF"):
@@ -1066,6 +1097,681 @@ def test_loading_from_cache(tmp_path, model_id, test_string):
     check_tokenizer_output((hf_tokenizer, compiled_tokenizer), test_string=test_string)
 
 
+@pytest.mark.parametrize(
+    "model_id",
+    [
+        "Xenova/gpt-4o",
+    ],
+)
+def test_conversion_cache(tmp_path, model_id):
+    request = namedtuple("request", ["param"])(model_id)
+    hf_tokenizer = get_hf_tokenizer(request, trust_remote_code=True)
+    cache_dir = tmp_path / "conversion_cache"
+
+    ov_tokenizer = convert_tokenizer(hf_tokenizer, with_detokenizer=False, cache_dir=cache_dir)
+    assert len(list(cache_dir.iterdir())) == 1
+
+    cached_tokenizer = convert_tokenizer(hf_tokenizer, with_detokenizer=False, cache_dir=cache_dir)
+    assert len(list(cache_dir.iterdir())) == 1
+    for test_string in cache_test_strings:
+        check_tokenizer_output((hf_tokenizer, core.compile_model(cached_tokenizer, "CPU")), test_string=test_string)
+    cached_rt_info = cached_tokenizer.get_rt_info("add_special_tokens").astype(str)
+    assert cached_rt_info == ov_tokenizer.get_rt_info("add_special_tokens").astype(str)
+
+    # other conversion params produce a separate entry, the least recently used entry is evicted
+    convert_tokenizer(hf_tokenizer, with_detokenizer=True, cache_dir=cache_dir)
+    assert len(list(cache_dir.iterdir())) == 2
+    convert_tokenizer(
+        hf_tokenizer, with_detokenizer=True, add_special_tokens=False, cache_dir=cache_dir, cache_size_limit=1
+    )
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+def test_conversion_profile_report(tmp_path):
+    request = namedtuple("request", ["param"])("Xenova/gpt-4o")
+    hf_tokenizer = get_hf_tokenizer(request)
+    report_path = tmp_path / "profile.json"
+
+    convert_tokenizer(hf_tokenizer, with_detokenizer=True, cache_dir=tmp_path / "cache", profile_report=report_path)
+
+    with open(report_path, encoding="utf-8") as f:
+        stages = json.load(f)["stages"]
+    assert stages[0]["name"] == "convert_tokenizer" and stages[0]["parent"] is None
+    parser_stages = [stage["name"] for stage in stages if stage["kind"] == "parser_stage"]
+    assert parser_stages == [
+        "special_tokens_split",
+        "normalization",
+        "pre_tokenization",
+        "tokenization_model",
+        "post_tokenization",
+        "decoding",
+    ]
+    step_names = {stage["name"] for stage in stages if stage["kind"] == "get_ov_subgraph"}
+    assert {"BPETokenizationStep", "VocabDecoderStep"} <= step_names
+    assert any(stage["name"] == "serialization" for stage in stages)
+    assert all(stage["wall_time_ms"] >= 0 and stage["peak_memory_mb"] >= 0 for stage in stages)
+
+
+@pytest.mark.parametrize(
+    "model_id",
+    [
+        "bert-base-multilingual-cased",
+        "Xenova/gpt-4o",
+        "microsoft/deberta-base",
+        "BAAI/bge-reranker-v2-m3",
+    ],
+)
+def test_convert_tokenizer_json(tmp_path, model_id):
+    request = namedtuple("request", ["param"])(model_id)
+    hf_tokenizer = get_hf_tokenizer(request, trust_remote_code=True)
+    hf_tokenizer.save_pretrained(tmp_path)
+
+    ov_tokenizer, ov_detokenizer = convert_tokenizer_json(tmp_path, with_detokenizer=True)
+    ref_tokenizer = convert_tokenizer(hf_tokenizer)
+    assert [output.get_names() for output in ov_tokenizer.outputs] == [
+        output.get_names() for output in ref_tokenizer.outputs
+    ]
+
+    compiled_detokenizer = core.compile_model(ov_detokenizer, "CPU")
+    for test_string in cache_test_strings:
+        check_tokenizer_output((hf_tokenizer, core.compile_model(ov_tokenizer, "CPU")), test_string=test_string)
+        token_ids = hf_tokenizer(test_string, return_tensors="np").input_ids
+        ov_output = compiled_detokenizer(token_ids)["string_output"]
+        assert ov_output.tolist() == hf_tokenizer.batch_decode(token_ids, skip_special_tokens=True)
+
+
+@pytest.mark.parametrize(
+    "tokenizer_class",
+    [
+        "AlbertTokenizerFast",
+        "XLNetTokenizerFast",
+        "FunnelTokenizerFast",
+        "BertTokenizerFast",
+        "PreTrainedTokenizerFast",
+        *sorted(TOKENIZERS_WITHOUT_TOKEN_TYPE_IDS),
+    ],
+)
+def test_tokenizer_json_model_input_names(tokenizer_class):
+    hf_tokenizer_class = getattr(transformers, tokenizer_class, None)
+    if hf_tokenizer_class is None:
+        pytest.skip(f"{tokenizer_class} is not available in the installed transformers")
+
+    tokenizer_config = {"tokenizer_class": tokenizer_class}
+    model_input_names = TokenizerJson.get_model_input_names(tokenizer_config)
+    assert set(model_input_names) == set(hf_tokenizer_class.model_input_names)
+
+    # the names from tokenizer_config.json take priority over the class defaults
+    tokenizer_json = {"model": {"type": "WordPiece", "vocab": {}}}
+    tokenizer_config["model_input_names"] = ["input_ids", "attention_mask"]
+    assert TokenizerJson(tokenizer_json, tokenizer_config).model_input_names == ["input_ids", "attention_mask"]
+
+
+@pytest.mark.parametrize(
+    "model_id",
+    [
+        "Xenova/gpt-4o",
+        "Qwen/Qwen3-Reranker-0.6B",
+    ],
+)
+def test_shared_weights(tmp_path, model_id):
+    request = namedtuple("request", ["param"])(model_id)
+    hf_tokenizer = get_hf_tokenizer(request)
+    ov_tokenizer, ov_detokenizer = convert_tokenizer(hf_tokenizer, with_detokenizer=True)
+
+    save_tokenizers_with_shared_weights(ov_tokenizer, ov_detokenizer, tmp_path / "shared.xml")
+    save_model(ov_tokenizer, tmp_path / "tokenizer.xml")
+    save_model(ov_detokenizer, tmp_path / "detokenizer.xml")
+    shared_size = (tmp_path / "shared.bin").stat().st_size
+    assert shared_size < (tmp_path / "tokenizer.bin").stat().st_size + (tmp_path / "detokenizer.bin").stat().st_size
+
+    shared_tokenizer, shared_detokenizer = read_tokenizers_with_shared_weights(tmp_path / "shared.xml", core)
+    assert [output.get_names() for output in shared_tokenizer.outputs] == [
+        output.get_names() for output in ov_tokenizer.outputs
+    ]
+    assert len(shared_tokenizer.get_sinks()) == len(ov_tokenizer.get_sinks())
+    shared_rt_info = shared_detokenizer.get_rt_info("add_special_tokens").astype(str)
+    assert shared_rt_info == ov_detokenizer.get_rt_info("add_special_tokens").astype(str)
+
+    compiled_detokenizer = core.compile_model(shared_detokenizer, "CPU")
+    for test_string in cache_test_strings:
+        check_tokenizer_output((hf_tokenizer, core.compile_model(shared_tokenizer, "CPU")), test_string=test_string)
+        token_ids = hf_tokenizer(test_string, return_tensors="np").input_ids
+        ov_output = compiled_detokenizer(token_ids)["string_output"]
+        assert ov_output.tolist() == hf_tokenizer.batch_decode(token_ids, skip_special_tokens=True)
+
+
+@pytest.mark.parametrize(
+    "model_id",
+    [
+        "Xenova/gpt-4o",  # BPE, BytesToChars
+        "bert-base-uncased",  # WordPiece
+        "camembert-base",  # Unigram
+    ],
+)
+def test_repeated_batches(model_id):
+    # the ops size the outputs from the inputs of each call and keep the scratch buffers between calls,
+    # the batches of different sizes and lengths on the same infer request catch stale buffers and wrong sizes
+    request = namedtuple("request", ["param"])(model_id)
+    hf_tokenizer = get_hf_tokenizer(request)
+    ov_tokenizer, ov_detokenizer = convert_tokenizer(hf_tokenizer, with_detokenizer=True)
+    compiled_tokenizer = core.compile_model(ov_tokenizer)
+    compiled_detokenizer = core.compile_model(ov_detokenizer)
+    texts = [*cache_test_strings, *multilingual_test_strings[:4], *emoji_test_strings, *misc_strings]
+
+    # the reference outputs of each text are computed with a new infer request
+    ref_token_ids = [
+        compiled_tokenizer.create_infer_request().infer([[text]])["input_ids"][0].tolist() for text in texts
+    ]
+    ref_decoded = [
+        compiled_detokenizer.create_infer_request().infer([np.array([token_ids], dtype=np.int64)])["string_output"][0]
+        for token_ids in ref_token_ids
+    ]
+    assert ref_token_ids[0] == hf_tokenizer(texts[0])["input_ids"]
+
+    tokenizer_request = compiled_tokenizer.create_infer_request()
+    detokenizer_request = compiled_detokenizer.create_infer_request()
+    for batch_size in (len(texts), 1, 3, len(texts), 2, 7):
+        for start in range(0, len(texts), batch_size):
+            batch = texts[start : start + batch_size]
+            output = tokenizer_request.infer([batch])
+            token_ids = [
+                row[mask.astype(bool)].tolist() for row, mask in zip(output["input_ids"], output["attention_mask"])
+            ]
+            assert token_ids == ref_token_ids[start : start + batch_size], batch_size
+
+            # the rows are decoded one by one to compare them without padding
+            for row_token_ids, ref_text in zip(token_ids, ref_decoded[start : start + batch_size]):
+                decoded = detokenizer_request.infer([np.array([row_token_ids], dtype=np.int64)])["string_output"]
+                assert decoded.tolist() == [ref_text], batch_size
+
+
+def test_lazy_imports():
+    # the runtime helpers are imported on the first use, they pull in threading and asyncio
+    lazy_modules = ["bucketing", "build_tokenizer", "encoding_cache", "runtime", "shared_weights", "streaming"]
+    code = "import sys, openvino_tokenizers; print(' '.join(sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    imported_modules = set(result.stdout.split())
+    assert [name for name in lazy_modules if f"openvino_tokenizers.{name}" in imported_modules] == []
+
+    import openvino_tokenizers
+    from openvino_tokenizers.runtime import TokenizerRuntime as runtime_class
+
+    assert openvino_tokenizers.TokenizerRuntime is runtime_class
+    with pytest.raises(AttributeError):
+        openvino_tokenizers.missing_attribute
+
+
+def test_tokenizer_runtime():
+    request = namedtuple("request", ["param"])("Xenova/gpt-4o")
+    hf_tokenizer = get_hf_tokenizer(request)
+    runtime = TokenizerRuntime.from_hf_tokenizer(hf_tokenizer, num_requests=2)
+    ref_token_ids = [hf_tokenizer(test_string)["input_ids"] for test_string in cache_test_strings]
+
+    # the returned arrays stay valid after the infer requests are reused
+    outputs = runtime.encode_batch(cache_test_strings)
+    with ThreadPoolExecutor(4) as executor:
+        outputs.extend(executor.map(runtime.encode, cache_test_strings))
+    for output, token_ids in zip(outputs, ref_token_ids * 2):
+        assert output["input_ids"][0].tolist() == token_ids
+
+    async def decode_all():
+        return await asyncio.gather(*(runtime.decode_async(token_ids) for token_ids in ref_token_ids))
+
+    decoded = asyncio.run(decode_all())
+    assert decoded == [hf_tokenizer.batch_decode([token_ids]) for token_ids in ref_token_ids]
+    assert runtime.decode(ref_token_ids[0]) == [hf_tokenizer.decode(ref_token_ids[0])]
+
+
+def test_tokenizer_runtime_inference_error():
+    token_ids = opset.parameter(PartialShape([-1, -1]), Type.i64)
+    # the reshape fails at inference time for the inputs with other than 4 elements
+    reshaped = opset.reshape(token_ids, opset.constant(np.array([2, 2], dtype=np.int64)), special_zero=False)
+    runtime = TokenizerRuntime(detokenizer=Model([reshaped], [token_ids]), num_requests=2)
+
+    for _ in range(2 * runtime.detokenizer_pool.num_requests):
+        with pytest.raises(RuntimeError):
+            runtime.decode([1, 2, 3])
+    with pytest.raises(RuntimeError):
+        asyncio.run(runtime.decode_async([1, 2, 3]))
+
+    # the infer requests are returned to the pool after the errors
+    future = runtime.detokenizer_pool.submit(
+        [np.array([[1, 2, 3, 4]], dtype=np.int64)], lambda request: request.get_output_tensor().data.copy()
+    )
+    assert future.result().tolist() == [[1, 2], [3, 4]]
+    runtime.detokenizer_pool.wait_all()
+
+
+@pytest.mark.parametrize(
+    "model_id",
+    [
+        "Xenova/gpt-4o",
+        "bert-base-uncased",
+    ],
+)
+@pytest.mark.parametrize("ragged_output", [False, True])
+def test_encoding_cache(model_id, ragged_output):
+    request = namedtuple("request", ["param"])(model_id)
+    hf_tokenizer = get_hf_tokenizer(request)
+    cache = EncodingCache()
+    runtime = TokenizerRuntime(convert_tokenizer(hf_tokenizer, ragged_output=ragged_output), cache=cache)
+    texts = cache_test_strings * 2
+
+    runtime.encode(cache_test_strings[::2])
+    assert cache.get_stats()["misses"] == len(cache_test_strings[::2])
+    # the cached and the tokenized rows are merged in the order of the texts
+    outputs = runtime.encode(texts)
+    ref_outputs = runtime.encode(texts, use_cache=False)
+    assert list(outputs) == list(ref_outputs)
+    for name, ref_output in ref_outputs.items():
+        assert outputs[name].dtype == ref_output.dtype
+        assert np.array_equal(outputs[name], ref_output), name
+
+    assert len(cache) == len(set(cache_test_strings))
+    # the call without the cache is not counted
+    assert cache.hits == 2 * len(cache_test_strings[::2])
+    [row] = split_rows(asyncio.run(runtime.encode_async(texts[0])))
+    assert row["input_ids"].tolist() == hf_tokenizer(texts[0])["input_ids"]
+
+
+def test_encoding_cache_key():
+    request = namedtuple("request", ["param"])("Xenova/gpt-4o")
+    hf_tokenizer = get_hf_tokenizer(request)
+    assert get_model_cache_key(convert_tokenizer(hf_tokenizer)) == get_model_cache_key(convert_tokenizer(hf_tokenizer))
+
+    # the models with the same rt_info and outputs but different vocabs do not share the cached outputs
+    def make_model(vocab):
+        token_ids = opset.parameter(PartialShape([-1]), Type.i32)
+        output = opset.gather(opset.constant(np.array(vocab, dtype=np.int32)), token_ids, 0)
+        output.output(0).tensor.add_names({"input_ids"})
+        model = Model([output], [token_ids])
+        model.set_rt_info("tokenizer", "original_tokenizer_class")
+        return model
+
+    assert get_model_cache_key(make_model([1, 2, 3])) == get_model_cache_key(make_model([1, 2, 3]))
+    assert get_model_cache_key(make_model([1, 2, 3])) != get_model_cache_key(make_model([1, 2, 4]))
+
+    # the compiled models are never keyed by the object id, it can be reused after the model is deleted
+    compiled_model = core.compile_model(make_model([1, 2, 3]))
+    assert get_model_cache_key(compiled_model) != get_model_cache_key(compiled_model)
+
+
+@pytest.mark.parametrize(
+    "model_id",
+    [
+        "Xenova/gpt-4o",
+        "bert-base-uncased",
+    ],
+)
+def test_ragged_output(model_id):
+    request = namedtuple("request", ["param"])(model_id)
+    hf_tokenizer = get_hf_tokenizer(request)
+    ov_tokenizer = core.compile_model(convert_tokenizer(hf_tokenizer, ragged_output=True))
+    output_names = [output.get_any_name() for output in ov_tokenizer.outputs]
+    assert "attention_mask" not in output_names and output_names[-1] == "row_offsets"
+
+    output = ov_tokenizer(cache_test_strings)
+    row_offsets = output["row_offsets"]
+    assert row_offsets.shape == (len(cache_test_strings) + 1,) and row_offsets[-1] == len(output["input_ids"])
+    hf_output = hf_tokenizer(cache_test_strings)
+    for name in output_names[:-1]:
+        assert [
+            output[name][begin:end].tolist() for begin, end in zip(row_offsets[:-1], row_offsets[1:])
+        ] == hf_output[name]
+
+
+@pytest.mark.parametrize(
+    "model_id",
+    [
+        "Xenova/gpt-4o",
+        "bert-base-uncased",
+    ],
+)
+def test_token_count_output(model_id):
+    request = namedtuple("request", ["param"])(model_id)
+    hf_tokenizer = get_hf_tokenizer(request)
+    ov_tokenizer = core.compile_model(convert_tokenizer(hf_tokenizer, token_count_output=True))
+    assert [output.get_any_name() for output in ov_tokenizer.outputs] == ["token_count"]
+
+    token_count = ov_tokenizer(cache_test_strings)["token_count"]
+    assert token_count.tolist() == [len(token_ids) for token_ids in hf_tokenizer(cache_test_strings)["input_ids"]]
+
+
+@pytest.mark.parametrize(
+    "model_id",
+    [
+        "Xenova/gpt-4o",
+        "bert-base-uncased",
+    ],
+)
+@pytest.mark.parametrize(
+    "convert_kwargs",
+    [
+        {},
+        {"unpacked_string_input": True},
+        {"ragged_output": True},
+    ],
+)
+def test_deduplicate_inputs(model_id, convert_kwargs):
+    request = namedtuple("request", ["param"])(model_id)
+    hf_tokenizer = get_hf_tokenizer(request)
+    ov_tokenizer = core.compile_model(convert_tokenizer(hf_tokenizer, deduplicate_inputs=True, **convert_kwargs))
+    ref_ov_tokenizer = core.compile_model(convert_tokenizer(hf_tokenizer, **convert_kwargs))
+    test_strings = [*cache_test_strings, *reversed(cache_test_strings), cache_test_strings[0]]
+    inputs = unpack_strings(test_strings) if convert_kwargs.get("unpacked_string_input") else test_strings
+
+    output = ov_tokenizer(inputs)
+    ref_output = ref_ov_tokenizer(inputs)
+    for output_name in (output.get_any_name() for output in ref_ov_tokenizer.outputs):
+        assert np.array_equal(output[output_name], ref_output[output_name])
+
+
+def test_unpacked_string_input():
+    request = namedtuple("request", ["param"])("Xenova/gpt-4o")
+    hf_tokenizer = get_hf_tokenizer(request)
+    ov_tokenizer = core.compile_model(convert_tokenizer(hf_tokenizer, unpacked_string_input=True))
+    assert [input_.get_element_type() for input_ in ov_tokenizer.inputs] == [Type.i32, Type.i32, Type.u8]
+    ref_token_ids = [hf_tokenizer(test_string)["input_ids"] for test_string in cache_test_strings]
+
+    byte_strings = np.array([test_string.encode() for test_string in cache_test_strings])
+    for strings in (cache_test_strings, byte_strings):
+        output = ov_tokenizer(unpack_strings(strings))
+        token_ids = [
+            row[mask.astype(bool)].tolist() for row, mask in zip(output["input_ids"], output["attention_mask"])
+        ]
+        assert token_ids == ref_token_ids
+
+    # the chars of the bytes array are used without copying
+    assert np.shares_memory(unpack_strings(byte_strings)[2], byte_strings)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+@pytest.mark.parametrize("strings", [np.array([], dtype="S5"), np.array([b"", b""]), np.array([b"ab", b"", b"c"])])
+def test_unpack_bytes_array(strings, compact):
+    begins, ends, chars = unpack_strings(strings, compact=compact)
+    assert (begins.dtype, ends.dtype, chars.dtype) == (np.int32, np.int32, np.uint8)
+    assert [chars[begin:end].tobytes() for begin, end in zip(begins, ends)] == strings.tolist()
+
+
+def test_unpacked_string_input_arrow():
+    pa = pytest.importorskip("pyarrow")
+    request = namedtuple("request", ["param"])("Xenova/gpt-4o")
+    hf_tokenizer = get_hf_tokenizer(request)
+    runtime = TokenizerRuntime(convert_tokenizer(hf_tokenizer, unpacked_string_input=True))
+
+    strings = pa.array(cache_test_strings).slice(1)
+    begins, ends, chars = unpack_strings(strings)
+    assert np.shares_memory(chars, np.frombuffer(strings.buffers()[2], np.uint8))
+    for test_string, begin, end in zip(cache_test_strings[1:], begins, ends):
+        assert chars[begin:end].tobytes().decode() == test_string
+        token_ids = runtime.encode(pa.array([test_string]))["input_ids"][0]
+        assert token_ids.tolist() == hf_tokenizer(test_string)["input_ids"]
+
+
+def test_encode_bucketed():
+    request = namedtuple("request", ["param"])("Xenova/gpt-4o")
+    hf_tokenizer = get_hf_tokenizer(request)
+    ov_tokenizer = core.compile_model(convert_tokenizer(hf_tokenizer))
+    runtime = TokenizerRuntime(ov_tokenizer, num_requests=2)
+    ref_token_ids = [hf_tokenizer(test_string)["input_ids"] for test_string in cache_test_strings]
+
+    for tokenizer in (ov_tokenizer, runtime):
+        encoding = encode_bucketed(tokenizer, cache_test_strings, batch_size=4)
+        assert [row["input_ids"].tolist() for row in encoding.rows()] == ref_token_ids
+        for batch in encoding.batches:
+            assert batch.outputs["input_ids"].shape == (len(batch.indices), batch.token_counts.max())
+
+        stats = encoding.stats
+        assert stats.num_tokens == sum(len(token_ids) for token_ids in ref_token_ids)
+        assert stats.num_tokens <= stats.padded_tokens <= stats.unbucketed_padded_tokens
+        assert 0 <= stats.saved_ratio < 1 and stats.padding_ratio <= stats.unbucketed_padding_ratio
+
+
+def test_encode_bucketed_token_count_output():
+    request = namedtuple("request", ["param"])("Xenova/gpt-4o")
+    hf_tokenizer = get_hf_tokenizer(request)
+    ov_tokenizer = core.compile_model(convert_tokenizer(hf_tokenizer, token_count_output=True))
+    ref_token_counts = [len(hf_tokenizer(test_string)["input_ids"]) for test_string in cache_test_strings]
+
+    encoding = encode_bucketed(ov_tokenizer, cache_test_strings, batch_size=4)
+    assert encoding.token_counts.tolist() == ref_token_counts
+    assert [int(row["token_count"]) for row in encoding.rows()] == ref_token_counts
+    assert encoding.stats.num_tokens == sum(ref_token_counts)
+
+    batch = encoding.batches[0]
+    with pytest.raises(ValueError, match="Cannot count the tokens"):
+        BucketedBatch(batch.indices, {"token_type_ids": np.zeros(len(batch.indices))}).token_counts
+
+
+@pytest.mark.parametrize(
+    "model_id",
+    [
+        "Xenova/gpt-4o",
+        "bert-base-uncased",
+    ],
+)
+def test_encode_stream(tmp_path, model_id):
+    request = namedtuple("request", ["param"])(model_id)
+    hf_tokenizer = get_hf_tokenizer(request)
+    ov_tokenizer = core.compile_model(convert_tokenizer(hf_tokenizer, add_special_tokens=False))
+    runtime = TokenizerRuntime(ov_tokenizer, num_requests=2)
+    text = "\r\n".join(cache_test_strings * 4)
+    text_path = tmp_path / "text.txt"
+    text_path.write_bytes(text.encode())
+    ref_token_ids = ov_tokenizer([text])["input_ids"][0].tolist()
+    assert ref_token_ids == hf_tokenizer(text, add_special_tokens=False)["input_ids"]
+
+    for chunk_size in (16, 256):
+        chunks = list(iter_text_chunks(text_path, chunk_size))
+        assert "".join(chunks) == text and len(chunks) > 1
+        for tokenizer, batch_size in ((ov_tokenizer, 1), (runtime, 3)):
+            token_ids = list(encode_stream(tokenizer, text_path, chunk_size=chunk_size, batch_size=batch_size))
+            assert len(token_ids) == len(chunks)
+            assert np.concatenate(token_ids).tolist() == ref_token_ids
+
+    with pytest.raises(ValueError):
+        list(iter_text_chunks(["a" * 100], chunk_size=16, max_chunk_size=64))
+
+
+def test_tokenization_service(tmp_path):
+    request = namedtuple("request", ["param"])("Xenova/gpt-4o")
+    hf_tokenizer = get_hf_tokenizer(request)
+    ov_tokenizer, ov_detokenizer = convert_tokenizer(hf_tokenizer, with_detokenizer=True)
+    save_model(ov_tokenizer, tmp_path / "openvino_tokenizer.xml")
+    save_model(ov_detokenizer, tmp_path / "openvino_detokenizer.xml")
+
+    def encode(test_string):
+        client = TokenizerClient(port=server.server_address[1])
+        try:
+            return client.encode(test_string)["input_ids"][0]
+        finally:
+            client.close()
+
+    server = create_server(load_runtime(tmp_path), port=0, max_batch_size=8, max_wait_ms=5)
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+    try:
+        with ThreadPoolExecutor(8) as executor:
+            token_ids = list(executor.map(encode, cache_test_strings))
+        assert token_ids == [hf_tokenizer(test_string)["input_ids"] for test_string in cache_test_strings]
+
+        client = TokenizerClient(port=server.server_address[1])
+        assert client.decode(token_ids) == hf_tokenizer.batch_decode(token_ids, skip_special_tokens=True)
+        stats = client.stats()
+        assert stats["encode_requests"] == len(cache_test_strings) and stats["decode_requests"] == 1
+        assert stats["batches"] <= len(cache_test_strings)
+        client.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+        server.batcher.close()
+
+
+@pytest.mark.parametrize("ragged_output", [False, True])
+def test_pretokenize_corpus(tmp_path, ragged_output):
+    request = namedtuple("request", ["param"])("Xenova/gpt-4o")
+    hf_tokenizer = get_hf_tokenizer(request)
+    runtime = TokenizerRuntime(convert_tokenizer(hf_tokenizer, ragged_output=ragged_output), num_requests=2)
+    inputs = [tmp_path / "first.jsonl", tmp_path / "second.jsonl"]
+    for path, texts in zip(inputs, (cache_test_strings, cache_test_strings[::-1])):
+        path.write_text("".join(json.dumps({"text": text}) + "\n" for text in texts), encoding="utf-8")
+
+    output_dir = tmp_path / "shards"
+    checkpoint = pretokenize_corpus(runtime, inputs, output_dir, batch_size=3, shard_size=100)
+    assert checkpoint.done and len(checkpoint.shards) > 1
+
+    token_ids = []
+    for shard_idx in range(len(checkpoint.shards)):
+        shard_token_ids, offsets = open_token_shard(output_dir, shard_idx)
+        token_ids.extend(shard_token_ids[begin:end].tolist() for begin, end in zip(offsets[:-1], offsets[1:]))
+    texts = cache_test_strings + cache_test_strings[::-1]
+    assert token_ids == [hf_tokenizer(text)["input_ids"] for text in texts]
+
+    # the finished run is not repeated
+    assert pretokenize_corpus(runtime, inputs, output_dir).num_tokens == checkpoint.num_tokens
+
+
+def test_bulk_convert(tmp_path):
+    for model_id in ("Xenova/gpt-4o", "sentence-transformers/all-MiniLM-L6-v2"):
+        request = namedtuple("request", ["param"])(model_id)
+        get_hf_tokenizer(request).save_pretrained(tmp_path / "models" / model_id.split("/")[-1])
+    manifest = tmp_path / "models.txt"
+    manifest.write_text(
+        "# model path      convert options\n"
+        f"{tmp_path / 'models' / 'gpt-4o'} --with-detokenizer -o gpt-4o\n"
+        "\n"
+        f"{tmp_path / 'models' / 'all-MiniLM-L6-v2'} --with-detokenizer --shared-weights -o minilm\n"
+        f"{tmp_path / 'models' / 'missing'} -o missing\n",
+        encoding="utf-8",
+    )
+    args = bulk_convert.build_parser().parse_args(
+        ["--manifest", str(manifest), "-o", str(tmp_path / "output"), "-j", "2"]
+    )
+
+    statuses = []
+    for _ in range(2):
+        # the failed entry is reported in the summary and the exit code
+        with pytest.raises(SystemExit, match="1"):
+            bulk_convert.run(args)
+        summary = json.loads((tmp_path / "output" / bulk_convert.DEFAULT_SUMMARY_FILE).read_text(encoding="utf-8"))
+        statuses.append([(Path(result["output"]).name, result["status"]) for result in summary["results"]])
+        assert summary["failed"] == 1 and "Error" in summary["results"][-1]["error"]
+
+    # the second run skips the entries converted by the first one
+    assert statuses == [
+        [("gpt-4o", "converted"), ("minilm", "converted"), ("missing", "failed")],
+        [("gpt-4o", "skipped"), ("minilm", "skipped"), ("missing", "failed")],
+    ]
+    assert (tmp_path / "output" / "gpt-4o" / "openvino_detokenizer.xml").is_file()
+    assert (tmp_path / "output" / "minilm" / f"openvino_{SHARED_WEIGHTS_MODEL_NAME}.xml").is_file()
+
+
+@pytest.mark.parametrize(
+    "model_id, tokenizer_model, pre_tokenizer, architecture",
+    [
+        ("Xenova/gpt-4o", "gpt2", "gpt-4o", "llama"),
+        ("Qwen/Qwen3-Reranker-0.6B", "gpt2", "qwen2", "llama"),
+        ("NousResearch/Llama-2-13b-hf", "llama", None, "llama"),  # merges restored from the scores
+        ("mlx-community/quantized-gemma-7b-it", "llama", None, "gemma"),  # whitespace tokens with spaces
+        ("google/flan-t5-xxl", "t5", None, "t5"),  # unigram with the precompiled charsmap
+    ],
+)
+def test_convert_gguf_tokenizer(tmp_path, model_id, tokenizer_model, pre_tokenizer, architecture):
+    request = namedtuple("request", ["param"])(model_id)
+    hf_tokenizer = get_hf_tokenizer(request)
+    save_tokenizer_to_gguf(hf_tokenizer, tmp_path / "model.gguf", tokenizer_model, pre_tokenizer, architecture)
+
+    ov_tokenizer, ov_detokenizer = convert_gguf_tokenizer(tmp_path / "model.gguf", with_detokenizer=True)
+
+    compiled_detokenizer = core.compile_model(ov_detokenizer, "CPU")
+    for test_string in cache_test_strings:
+        check_tokenizer_output((hf_tokenizer, core.compile_model(ov_tokenizer, "CPU")), test_string=test_string)
+        token_ids = hf_tokenizer(test_string, return_tensors="np").input_ids
+        ov_output = compiled_detokenizer(token_ids)["string_output"]
+        assert ov_output.tolist() == hf_tokenizer.batch_decode(token_ids, skip_special_tokens=True)
+
+
+def test_convert_gguf_tokenizer_added_tokens(tmp_path):
+    request = namedtuple("request", ["param"])("Xenova/gpt-4o")
+    hf_tokenizer = get_hf_tokenizer(request)
+    hf_tokenizer.add_tokens(["<custom token>", "ключ"])
+    hf_tokenizer.add_tokens(["<|special token|>"], special_tokens=True)
+    save_tokenizer_to_gguf(hf_tokenizer, tmp_path / "model.gguf", "gpt2", "gpt-4o")
+
+    # the added tokens outside of the byte-level alphabet keep their content
+    tokenizer_json, _ = gguf_to_tokenizer_json(read_gguf_tokenizer_metadata(tmp_path / "model.gguf"))
+    added_tokens = {added_token["content"]: added_token["special"] for added_token in tokenizer_json["added_tokens"]}
+    assert {"<custom token>": False, "ключ": False, "<|special token|>": True}.items() <= added_tokens.items()
+
+    ov_tokenizer, ov_detokenizer = convert_gguf_tokenizer(tmp_path / "model.gguf", with_detokenizer=True)
+    compiled_detokenizer = core.compile_model(ov_detokenizer, "CPU")
+    for test_string in ["a <custom token> b", "ключ ключи", "<|special token|>text<custom token>"]:
+        check_tokenizer_output((hf_tokenizer, core.compile_model(ov_tokenizer, "CPU")), test_string=test_string)
+        token_ids = hf_tokenizer(test_string, return_tensors="np").input_ids
+        ov_output = compiled_detokenizer(token_ids)["string_output"]
+        assert ov_output.tolist() == hf_tokenizer.batch_decode(token_ids, skip_special_tokens=True)
+
+
+def reference_bpe(mergeable_ranks: dict[bytes, int], token: bytes, max_rank: Optional[int] = None) -> list[bytes]:
+    # the merge replay before the incremental update of the pair ranks
+    parts = [bytes([byte]) for byte in token]
+    while True:
+        min_idx = None
+        min_rank = None
+        for idx, (left, right) in enumerate(zip(parts[:-1], parts[1:])):
+            rank = mergeable_ranks.get(left + right)
+            if rank is not None and (min_rank is None or rank < min_rank):
+                min_idx = idx
+                min_rank = rank
+        if min_rank is None or (max_rank is not None and min_rank >= max_rank):
+            break
+        parts = parts[:min_idx] + [parts[min_idx] + parts[min_idx + 1]] + parts[min_idx + 2 :]
+    return parts
+
+
+@pytest.mark.parametrize("shuffle_ranks", [False, True])
+def test_tiktoken_vocab_and_merges(shuffle_ranks):
+    tiktoken = pytest.importorskip("tiktoken")
+    from openvino_tokenizers.tiktoken_parser import bpe, generate_vocab_and_merges
+
+    merged_tokens = [
+        b"lo", b"low", b"er", b"lower", b"ne", b"new", b"newer", b"es", b"est", b"lowest", b" l", b" low",
+        b"aa", b"aaaa", b"aaa", b"\t\t", b"\t\t\t", b"\t\t\t\t", b"wi", b"wid", b"wider",
+    ]  # fmt: skip
+    if shuffle_ranks:
+        # the tokens ranked before their parts are not reachable by the merges and become the added tokens
+        merged_tokens = merged_tokens[::-1]
+    mergeable_ranks = {bytes([byte]): byte for byte in range(256)}
+    mergeable_ranks.update({token: 256 + idx for idx, token in enumerate(merged_tokens)})
+    encoding = tiktoken.Encoding(
+        name="test_encoding",
+        pat_str=r"\s?\w+|\s+",
+        mergeable_ranks=mergeable_ranks,
+        special_tokens={"<|endoftext|>": len(mergeable_ranks)},
+    )
+
+    ref_merges = []
+    ref_added_tokens = {}
+    for token, rank in mergeable_ranks.items():
+        assert bpe(mergeable_ranks, token) == reference_bpe(mergeable_ranks, token)
+        if len(token) == 1:
+            continue
+        merged = reference_bpe(mergeable_ranks, token, max_rank=rank)
+        assert bpe(mergeable_ranks, token, max_rank=rank) == merged
+        if len(merged) == 2:
+            ref_merges.append(tuple(merged))
+        else:
+            ref_added_tokens[token] = rank
+    assert bool(ref_added_tokens) == shuffle_ranks
+
+    vocab, merges, added_tokens = generate_vocab_and_merges(encoding)
+    assert vocab == {**mergeable_ranks, b"<|endoftext|>": len(mergeable_ranks)}
+    assert merges == ref_merges
+    assert added_tokens == ref_added_tokens
+    for text in [b"lower newer lowest", b"aaaaaaa", b"\t\t\t\t\t wider"]:
+        assert bpe(mergeable_ranks, text) == reference_bpe(mergeable_ranks, text)
+
+
 models_with_pair_input = [
     "answerdotai/ModernBERT-base",
     "amberoad/bert-multilingual-passage-reranking-msmarco",
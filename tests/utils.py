@@ -1,3 +1,7 @@
+import json
+import struct
+from typing import Optional
+
 import numpy as np
 import requests
 from huggingface_hub import snapshot_download
@@ -128,3 +132,105 @@ def get_hf_tokenizer(request, fast_tokenizer=True, trust_remote_code=False, left
         except requests.ReadTimeout:
             if retry == MAX_RETRY:
                 raise
+
+
+def _gguf_string(value: str) -> bytes:
+    value = value.encode()
+    return struct.pack("<Q", len(value)) + value
+
+
+def _gguf_array(element_type: int, values: list) -> bytes:
+    if element_type == 8:
+        return struct.pack("<IQ", element_type, len(values)) + b"".join(map(_gguf_string, values))
+    dtype = {0: np.uint8, 5: np.int32, 6: np.float32}[element_type]
+    return struct.pack("<IQ", element_type, len(values)) + np.asarray(values, dtype=dtype).tobytes()
+
+
+def _get_byte_level_vocab(hf_tokenizer) -> tuple[list[str], list[int]]:
+    vocab = hf_tokenizer.get_vocab()
+    tokens = [f"[PAD{idx}]" for idx in range(max(vocab.values()) + 1)]
+    for token, idx in vocab.items():
+        tokens[idx] = token
+
+    token_types = [1] * len(tokens)  # NORMAL
+    for idx, added_token in hf_tokenizer.added_tokens_decoder.items():
+        token_types[idx] = 3 if added_token.special else 4  # CONTROL or USER_DEFINED
+    return tokens, token_types
+
+
+def _get_sentencepiece_vocab(hf_tokenizer, tokenizer_model: str):
+    """Reads the vocab from the SentencePiece model the same way as `_set_vocab_sentencepiece` of llama.cpp."""
+    from openvino_tokenizers.hf_parser import get_sentencepiece_model_proto
+    from transformers.convert_slow_tokenizer import import_protobuf
+
+    model = import_protobuf().ModelProto()
+    model.ParseFromString(get_sentencepiece_model_proto(hf_tokenizer))
+    tokens = [piece.piece for piece in model.pieces]
+    scores = [piece.score for piece in model.pieces]
+    # SentencePiece piece types have the same values as the GGUF token types
+    token_types = [piece.type for piece in model.pieces]
+
+    for idx in range(len(tokens), len(hf_tokenizer)):
+        added_token = hf_tokenizer.added_tokens_decoder.get(idx)
+        if tokenizer_model == "t5" or added_token is None:
+            # the ids without the added_tokens.json entry, such as T5 sentinel tokens, are padded
+            tokens.append(f"[PAD{idx}]")
+            token_types.append(5)  # UNUSED
+        else:
+            tokens.append(added_token.content)
+            token_types.append(3 if added_token.special else 4)  # CONTROL or USER_DEFINED
+        scores.append(-1000.0)
+    return tokens, scores, token_types, model.normalizer_spec
+
+
+def save_tokenizer_to_gguf(
+    hf_tokenizer, path, tokenizer_model: str, pre_tokenizer: Optional[str] = None, architecture: str = "llama"
+) -> None:
+    """Writes the tokenizer metadata of a fast tokenizer in the GGUF format, the same way llama.cpp does."""
+    metadata = [
+        ("general.architecture", 8, _gguf_string(architecture)),
+        ("tokenizer.ggml.model", 8, _gguf_string(tokenizer_model)),
+    ]
+    if tokenizer_model == "gpt2":
+        tokens, token_types = _get_byte_level_vocab(hf_tokenizer)
+        tokenizer_json = json.loads(hf_tokenizer.backend_tokenizer.to_str())
+        merges = [merge if isinstance(merge, str) else " ".join(merge) for merge in tokenizer_json["model"]["merges"]]
+        metadata.append(("tokenizer.ggml.merges", 9, _gguf_array(8, merges)))
+    else:
+        # SentencePiece models are stored without merges, with the scores of the pieces
+        tokens, scores, token_types, normalizer_spec = _get_sentencepiece_vocab(hf_tokenizer, tokenizer_model)
+        if architecture.startswith("gemma"):
+            # Gemma stores the whitespace tokens with the spaces
+            tokens = [token.replace("▁", " ") if token and not token.strip("▁") else token for token in tokens]
+        metadata.append(("tokenizer.ggml.scores", 9, _gguf_array(6, scores)))
+        metadata.append(("tokenizer.ggml.add_space_prefix", 7, struct.pack("<?", normalizer_spec.add_dummy_prefix)))
+        if tokenizer_model == "t5":
+            charsmap = list(normalizer_spec.precompiled_charsmap)
+            metadata.append(("tokenizer.ggml.precompiled_charsmap", 9, _gguf_array(0, charsmap)))
+
+    empty_ids = hf_tokenizer("").input_ids
+    add_bos_token = hf_tokenizer.bos_token_id is not None and hf_tokenizer.bos_token_id in empty_ids
+    add_eos_token = hf_tokenizer.eos_token_id is not None and hf_tokenizer.eos_token_id in empty_ids
+    metadata += [
+        ("tokenizer.ggml.tokens", 9, _gguf_array(8, tokens)),
+        ("tokenizer.ggml.token_type", 9, _gguf_array(5, token_types)),
+        ("tokenizer.ggml.add_bos_token", 7, struct.pack("<?", add_bos_token)),
+        ("tokenizer.ggml.add_eos_token", 7, struct.pack("<?", add_eos_token)),
+    ]
+    if pre_tokenizer is not None:
+        metadata.append(("tokenizer.ggml.pre", 8, _gguf_string(pre_tokenizer)))
+    special_token_ids = [
+        ("bos_token_id", hf_tokenizer.bos_token_id),
+        ("eos_token_id", hf_tokenizer.eos_token_id),
+        ("padding_token_id", hf_tokenizer.pad_token_id),
+    ]
+    if tokenizer_model != "gpt2":
+        special_token_ids.append(("unknown_token_id", hf_tokenizer.unk_token_id))
+    for key, token_id in special_token_ids:
+        if token_id is not None:
+            metadata.append((f"tokenizer.ggml.{key}", 4, struct.pack("<I", token_id)))
+
+    with open(path, "wb") as f:
+        f.write(b"GGUF" + struct.pack("<IQQ", 3, 0, len(metadata)))
+        for key, value_type, value in metadata:
+            f.write(_gguf_string(key) + struct.pack("<I", value_type) + value)